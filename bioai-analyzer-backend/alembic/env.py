@@ -12,7 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 # Import database and models
 from app.database import Base
-from app.models import User, Analysis
+from app.models import User, Analysis, ReferenceSequence, StoredSequence
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
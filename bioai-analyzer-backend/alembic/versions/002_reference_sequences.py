@@ -0,0 +1,43 @@
+"""Add reference_sequences table for the on-disk sequence store
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create reference_sequences table."""
+    op.create_table(
+        'reference_sequences',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('filename', sa.String(length=255), nullable=False),
+        sa.Column('storage_key', sa.String(length=32), nullable=False),
+        sa.Column('record_count', sa.Integer(), nullable=False),
+        sa.Column('total_length', sa.BigInteger(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('storage_key')
+    )
+    op.create_index(op.f('ix_reference_sequences_id'), 'reference_sequences', ['id'], unique=False)
+    op.create_index(op.f('ix_reference_sequences_user_id'), 'reference_sequences', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop reference_sequences table."""
+    op.drop_index(op.f('ix_reference_sequences_user_id'), table_name='reference_sequences')
+    op.drop_index(op.f('ix_reference_sequences_id'), table_name='reference_sequences')
+    op.drop_table('reference_sequences')
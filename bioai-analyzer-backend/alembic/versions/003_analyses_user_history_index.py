@@ -0,0 +1,32 @@
+"""Add composite (user_id, created_at, id) index for history keyset pagination
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the per-user history index."""
+    op.create_index(
+        'ix_analyses_user_created_id',
+        'analyses',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop the per-user history index."""
+    op.drop_index('ix_analyses_user_created_id', table_name='analyses')
@@ -0,0 +1,152 @@
+"""Move analysis input sequences into a deduplicated, compressed sequences table
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+import hashlib
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Analyses converted per batch, so large tables are never loaded at once
+BATCH_SIZE = 1000
+
+# Must match app.utils.sequence_codec at the time of this revision
+PREVIEW_LENGTH = 20
+COMPRESSION_LEVEL = 6
+
+sequences = sa.table(
+    'sequences',
+    sa.column('digest', sa.String),
+    sa.column('length', sa.Integer),
+    sa.column('preview', sa.String),
+    sa.column('encoding', sa.String),
+    sa.column('data', sa.LargeBinary),
+    sa.column('created_at', sa.DateTime),
+)
+
+analyses = sa.table(
+    'analyses',
+    sa.column('id', sa.Integer),
+    sa.column('input_sequence', sa.Text),
+    sa.column('sequence_digest', sa.String),
+    sa.column('created_at', sa.DateTime),
+)
+
+
+def upgrade() -> None:
+    """Create sequences table and convert existing analyses in batches."""
+    op.create_table(
+        'sequences',
+        sa.Column('digest', sa.String(length=64), nullable=False),
+        sa.Column('length', sa.Integer(), nullable=False),
+        sa.Column('preview', sa.String(length=PREVIEW_LENGTH), nullable=False),
+        sa.Column('encoding', sa.String(length=10), nullable=False),
+        sa.Column('data', sa.LargeBinary(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('digest')
+    )
+    with op.batch_alter_table('analyses') as batch_op:
+        batch_op.add_column(sa.Column('sequence_digest', sa.String(length=64), nullable=True))
+        batch_op.alter_column('input_sequence', existing_type=sa.Text(), nullable=True)
+        batch_op.create_foreign_key(
+            'fk_analyses_sequence_digest', 'sequences', ['sequence_digest'], ['digest']
+        )
+        batch_op.create_index('ix_analyses_sequence_digest', ['sequence_digest'], unique=False)
+
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(analyses.c.id, analyses.c.input_sequence, analyses.c.created_at)
+            .where(analyses.c.id > last_id)
+            .where(analyses.c.sequence_digest.is_(None))
+            .where(analyses.c.input_sequence.isnot(None))
+            .order_by(analyses.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+
+        digests = {}
+        for row in rows:
+            digests.setdefault(
+                hashlib.sha256(row.input_sequence.encode('utf-8')).hexdigest(),
+                row
+            )
+        existing = {
+            digest for (digest,) in connection.execute(
+                sa.select(sequences.c.digest).where(sequences.c.digest.in_(list(digests)))
+            )
+        }
+        new_rows = [
+            {
+                'digest': digest,
+                'length': len(row.input_sequence),
+                'preview': row.input_sequence[:PREVIEW_LENGTH],
+                'encoding': 'zlib',
+                'data': zlib.compress(row.input_sequence.encode('utf-8'), COMPRESSION_LEVEL),
+                'created_at': row.created_at,
+            }
+            for digest, row in digests.items()
+            if digest not in existing
+        ]
+        if new_rows:
+            connection.execute(sequences.insert(), new_rows)
+
+        connection.execute(
+            analyses.update()
+            .where(analyses.c.id == sa.bindparam('row_id'))
+            .values(sequence_digest=sa.bindparam('digest'), input_sequence=None),
+            [
+                {
+                    'row_id': row.id,
+                    'digest': hashlib.sha256(row.input_sequence.encode('utf-8')).hexdigest(),
+                }
+                for row in rows
+            ]
+        )
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    """Restore input sequences into analyses and drop sequences table."""
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(analyses.c.id, sequences.c.encoding, sequences.c.data)
+            .join(sequences, analyses.c.sequence_digest == sequences.c.digest)
+            .where(analyses.c.id > last_id)
+            .order_by(analyses.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            analyses.update()
+            .where(analyses.c.id == sa.bindparam('row_id'))
+            .values(input_sequence=sa.bindparam('sequence')),
+            [
+                {'row_id': row.id, 'sequence': zlib.decompress(row.data).decode('utf-8')}
+                for row in rows
+            ]
+        )
+        last_id = rows[-1].id
+
+    with op.batch_alter_table('analyses') as batch_op:
+        batch_op.drop_index('ix_analyses_sequence_digest')
+        batch_op.drop_constraint('fk_analyses_sequence_digest', type_='foreignkey')
+        batch_op.drop_column('sequence_digest')
+        batch_op.alter_column('input_sequence', existing_type=sa.Text(), nullable=False)
+    op.drop_table('sequences')
@@ -0,0 +1,111 @@
+"""Store analysis results as versioned MessagePack blobs
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import msgpack
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Analyses converted per batch, so large tables are never loaded at once
+BATCH_SIZE = 1000
+
+# Must match app.utils.results_codec format version 1
+FORMAT_VERSION = 1
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+
+analyses = sa.table(
+    'analyses',
+    sa.column('id', sa.Integer),
+    sa.column('results', sa.JSON),
+    sa.column('results_data', sa.LargeBinary),
+)
+
+
+def _encode(results) -> bytes:
+    """Encode results in format version 1."""
+    packed = msgpack.packb(results, use_bin_type=True)
+    compressed = zlib.compress(packed, 6)
+    if len(compressed) < len(packed):
+        return bytes((FORMAT_VERSION, COMPRESSION_ZLIB)) + compressed
+    return bytes((FORMAT_VERSION, COMPRESSION_NONE)) + packed
+
+
+def _decode(blob: bytes):
+    """Decode results stored in format version 1."""
+    payload = blob[2:]
+    if blob[1] == COMPRESSION_ZLIB:
+        payload = zlib.decompress(payload)
+    return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+
+
+def upgrade() -> None:
+    """Add results_data column and convert JSON results in batches."""
+    with op.batch_alter_table('analyses') as batch_op:
+        batch_op.add_column(sa.Column('results_data', sa.LargeBinary(), nullable=True))
+        batch_op.alter_column('results', existing_type=sa.JSON(), nullable=True)
+
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(analyses.c.id, analyses.c.results)
+            .where(analyses.c.id > last_id)
+            .where(analyses.c.results_data.is_(None))
+            .order_by(analyses.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        params = [
+            {'row_id': row.id, 'blob': _encode(row.results)}
+            for row in rows
+            if row.results is not None
+        ]
+        if params:
+            connection.execute(
+                analyses.update()
+                .where(analyses.c.id == sa.bindparam('row_id'))
+                .values(results_data=sa.bindparam('blob'), results=None),
+                params
+            )
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    """Restore JSON results and drop results_data column."""
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(analyses.c.id, analyses.c.results_data)
+            .where(analyses.c.id > last_id)
+            .where(analyses.c.results_data.isnot(None))
+            .order_by(analyses.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            analyses.update()
+            .where(analyses.c.id == sa.bindparam('row_id'))
+            .values(results=sa.bindparam('document')),
+            [{'row_id': row.id, 'document': _decode(row.results_data)} for row in rows]
+        )
+        last_id = rows[-1].id
+
+    with op.batch_alter_table('analyses') as batch_op:
+        batch_op.drop_column('results_data')
+        batch_op.alter_column('results', existing_type=sa.JSON(), nullable=False)
@@ -0,0 +1,110 @@
+"""Promote key result metrics to typed, indexed columns on analyses
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import msgpack
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Analyses backfilled per batch, so large tables are never loaded at once
+BATCH_SIZE = 1000
+
+METRIC_COLUMNS = (
+    ('sequence_length', sa.Integer()),
+    ('gc_content', sa.Float()),
+    ('orf_count', sa.Integer()),
+    ('molecular_weight', sa.Float()),
+    ('isoelectric_point', sa.Float()),
+)
+
+analyses = sa.table(
+    'analyses',
+    sa.column('id', sa.Integer),
+    sa.column('results', sa.JSON),
+    sa.column('results_data', sa.LargeBinary),
+    *(sa.column(name, type_) for name, type_ in METRIC_COLUMNS),
+)
+
+
+def _decode(blob: bytes):
+    """Decode results stored in format version 1."""
+    payload = blob[2:]
+    if blob[1] == 1:
+        payload = zlib.decompress(payload)
+    return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+
+
+def _metrics(results) -> dict:
+    """Extract metric values, as app.crud.analysis.result_metrics does."""
+    def number(key):
+        try:
+            return float(results[key])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    orfs = results.get('orfs')
+    length = results.get('sequence_length')
+    return {
+        'sequence_length': length if isinstance(length, int) else None,
+        'gc_content': number('gc_content'),
+        'orf_count': len(orfs) if isinstance(orfs, list) else None,
+        'molecular_weight': number('molecular_weight'),
+        'isoelectric_point': number('isoelectric_point'),
+    }
+
+
+def upgrade() -> None:
+    """Add metric columns and indexes, and backfill them in batches."""
+    with op.batch_alter_table('analyses') as batch_op:
+        for name, type_ in METRIC_COLUMNS:
+            batch_op.add_column(sa.Column(name, type_, nullable=True))
+
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(analyses.c.id, analyses.c.results, analyses.c.results_data)
+            .where(analyses.c.id > last_id)
+            .order_by(analyses.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        params = []
+        for row in rows:
+            results = _decode(row.results_data) if row.results_data is not None else row.results
+            if results:
+                params.append({'row_id': row.id, **{f'new_{k}': v for k, v in _metrics(results).items()}})
+        if params:
+            connection.execute(
+                analyses.update()
+                .where(analyses.c.id == sa.bindparam('row_id'))
+                .values({name: sa.bindparam(f'new_{name}') for name, _ in METRIC_COLUMNS}),
+                params
+            )
+        last_id = rows[-1].id
+
+    # Created after the backfill so it is not maintained row by row
+    op.create_index('ix_analyses_user_gc_content', 'analyses', ['user_id', 'gc_content'], unique=False)
+    op.create_index('ix_analyses_user_sequence_length', 'analyses', ['user_id', 'sequence_length'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop metric indexes and columns."""
+    op.drop_index('ix_analyses_user_sequence_length', table_name='analyses')
+    op.drop_index('ix_analyses_user_gc_content', table_name='analyses')
+    with op.batch_alter_table('analyses') as batch_op:
+        for name, _ in reversed(METRIC_COLUMNS):
+            batch_op.drop_column(name)
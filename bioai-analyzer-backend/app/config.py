@@ -14,11 +14,24 @@ class Settings(BaseSettings):
     
     # Database Configuration
     DATABASE_URL: str
+    SQLITE_PRODUCTION_MODE: bool = False  # WAL, tuned pragmas, single writer and read pool for SQLite files
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_CACHE_SIZE: int = -65536  # Negative = KiB, 64MB per connection
+    SQLITE_MMAP_SIZE: int = 268435456  # 256MB
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_READ_POOL_SIZE: int = 8
+    SQLITE_WRITE_TIMEOUT_SECONDS: int = 30  # Wait for the writer connection before failing
     
     # Security Settings
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_HOURS: int = 24
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 10000
+    TOKEN_CACHE_MAX_SIZE: int = 10000
     
     # Application Settings
     APP_NAME: str = "BioAI Analyzer Backend"
@@ -26,6 +39,26 @@ class Settings(BaseSettings):
     
     # File Upload Settings
     MAX_FILE_SIZE: int = 10485760  # 10MB in bytes
+    MAX_DECOMPRESSED_SIZE: int = 104857600  # 100MB limit after decompressing .gz/.bz2/.xz
+    MMAP_THRESHOLD: int = 1048576  # Memory-map file-backed FASTA uploads from 1MB up
+    SEQUENCE_STORE_DIR: str = "data/sequences"  # Indexed reference FASTA files
+    REFERENCE_MAX_SIZE: int = 1073741824  # Largest stored reference file (1GB)
+    SEQUENCE_INDEX_CACHE_SIZE: int = 256  # Parsed .fai indexes cached for region queries
+    UPLOAD_SESSION_DIR: str = "data/uploads"  # Staging area for resumable uploads
+    UPLOAD_CHUNK_SIZE: int = 8388608  # Default resumable upload chunk size (8MB)
+    UPLOAD_MAX_CHUNK_SIZE: int = 33554432  # Largest chunk size a client may choose (32MB)
+    RESUMABLE_MAX_SIZE: int = 1073741824  # Largest file a resumable upload may carry (1GB)
+    UPLOAD_SESSION_TTL_SECONDS: int = 86400  # Abandoned upload sessions are removed after a day
+    
+    # Analysis Settings
+    ANALYSIS_WORKERS: int = 0  # Worker processes for multi-record uploads (0 = CPU count)
+    UPLOAD_PERSIST_BATCH_ROWS: int = 500  # Multi-record upload analyses saved per transaction
+    UPLOAD_PERSIST_BATCH_BYTES: int = 16777216  # Sequence bytes saved per transaction (16MB)
+    HISTORY_WRITE_BEHIND: bool = False  # Return /analyze results before the history row is written
+    HISTORY_QUEUE_SIZE: int = 10000  # History rows waiting to be written before requests write inline
+    HISTORY_BATCH_SIZE: int = 500  # History rows inserted per transaction
+    HISTORY_FLUSH_RETRIES: int = 3  # Retries of a failed history batch before writing it row by row
+    HISTORY_RETRY_BACKOFF_SECONDS: float = 0.5  # First retry delay, doubled per retry
     
     # CORS Settings
     ALLOWED_ORIGINS: str = "https://bioai.nighan2labs.in,http://localhost:5173"
@@ -1,22 +1,76 @@
 """
 CRUD operations module.
 """
-from app.crud.user import get_user_by_email, get_user_by_id, create_user
+from app.crud.user import (
+    get_user_by_email,
+    get_user_by_email_async,
+    get_user_by_id,
+    get_user_by_id_async,
+    create_user,
+    create_user_async,
+    update_user,
+    update_user_async,
+    delete_user
+)
 from app.crud.analysis import (
     create_analysis,
+    create_analysis_async,
+    create_analyses,
+    create_history_entries_async,
     get_user_analyses,
+    get_user_analysis_summaries,
+    get_user_analysis_summaries_async,
     get_analysis_by_id,
-    delete_analysis
+    get_analysis_by_id_async,
+    result_metrics,
+    delete_analysis,
+    delete_analysis_async
+)
+from app.crud.sequence import (
+    delete_unreferenced_sequences,
+    delete_unreferenced_sequences_async,
+    store_sequences,
+    store_sequences_async
+)
+from app.crud.reference import (
+    create_reference,
+    get_user_references,
+    get_reference_by_id,
+    delete_reference
 )
 
 __all__ = [
     # User CRUD
     "get_user_by_email",
+    "get_user_by_email_async",
     "get_user_by_id",
+    "get_user_by_id_async",
     "create_user",
+    "create_user_async",
+    "update_user",
+    "update_user_async",
+    "delete_user",
     # Analysis CRUD
     "create_analysis",
+    "create_analysis_async",
+    "create_analyses",
+    "create_history_entries_async",
     "get_user_analyses",
+    "get_user_analysis_summaries",
+    "get_user_analysis_summaries_async",
+    "result_metrics",
     "get_analysis_by_id",
+    "get_analysis_by_id_async",
     "delete_analysis",
+    "delete_analysis_async",
+    # Stored sequence CRUD
+    "store_sequences",
+    "store_sequences_async",
+    "delete_unreferenced_sequences",
+    "delete_unreferenced_sequences_async",
+    # Reference sequence CRUD
+    "create_reference",
+    "get_user_references",
+    "get_reference_by_id",
+    "delete_reference",
 ]
@@ -1,10 +1,53 @@
 """
 Analysis CRUD operations.
 """
-from sqlalchemy.orm import Session
-from typing import List
+import csv
+import io
+from datetime import datetime
+from sqlalchemy import Select, delete, func, insert, select, text, tuple_
+from sqlalchemy.engine import Result
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from app.crud.sequence import (
+    delete_unreferenced_sequences,
+    delete_unreferenced_sequences_async,
+    store_sequences,
+    store_sequences_async
+)
 from app.models.analysis import Analysis
+from app.models.sequence import StoredSequence
 from app.schemas.analysis import AnalysisRequest
+from app.utils.results_codec import encode_results
+from app.utils.sequence_codec import SEQUENCE_PREVIEW_LENGTH
+
+
+def result_metrics(results: dict) -> Dict[str, Any]:
+    """
+    Extract the typed metric columns of an analysis from its results.
+    
+    Args:
+        results: Analysis results as dictionary
+        
+    Returns:
+        Dict of sequence_length, gc_content, orf_count, molecular_weight and
+        isoelectric_point; metrics a result type lacks are None
+    """
+    def number(key: str) -> Optional[float]:
+        try:
+            return float(results[key])
+        except (KeyError, TypeError, ValueError):
+            return None
+    
+    orfs = results.get("orfs")
+    length = results.get("sequence_length")
+    return {
+        "sequence_length": length if isinstance(length, int) else None,
+        "gc_content": number("gc_content"),
+        "orf_count": len(orfs) if isinstance(orfs, list) else None,
+        "molecular_weight": number("molecular_weight"),
+        "isoelectric_point": number("isoelectric_point")
+    }
 
 
 def create_analysis(
@@ -16,6 +59,9 @@ def create_analysis(
     """
     Create a new analysis record.
     
+    The input sequence is stored once in the sequences table and referenced
+    by digest, and key metrics are copied into typed columns.
+    
     Args:
         db: Database session
         user_id: ID of the user who performed the analysis
@@ -25,43 +71,356 @@ def create_analysis(
     Returns:
         Created Analysis object
     """
-    db_analysis = Analysis(
-        user_id=user_id,
-        sequence_type=request.sequence_type,
-        input_sequence=request.sequence,
-        results=results
-    )
+    digest, = store_sequences(db, [request.sequence])
+    db_analysis = _new_analysis(user_id, request.sequence_type, digest, results)
     db.add(db_analysis)
     db.commit()
     db.refresh(db_analysis)
     return db_analysis
 
 
+async def create_analysis_async(
+    db: AsyncSession,
+    user_id: int,
+    request: AnalysisRequest,
+    results: dict
+) -> Analysis:
+    """
+    Create a new analysis record without blocking the event loop.
+    
+    Args:
+        db: Async database session
+        user_id: ID of the user who performed the analysis
+        request: Analysis request data (sequence, sequence_type)
+        results: Analysis results as dictionary
+        
+    Returns:
+        Created Analysis object
+    """
+    digest, = await store_sequences_async(db, [request.sequence])
+    db_analysis = _new_analysis(user_id, request.sequence_type, digest, results)
+    db.add(db_analysis)
+    await db.commit()
+    return db_analysis
+
+
+def _new_analysis(user_id: int, sequence_type: str, digest: str, results: dict) -> Analysis:
+    """Build an Analysis row with encoded results and metric columns."""
+    return Analysis(**_analysis_values(user_id, sequence_type, digest, results))
+
+
+def _analysis_values(user_id: int, sequence_type: str, digest: str, results: dict) -> Dict[str, Any]:
+    """Column values of an analysis row with encoded results and metric columns."""
+    return {
+        "user_id": user_id,
+        "sequence_type": sequence_type,
+        "sequence_digest": digest,
+        "results_data": encode_results(results),
+        **result_metrics(results)
+    }
+
+
+def create_analyses(
+    db: Session,
+    user_id: int,
+    entries: Iterable[Tuple[str, str, dict]]
+) -> List[int]:
+    """
+    Create many analysis records in a single transaction.
+    
+    Rows are written without building ORM objects. On PostgreSQL (psycopg2)
+    they are loaded with COPY, into ids reserved from the id sequence in one
+    query; on SQLite they are inserted with a single executemany; elsewhere
+    they are sent as batched INSERT ... RETURNING statements. All records
+    share one created_at timestamp.
+    
+    Args:
+        db: Database session
+        user_id: ID of the user who performed the analyses
+        entries: Iterable of (sequence_type, input_sequence, results) tuples
+        
+    Returns:
+        IDs of the created records, in entry order
+    """
+    entries = list(entries)
+    if not entries:
+        return []
+    
+    digests = store_sequences(db, [input_sequence for _, input_sequence, _ in entries])
+    created_at = datetime.utcnow()
+    rows = [
+        {**_analysis_values(user_id, sequence_type, digest, results), "created_at": created_at}
+        for (sequence_type, _, results), digest in zip(entries, digests)
+    ]
+    
+    bind = db.get_bind()
+    if bind.dialect.name == "postgresql" and bind.dialect.driver == "psycopg2":
+        ids = _copy_analyses(db, rows)
+    elif bind.dialect.name == "sqlite":
+        # Without RETURNING the rows go through one executemany. The write
+        # lock is held to commit, so the new rowids are consecutive.
+        db.execute(insert(Analysis), rows)
+        last_id = db.scalar(text("SELECT last_insert_rowid()"))
+        ids = list(range(last_id - len(rows) + 1, last_id + 1))
+    else:
+        ids = list(db.scalars(
+            insert(Analysis).returning(Analysis.id, sort_by_parameter_order=True),
+            rows
+        ))
+    db.commit()
+    return ids
+
+
+def _copy_analyses(db: Session, rows: List[Dict[str, Any]]) -> List[int]:
+    """
+    Load analysis rows with PostgreSQL COPY.
+    
+    COPY cannot return generated keys, so ids are reserved from the table's
+    sequence first and loaded with the rows.
+    
+    Args:
+        db: Database session on a psycopg2 connection
+        rows: Column values of each row, all with the same keys
+        
+    Returns:
+        IDs of the loaded rows, in row order
+    """
+    ids = list(db.scalars(
+        text("SELECT nextval(pg_get_serial_sequence('analyses', 'id')) FROM generate_series(1, :count)"),
+        {"count": len(rows)}
+    ))
+    columns = list(rows[0])
+    
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row_id, row in zip(ids, rows):
+        writer.writerow([row_id, *(_copy_value(row[column]) for column in columns)])
+    buffer.seek(0)
+    
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY analyses (id, {', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+            buffer
+        )
+    finally:
+        cursor.close()
+    return ids
+
+
+def _copy_value(value: Any) -> Any:
+    """Format a column value for COPY CSV input; None becomes NULL."""
+    if isinstance(value, bytes):
+        return "\\x" + value.hex()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+async def create_history_entries_async(
+    db: AsyncSession,
+    entries: Iterable[Tuple[int, str, str, dict, datetime]]
+) -> int:
+    """
+    Insert analysis records of any users in one multi-row INSERT.
+    
+    Used by the write-behind history writer. No ORM objects are built and
+    no ids are fetched back, so the insert is sent as batched multi-row
+    VALUES statements.
+    
+    Args:
+        db: Async database session
+        entries: Iterable of (user_id, sequence_type, input_sequence, results,
+            created_at) tuples
+        
+    Returns:
+        Number of records created
+    """
+    entries = list(entries)
+    if not entries:
+        return 0
+    digests = await store_sequences_async(db, [input_sequence for _, _, input_sequence, _, _ in entries])
+    await db.execute(insert(Analysis), [
+        {**_analysis_values(user_id, sequence_type, digest, results), "created_at": created_at}
+        for (user_id, sequence_type, _, results, created_at), digest in zip(entries, digests)
+    ])
+    await db.commit()
+    return len(entries)
+
+
 def get_user_analyses(
     db: Session,
     user_id: int,
     limit: int = 100,
-    offset: int = 0
+    offset: int = 0,
+    after: Optional[Tuple[datetime, int]] = None
 ) -> List[Analysis]:
     """
     Retrieve analysis history for a user with pagination.
     
+    Pages are ordered by (created_at, id) descending, which the
+    (user_id, created_at DESC, id DESC) index serves directly. Passing the
+    key of the previous page's last row as ``after`` seeks past it in that
+    index, so every page costs the same regardless of its depth.
+    
     Args:
         db: Database session
         user_id: ID of the user
         limit: Maximum number of records to return (default: 100)
         offset: Number of records to skip (default: 0)
+        after: (created_at, id) of the last record already returned, or None
         
     Returns:
         List of Analysis objects ordered by created_at descending
     """
+    return list(db.scalars(_history_page(select(Analysis), user_id, limit, offset, after)))
+
+
+def get_user_analysis_summaries(
+    db: Session,
+    user_id: int,
+    limit: int = 100,
+    offset: int = 0,
+    after: Optional[Tuple[datetime, int]] = None,
+    sequence_type: Optional[str] = None,
+    min_gc_content: Optional[float] = None,
+    max_gc_content: Optional[float] = None,
+    min_length: Optional[int] = None,
+    max_length: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Retrieve the summary columns of a user's analysis history.
+    
+    Only the columns shown in list views are selected: the length and GC
+    content come from the typed metric columns and the preview from the
+    sequences table, so no sequence or results blob is decoded and no rows
+    are hydrated into Analysis objects. Rows predating those columns fall
+    back to the legacy text and JSON columns.
+    
+    Args:
+        db: Database session
+        user_id: ID of the user
+        limit: Maximum number of records to return (default: 100)
+        offset: Number of records to skip (default: 0)
+        after: (created_at, id) of the last record already returned, or None
+        sequence_type: Only return analyses of this type, or None
+        min_gc_content: Minimum GC content in percent, or None
+        max_gc_content: Maximum GC content in percent, or None
+        min_length: Minimum sequence length, or None
+        max_length: Maximum sequence length, or None
+        
+    Returns:
+        List of dicts with id, sequence_type, sequence_length, gc_content,
+        sequence_preview and created_at, ordered by created_at descending
+    """
+    statement = _summaries_statement(
+        user_id, limit, offset, after,
+        sequence_type, min_gc_content, max_gc_content, min_length, max_length
+    )
+    return _summary_dicts(db.execute(statement))
+
+
+async def get_user_analysis_summaries_async(
+    db: AsyncSession,
+    user_id: int,
+    limit: int = 100,
+    offset: int = 0,
+    after: Optional[Tuple[datetime, int]] = None,
+    sequence_type: Optional[str] = None,
+    min_gc_content: Optional[float] = None,
+    max_gc_content: Optional[float] = None,
+    min_length: Optional[int] = None,
+    max_length: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Retrieve the summary columns of a user's analysis history asynchronously.
+    
+    Takes the same arguments as get_user_analysis_summaries(), with an
+    async database session.
+    
+    Returns:
+        List of summary dicts ordered by created_at descending
+    """
+    statement = _summaries_statement(
+        user_id, limit, offset, after,
+        sequence_type, min_gc_content, max_gc_content, min_length, max_length
+    )
+    return _summary_dicts(await db.execute(statement))
+
+
+def _summaries_statement(
+    user_id: int,
+    limit: int,
+    offset: int,
+    after: Optional[Tuple[datetime, int]],
+    sequence_type: Optional[str],
+    min_gc_content: Optional[float],
+    max_gc_content: Optional[float],
+    min_length: Optional[int],
+    max_length: Optional[int]
+) -> Select:
+    """Build the history summary query for one filtered page."""
+    statement = select(
+        Analysis.id,
+        Analysis.sequence_type,
+        func.coalesce(
+            Analysis.sequence_length,
+            StoredSequence.length,
+            func.length(Analysis.legacy_input_sequence)
+        ).label("sequence_length"),
+        Analysis.gc_content,
+        Analysis.legacy_results["gc_content"].as_string().label("legacy_gc_content"),
+        func.coalesce(
+            StoredSequence.preview,
+            func.substr(Analysis.legacy_input_sequence, 1, SEQUENCE_PREVIEW_LENGTH)
+        ).label("sequence_preview"),
+        Analysis.created_at
+    ).outerjoin(StoredSequence, Analysis.sequence_digest == StoredSequence.digest)
+    
+    if sequence_type is not None:
+        statement = statement.where(Analysis.sequence_type == sequence_type)
+    if min_gc_content is not None:
+        statement = statement.where(Analysis.gc_content >= min_gc_content)
+    if max_gc_content is not None:
+        statement = statement.where(Analysis.gc_content <= max_gc_content)
+    if min_length is not None:
+        statement = statement.where(Analysis.sequence_length >= min_length)
+    if max_length is not None:
+        statement = statement.where(Analysis.sequence_length <= max_length)
+    return _history_page(statement, user_id, limit, offset, after)
+
+
+def _summary_dicts(rows: Result) -> List[Dict[str, Any]]:
+    """Convert summary rows to dicts, formatting GC as the results do."""
+    summaries = []
+    for row in rows:
+        summary = dict(row._mapping)
+        legacy_gc_content = summary.pop("legacy_gc_content")
+        if summary["gc_content"] is not None:
+            # Results report GC with two decimals
+            summary["gc_content"] = f"{summary['gc_content']:.2f}"
+        else:
+            summary["gc_content"] = legacy_gc_content
+        summaries.append(summary)
+    return summaries
+
+
+def _history_page(
+    statement: Select,
+    user_id: int,
+    limit: int,
+    offset: int,
+    after: Optional[Tuple[datetime, int]]
+) -> Select:
+    """Restrict a query to one page of a user's history, newest first."""
+    statement = statement.where(Analysis.user_id == user_id)
+    if after is not None:
+        statement = statement.where(tuple_(Analysis.created_at, Analysis.id) < tuple_(*after))
     return (
-        db.query(Analysis)
-        .filter(Analysis.user_id == user_id)
-        .order_by(Analysis.created_at.desc())
+        statement
+        .order_by(Analysis.created_at.desc(), Analysis.id.desc())
         .limit(limit)
         .offset(offset)
-        .all()
     )
 
 
@@ -79,10 +438,34 @@ def get_analysis_by_id(db: Session, analysis_id: int) -> Analysis | None:
     return db.query(Analysis).filter(Analysis.id == analysis_id).first()
 
 
+async def get_analysis_by_id_async(db: AsyncSession, analysis_id: int) -> Analysis | None:
+    """
+    Retrieve a single analysis record by ID asynchronously.
+    
+    The stored sequence is loaded with the record, since lazy loads are not
+    possible on an async session.
+    
+    Args:
+        db: Async database session
+        analysis_id: ID of the analysis record
+        
+    Returns:
+        Analysis object if found, None otherwise
+    """
+    return await db.scalar(
+        select(Analysis)
+        .options(selectinload(Analysis.sequence))
+        .where(Analysis.id == analysis_id)
+    )
+
+
 def delete_analysis(db: Session, analysis_id: int) -> bool:
     """
     Delete an analysis record.
     
+    Its stored sequence is deleted in the same transaction unless another
+    analysis still references it.
+    
     Args:
         db: Database session
         analysis_id: ID of the analysis record to delete
@@ -92,7 +475,31 @@ def delete_analysis(db: Session, analysis_id: int) -> bool:
     """
     db_analysis = db.query(Analysis).filter(Analysis.id == analysis_id).first()
     if db_analysis:
+        digest = db_analysis.sequence_digest
         db.delete(db_analysis)
+        db.flush()
+        delete_unreferenced_sequences(db, [digest])
         db.commit()
         return True
     return False
+
+
+async def delete_analysis_async(db: AsyncSession, analysis_id: int) -> bool:
+    """
+    Delete an analysis record asynchronously.
+    
+    Its stored sequence is deleted in the same transaction unless another
+    analysis still references it.
+    
+    Args:
+        db: Async database session
+        analysis_id: ID of the analysis record to delete
+        
+    Returns:
+        True if deleted successfully, False if not found
+    """
+    digest = await db.scalar(select(Analysis.sequence_digest).where(Analysis.id == analysis_id))
+    deleted = await db.execute(delete(Analysis).where(Analysis.id == analysis_id))
+    await delete_unreferenced_sequences_async(db, [digest])
+    await db.commit()
+    return deleted.rowcount > 0
@@ -0,0 +1,93 @@
+"""
+Reference sequence CRUD operations.
+"""
+from sqlalchemy.orm import Session
+from typing import List
+from app.models.reference import ReferenceSequence
+
+
+def create_reference(
+    db: Session,
+    user_id: int,
+    filename: str,
+    storage_key: str,
+    record_count: int,
+    total_length: int
+) -> ReferenceSequence:
+    """
+    Create a new reference sequence record.
+    
+    Args:
+        db: Database session
+        user_id: ID of the user who uploaded the reference
+        filename: Original name of the uploaded file
+        storage_key: Key of the stored .fa/.fai pair
+        record_count: Number of records in the reference
+        total_length: Combined length of all records
+        
+    Returns:
+        Created ReferenceSequence object
+    """
+    db_reference = ReferenceSequence(
+        user_id=user_id,
+        filename=filename,
+        storage_key=storage_key,
+        record_count=record_count,
+        total_length=total_length
+    )
+    db.add(db_reference)
+    db.commit()
+    db.refresh(db_reference)
+    return db_reference
+
+
+def get_user_references(db: Session, user_id: int) -> List[ReferenceSequence]:
+    """
+    Retrieve all reference sequences of a user.
+    
+    Args:
+        db: Database session
+        user_id: ID of the user
+        
+    Returns:
+        List of ReferenceSequence objects ordered by created_at descending
+    """
+    return (
+        db.query(ReferenceSequence)
+        .filter(ReferenceSequence.user_id == user_id)
+        .order_by(ReferenceSequence.created_at.desc())
+        .all()
+    )
+
+
+def get_reference_by_id(db: Session, reference_id: int) -> ReferenceSequence | None:
+    """
+    Retrieve a single reference sequence by ID.
+    
+    Args:
+        db: Database session
+        reference_id: ID of the reference sequence
+        
+    Returns:
+        ReferenceSequence object if found, None otherwise
+    """
+    return db.query(ReferenceSequence).filter(ReferenceSequence.id == reference_id).first()
+
+
+def delete_reference(db: Session, reference_id: int) -> bool:
+    """
+    Delete a reference sequence record.
+    
+    Args:
+        db: Database session
+        reference_id: ID of the reference sequence to delete
+        
+    Returns:
+        True if deleted successfully, False if not found
+    """
+    db_reference = get_reference_by_id(db, reference_id)
+    if db_reference:
+        db.delete(db_reference)
+        db.commit()
+        return True
+    return False
@@ -0,0 +1,180 @@
+"""
+Stored sequence CRUD operations.
+"""
+from sqlalchemy import Delete, Select, delete, exists, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+from app.database import LOCKING_READ
+from app.models.analysis import Analysis
+from app.models.sequence import StoredSequence
+from app.utils.sequence_codec import SEQUENCE_PREVIEW_LENGTH, encode_sequence, sequence_digest
+
+# Digests per IN (...) lookup, below SQLite's bound-parameter limit
+DIGEST_LOOKUP_BATCH = 500
+
+
+def store_sequences(db: Session, sequences: Sequence[str]) -> List[str]:
+    """
+    Store sequences once each, keyed by content digest.
+
+    Sequences already present are neither compressed nor written again;
+    their rows are locked against deletion (FOR KEY SHARE on PostgreSQL)
+    until the transaction ends, so they still exist when the caller's
+    analyses reference them. Rows are added to the current transaction;
+    the caller commits.
+
+    Args:
+        db: Database session
+        sequences: Sequence texts, possibly repeated
+
+    Returns:
+        Digest of each sequence, in input order
+    """
+    digests, pending = _pending_sequences(sequences)
+    for statement in _existing_digest_queries(pending):
+        for digest in db.scalars(statement):
+            del pending[digest]
+    if pending:
+        db.execute(_insert_ignoring_duplicates(db), _sequence_rows(pending))
+    return digests
+
+
+async def store_sequences_async(db: AsyncSession, sequences: Sequence[str]) -> List[str]:
+    """
+    Store sequences once each, keyed by content digest, asynchronously.
+
+    Args:
+        db: Async database session
+        sequences: Sequence texts, possibly repeated
+
+    Returns:
+        Digest of each sequence, in input order
+    """
+    digests, pending = _pending_sequences(sequences)
+    for statement in _existing_digest_queries(pending):
+        for digest in await db.scalars(statement):
+            del pending[digest]
+    if pending:
+        await db.execute(_insert_ignoring_duplicates(db), _sequence_rows(pending))
+    return digests
+
+
+def delete_unreferenced_sequences(db: Session, digests: Iterable[str]) -> int:
+    """
+    Delete those of the given sequences that no analysis references anymore.
+
+    The candidate rows are locked first, which waits for transactions that
+    found them in store_sequences() to commit their analyses, so the
+    reference check sees those analyses. Call after deleting analyses, in
+    the same transaction; the caller commits.
+
+    Args:
+        db: Database session
+        digests: Digests of the sequences the deleted analyses referenced
+
+    Returns:
+        Number of sequences deleted
+    """
+    deleted = 0
+    for lock, statement in _unreferenced_deletes(digests):
+        db.execute(lock)
+        deleted += db.execute(statement).rowcount
+    return deleted
+
+
+async def delete_unreferenced_sequences_async(db: AsyncSession, digests: Iterable[str]) -> int:
+    """
+    Delete those of the given sequences that no analysis references anymore, asynchronously.
+
+    Args:
+        db: Async database session
+        digests: Digests of the sequences the deleted analyses referenced
+
+    Returns:
+        Number of sequences deleted
+    """
+    deleted = 0
+    for lock, statement in _unreferenced_deletes(digests):
+        await db.execute(lock)
+        deleted += (await db.execute(statement)).rowcount
+    return deleted
+
+
+def _unreferenced_deletes(digests: Iterable[str]) -> Iterator[Tuple[Select, Delete]]:
+    """
+    Yield (row lock, delete) statement pairs for unreferenced sequences
+    among digests, in bounded batches.
+    """
+    unique = sorted({digest for digest in digests if digest is not None})
+    for start in range(0, len(unique), DIGEST_LOOKUP_BATCH):
+        batch = unique[start:start + DIGEST_LOOKUP_BATCH]
+        lock = (
+            select(StoredSequence.digest)
+            .where(StoredSequence.digest.in_(batch))
+            .with_for_update()
+            .execution_options(**{LOCKING_READ: True})
+        )
+        yield lock, delete(StoredSequence).where(
+            StoredSequence.digest.in_(batch),
+            ~exists().where(Analysis.sequence_digest == StoredSequence.digest)
+        )
+
+
+def _pending_sequences(sequences: Sequence[str]) -> Tuple[List[str], Dict[str, str]]:
+    """Digest sequences; returns all digests and the unique sequences by digest."""
+    digests = [sequence_digest(sequence) for sequence in sequences]
+    return digests, dict(zip(digests, sequences))
+
+
+def _existing_digest_queries(pending: Dict[str, str]) -> Iterator[Select]:
+    """
+    Yield queries for the already stored digests, in bounded batches.
+
+    The queries lock the rows they return against deletion; rows deleted
+    concurrently are not returned and are therefore inserted again.
+    """
+    unique = list(pending)
+    for start in range(0, len(unique), DIGEST_LOOKUP_BATCH):
+        batch = unique[start:start + DIGEST_LOOKUP_BATCH]
+        yield (
+            select(StoredSequence.digest)
+            .where(StoredSequence.digest.in_(batch))
+            .with_for_update(read=True, key_share=True)
+            .execution_options(**{LOCKING_READ: True})
+        )
+
+
+def _sequence_rows(pending: Dict[str, str]) -> List[Dict[str, Any]]:
+    """Compress sequences into rows for the sequences table."""
+    rows = []
+    for digest, sequence in pending.items():
+        encoding, data = encode_sequence(sequence)
+        rows.append({
+            "digest": digest,
+            "length": len(sequence),
+            "preview": sequence[:SEQUENCE_PREVIEW_LENGTH],
+            "encoding": encoding,
+            "data": data
+        })
+    return rows
+
+
+def _insert_ignoring_duplicates(db: Union[Session, AsyncSession]):
+    """
+    Build an INSERT that skips digests stored concurrently by another request.
+
+    Args:
+        db: Database session, sync or async
+
+    Returns:
+        Insert statement for the sequences table
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        return insert(StoredSequence)
+    return dialect_insert(StoredSequence).on_conflict_do_nothing(index_elements=["digest"])
@@ -1,9 +1,15 @@
 """
 User CRUD operations.
 """
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.crud.sequence import delete_unreferenced_sequences
+from app.models.analysis import Analysis
 from app.models.user import User
 from app.schemas.user import UserCreate
+from app.utils.security import invalidate_cached_user
 
 
 def get_user_by_email(db: Session, email: str) -> User | None:
@@ -20,6 +26,20 @@ def get_user_by_email(db: Session, email: str) -> User | None:
     return db.query(User).filter(User.email == email).first()
 
 
+async def get_user_by_email_async(db: AsyncSession, email: str) -> User | None:
+    """
+    Retrieve a user by email address asynchronously.
+    
+    Args:
+        db: Async database session
+        email: User's email address
+        
+    Returns:
+        User object if found, None otherwise
+    """
+    return await db.scalar(select(User).where(User.email == email))
+
+
 def get_user_by_id(db: Session, user_id: int) -> User | None:
     """
     Retrieve a user by ID.
@@ -34,6 +54,20 @@ def get_user_by_id(db: Session, user_id: int) -> User | None:
     return db.query(User).filter(User.id == user_id).first()
 
 
+async def get_user_by_id_async(db: AsyncSession, user_id: int) -> User | None:
+    """
+    Retrieve a user by ID asynchronously.
+    
+    Args:
+        db: Async database session
+        user_id: User's ID
+        
+    Returns:
+        User object if found, None otherwise
+    """
+    return await db.get(User, user_id)
+
+
 def create_user(db: Session, user_data: UserCreate, hashed_password: str) -> User:
     """
     Create a new user with hashed password.
@@ -55,3 +89,118 @@ def create_user(db: Session, user_data: UserCreate, hashed_password: str) -> Use
     db.commit()
     db.refresh(db_user)
     return db_user
+
+
+async def create_user_async(db: AsyncSession, user_data: UserCreate, hashed_password: str) -> User:
+    """
+    Create a new user with hashed password asynchronously.
+    
+    Args:
+        db: Async database session
+        user_data: User creation data (name, email, password)
+        hashed_password: Pre-hashed password
+        
+    Returns:
+        Created User object
+    """
+    db_user = User(
+        name=user_data.name,
+        email=user_data.email,
+        hashed_password=hashed_password
+    )
+    db.add(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    return db_user
+
+
+def update_user(
+    db: Session,
+    user: User,
+    name: Optional[str] = None,
+    email: Optional[str] = None,
+    hashed_password: Optional[str] = None
+) -> User:
+    """
+    Update a user's profile fields and drop their cached principal.
+    
+    Args:
+        db: Database session
+        user: User object to update
+        name: New display name, if changing
+        email: New email address, if changing
+        hashed_password: New pre-hashed password, if changing
+        
+    Returns:
+        Updated User object
+    """
+    if name is not None:
+        user.name = name
+    if email is not None:
+        user.email = email
+    if hashed_password is not None:
+        user.hashed_password = hashed_password
+    db.commit()
+    db.refresh(user)
+    invalidate_cached_user(user.id)
+    return user
+
+
+async def update_user_async(
+    db: AsyncSession,
+    user: User,
+    name: Optional[str] = None,
+    email: Optional[str] = None,
+    hashed_password: Optional[str] = None
+) -> User:
+    """
+    Update a user's profile fields asynchronously and drop their cached principal.
+    
+    Args:
+        db: Async database session
+        user: User object to update
+        name: New display name, if changing
+        email: New email address, if changing
+        hashed_password: New pre-hashed password, if changing
+        
+    Returns:
+        Updated User object
+    """
+    if name is not None:
+        user.name = name
+    if email is not None:
+        user.email = email
+    if hashed_password is not None:
+        user.hashed_password = hashed_password
+    await db.commit()
+    await db.refresh(user)
+    invalidate_cached_user(user.id)
+    return user
+
+
+def delete_user(db: Session, user_id: int) -> bool:
+    """
+    Delete a user and drop their cached principal.
+    
+    The user's analyses are deleted with them, and so are the stored
+    sequences that no other user's analysis references.
+    
+    Args:
+        db: Database session
+        user_id: ID of the user to delete
+        
+    Returns:
+        True if deleted successfully, False if not found
+    """
+    db_user = db.query(User).filter(User.id == user_id).first()
+    if db_user:
+        digests = db.scalars(
+            select(Analysis.sequence_digest).where(Analysis.user_id == user_id).distinct()
+        ).all()
+        db.delete(db_user)
+        db.flush()
+        delete_unreferenced_sequences(db, digests)
+        db.commit()
+        invalidate_cached_user(user_id)
+        return True
+    return False
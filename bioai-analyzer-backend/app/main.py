@@ -12,12 +12,18 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.exc import OperationalError, DatabaseError
 
 from app.config import settings
-from app.routes import auth, analysis, history
+from app.database import dispose_engines
+from app.routes import auth, analysis, history, sequences, uploads
+from app.services.analysis_service import get_analysis_service
+from app.services.file_service import get_file_service
+from app.services.history_writer import get_history_writer
+from app.utils.security import password_executor
 from app.middleware.error_handler import (
     global_exception_handler,
     database_exception_handler,
     TimeoutMiddleware
 )
+from app.middleware.upload_limit import UploadSizeLimitMiddleware
 
 # Configure logging
 logging.basicConfig(
@@ -45,12 +51,26 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[history.NEXT_CURSOR_HEADER],
 )
 
 # Add timeout middleware
 # Requirements: 7.5, 7.6
 app.add_middleware(TimeoutMiddleware, timeout=30)
 
+# Reject oversized uploads while the body is still streaming in;
+# references have their own, larger limit
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_body_size=settings.MAX_FILE_SIZE,
+    paths=("/upload", "/upload/features")
+)
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_body_size=settings.REFERENCE_MAX_SIZE,
+    paths=("/sequences",)
+)
+
 # Register exception handlers
 # Requirements: 7.1, 7.2, 7.3
 app.add_exception_handler(Exception, global_exception_handler)
@@ -62,6 +82,8 @@ app.add_exception_handler(DatabaseError, database_exception_handler)
 app.include_router(auth.router)
 app.include_router(analysis.router)
 app.include_router(history.router)
+app.include_router(sequences.router)
+app.include_router(uploads.router)
 
 
 @app.get("/", tags=["health"])
@@ -86,27 +108,39 @@ async def health_check():
     Health check endpoint for monitoring.
     
     Returns:
-        dict: Service health status
+        dict: Service health status, password hashing pool metrics and
+        write-behind history counters, including dropped rows
     """
     return {
         "status": "healthy",
-        "service": settings.APP_NAME
+        "service": settings.APP_NAME,
+        "password_hashing": password_executor.stats(),
+        "history_writer": get_history_writer().metrics()
     }
 
 
 # Log startup
 @app.on_event("startup")
 async def startup_event():
-    """Log application startup."""
+    """Log application startup and warm up the analysis services."""
     logger.info(f"{settings.APP_NAME} starting up...")
     logger.info(f"Debug mode: {settings.DEBUG}")
     logger.info(f"Allowed origins: {settings.allowed_origins_list}")
+    
+    # Run a representative analysis per sequence type before accepting traffic
+    get_file_service().warm_up()
+    get_analysis_service().warm_up()
+    logger.info("Analysis services warmed up")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Log application shutdown."""
+    """Log application shutdown, flush queued history and stop the worker pools."""
     logger.info(f"{settings.APP_NAME} shutting down...")
+    await get_history_writer().stop()
+    password_executor.shutdown()
+    get_analysis_service().shutdown()
+    await dispose_engines()
 
 
 if __name__ == "__main__":
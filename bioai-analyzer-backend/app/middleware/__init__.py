@@ -7,9 +7,11 @@ from .error_handler import (
     database_exception_handler,
     TimeoutMiddleware
 )
+from .upload_limit import UploadSizeLimitMiddleware
 
 __all__ = [
     "global_exception_handler",
     "database_exception_handler",
-    "TimeoutMiddleware"
+    "TimeoutMiddleware",
+    "UploadSizeLimitMiddleware"
 ]
@@ -0,0 +1,87 @@
+"""
+Request body size enforcement for upload endpoints.
+Rejects oversized uploads before they are buffered by the multipart parser.
+"""
+
+import logging
+from typing import Iterable
+
+from fastapi import HTTPException, status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Allowance for multipart boundaries and part headers around the file itself
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """
+    ASGI middleware that caps the request body size of upload endpoints.
+
+    Requests declaring a Content-Length above the limit are rejected before
+    any of the body is read. Chunked requests are counted as they stream in
+    and aborted with 413 as soon as the limit is crossed.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_body_size: int,
+        paths: Iterable[str] = ("/upload", "/upload/features")
+    ):
+        self.app = app
+        self.max_body_size = max_body_size + MULTIPART_OVERHEAD
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        # Reject up front when the client declares an oversized body
+        for name, value in scope.get("headers", []):
+            if name == b"content-length":
+                try:
+                    declared = int(value)
+                except ValueError:
+                    break
+                if declared > self.max_body_size:
+                    logger.warning(
+                        f"Rejected upload to {scope['path']}: "
+                        f"Content-Length {declared} exceeds {self.max_body_size}"
+                    )
+                    response = self._too_large_response()
+                    await response(scope, receive, send)
+                    return
+                break
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=self._detail()
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    def _detail(self) -> str:
+        """Build the 413 error message."""
+        limit_mb = (self.max_body_size - MULTIPART_OVERHEAD) // (1024 * 1024)
+        return f"File size exceeds maximum limit of {limit_mb}MB"
+
+    def _too_large_response(self) -> JSONResponse:
+        """Build the 413 response sent for oversized declared bodies."""
+        return JSONResponse(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            content={"detail": self._detail()}
+        )
@@ -3,5 +3,7 @@ Database models package.
 """
 from app.models.user import User
 from app.models.analysis import Analysis
+from app.models.reference import ReferenceSequence
+from app.models.sequence import StoredSequence
 
-__all__ = ["User", "Analysis"]
+__all__ = ["User", "Analysis", "ReferenceSequence", "StoredSequence"]
@@ -2,9 +2,11 @@
 Analysis database model.
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Index
+from typing import Any, Dict
+from sqlalchemy import Column, Integer, Float, String, Text, DateTime, ForeignKey, JSON, Index, LargeBinary
 from sqlalchemy.orm import relationship
 from app.database import Base
+from app.utils.results_codec import decode_results
 
 
 class Analysis(Base):
@@ -16,13 +18,48 @@ class Analysis(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     sequence_type = Column(String(20), nullable=False)  # DNA, RNA, or Protein
-    input_sequence = Column(Text, nullable=False)
-    results = Column(JSON, nullable=False)  # Store analysis results as JSON
+    # Sequence text of rows written before sequences were deduplicated
+    legacy_input_sequence = Column("input_sequence", Text, nullable=True)
+    sequence_digest = Column(String(64), ForeignKey("sequences.digest"), nullable=True, index=True)
+    # Results of rows written before the binary encoding, as JSON
+    legacy_results = Column("results", JSON, nullable=True)
+    results_data = Column(LargeBinary, nullable=True)  # Versioned MessagePack results
+    # Key metrics copied out of the results for filtering and sorting
+    sequence_length = Column(Integer, nullable=True)
+    gc_content = Column(Float, nullable=True)  # Percent, DNA/RNA only
+    orf_count = Column(Integer, nullable=True)  # DNA/RNA only
+    molecular_weight = Column(Float, nullable=True)  # Daltons, Protein only
+    isoelectric_point = Column(Float, nullable=True)  # Protein only
     created_at = Column(DateTime, default=datetime.utcnow, index=True, nullable=False)
 
     # Relationship to User model
     user = relationship("User", back_populates="analyses")
 
+    # Shared compressed sequence, loaded only when input_sequence is read
+    sequence = relationship("StoredSequence")
+
+    # Serves per-user history pages in (created_at, id) keyset order, and
+    # per-user range filters on the metric columns
+    __table_args__ = (
+        Index("ix_analyses_user_created_id", user_id, created_at.desc(), id.desc()),
+        Index("ix_analyses_user_gc_content", user_id, gc_content),
+        Index("ix_analyses_user_sequence_length", user_id, sequence_length),
+    )
+
+    @property
+    def input_sequence(self) -> str:
+        """Analyzed sequence text, decompressed from the sequences table."""
+        if self.sequence_digest is not None:
+            return self.sequence.text
+        return self.legacy_input_sequence
+
+    @property
+    def results(self) -> Dict[str, Any]:
+        """Analysis results, decoded from the binary column when read."""
+        if self.results_data is not None:
+            return decode_results(self.results_data)
+        return self.legacy_results
+
     def __repr__(self):
         return f"<Analysis(id={self.id}, user_id={self.user_id}, sequence_type='{self.sequence_type}')>"
 
@@ -0,0 +1,28 @@
+"""
+Reference sequence database model.
+"""
+from datetime import datetime
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey
+from sqlalchemy.orm import relationship
+from app.database import Base
+
+
+class ReferenceSequence(Base):
+    """
+    Reference sequence model for FASTA files kept in the on-disk sequence store.
+    """
+    __tablename__ = "reference_sequences"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    filename = Column(String(255), nullable=False)
+    storage_key = Column(String(32), unique=True, nullable=False)  # Name of the .fa/.fai pair
+    record_count = Column(Integer, nullable=False)
+    total_length = Column(BigInteger, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationship to User model
+    user = relationship("User", back_populates="references")
+
+    def __repr__(self):
+        return f"<ReferenceSequence(id={self.id}, user_id={self.user_id}, filename='{self.filename}')>"
@@ -0,0 +1,29 @@
+"""
+Stored sequence database model.
+"""
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, LargeBinary, DateTime
+from app.database import Base
+from app.utils.sequence_codec import SEQUENCE_PREVIEW_LENGTH, decode_sequence
+
+
+class StoredSequence(Base):
+    """
+    Content-addressed, compressed input sequence shared by analyses.
+    """
+    __tablename__ = "sequences"
+
+    digest = Column(String(64), primary_key=True)  # SHA-256 of the sequence text
+    length = Column(Integer, nullable=False)
+    preview = Column(String(SEQUENCE_PREVIEW_LENGTH), nullable=False)  # Uncompressed prefix for list views
+    encoding = Column(String(10), nullable=False)
+    data = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    @property
+    def text(self) -> str:
+        """Decompressed sequence text."""
+        return decode_sequence(self.encoding, self.data)
+
+    def __repr__(self):
+        return f"<StoredSequence(digest='{self.digest[:12]}', length={self.length})>"
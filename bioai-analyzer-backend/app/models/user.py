@@ -22,6 +22,7 @@ class User(Base):
 
     # Relationship to analyses with cascade delete
     analyses = relationship("Analysis", back_populates="user", cascade="all, delete-orphan")
+    references = relationship("ReferenceSequence", back_populates="user", cascade="all, delete-orphan")
 
     def __repr__(self):
         return f"<User(id={self.id}, email='{self.email}', name='{self.name}')>"
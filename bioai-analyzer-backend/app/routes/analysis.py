@@ -1,21 +1,26 @@
 """
 Analysis routes for sequence analysis and file upload.
 """
-from fastapi import APIRouter, Depends, status, UploadFile, File, HTTPException
+from fastapi import APIRouter, Depends, status, UploadFile, File, Query, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import Union
+from typing import List, Optional, Union
 
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.schemas.analysis import (
     AnalysisRequest,
     NucleotideAnalysisResult,
-    ProteinAnalysisResult
+    ProteinAnalysisResult,
+    GenBankFeatureTable
 )
-from app.services.analysis_service import AnalysisService
-from app.services.file_service import FileService
+from app.services.analysis_service import AnalysisService, get_analysis_service
+from app.services.file_service import DEFAULT_FEATURE_TYPES, FileService, get_file_service
+from app.services.history_writer import HistoryWriter, get_history_writer
+from app.services.upload_service import UploadResult, process_upload
 from app.crud import analysis as crud_analysis
 from app.utils.security import get_current_user
-from app.models.user import User
+from app.schemas.user import UserPrincipal
 
 router = APIRouter(tags=["analysis"])
 
@@ -27,19 +32,26 @@ router = APIRouter(tags=["analysis"])
 )
 async def analyze_sequence(
     request: AnalysisRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    analysis_service: AnalysisService = Depends(get_analysis_service),
+    history_writer: HistoryWriter = Depends(get_history_writer)
 ):
     """
     Analyze a biological sequence (DNA, RNA, or Protein).
     
     Routes the sequence to the appropriate analysis method based on sequence_type.
     Saves the analysis results to the database and returns the results.
+    With HISTORY_WRITE_BEHIND enabled the results are returned first and the
+    history row is written shortly after by the background history writer.
     
     Args:
         request: Analysis request with sequence and sequence_type
         current_user: Authenticated user (from JWT token)
-        db: Database session dependency
+        db: Async database session; it connects lazily, so a pool connection
+            is held only for the final write, not during the analysis
+        analysis_service: Application-scoped analysis service
+        history_writer: Application-scoped write-behind history writer
         
     Returns:
         NucleotideAnalysisResult for DNA/RNA or ProteinAnalysisResult for Protein
@@ -49,95 +61,134 @@ async def analyze_sequence(
         HTTPException 401: If user is not authenticated
         HTTPException 422: If validation fails
     """
-    analysis_service = AnalysisService()
-    
     # Route to appropriate analysis method based on sequence type
-    if request.sequence_type == "DNA":
-        result = analysis_service.analyze_dna(request.sequence)
-    elif request.sequence_type == "RNA":
-        result = analysis_service.analyze_rna(request.sequence)
-    elif request.sequence_type == "Protein":
-        result = analysis_service.analyze_protein(request.sequence)
-    else:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid sequence type: {request.sequence_type}"
-        )
+    result = analysis_service.analyze(request.sequence, request.sequence_type)
     
-    # Save analysis results to database
-    crud_analysis.create_analysis(
-        db=db,
-        user_id=current_user.id,
-        request=request,
-        results=result.model_dump()
-    )
+    # Save analysis results to database, inline unless the writer queues them
+    results = result.model_dump()
+    if not history_writer.submit(current_user.id, request.sequence_type, request.sequence, results):
+        await crud_analysis.create_analysis_async(
+            db=db,
+            user_id=current_user.id,
+            request=request,
+            results=results
+        )
     
     return result
 
 
 @router.post(
     "/upload",
-    response_model=Union[NucleotideAnalysisResult, ProteinAnalysisResult],
+    response_model=UploadResult,
     status_code=status.HTTP_200_OK
 )
 async def upload_file(
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    all_records: bool = Query(default=False),
+    assembly_stats: bool = Query(default=False),
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    file_service: FileService = Depends(get_file_service),
+    analysis_service: AnalysisService = Depends(get_analysis_service)
 ):
     """
-    Upload and analyze a biological sequence file (FASTA or GenBank format).
+    Upload and analyze a biological sequence file (FASTA, GenBank or FASTQ format).
     
     Accepts multipart/form-data file upload, parses the file to extract the sequence,
     auto-detects the sequence type, performs analysis, and saves results to database.
     
+    With all_records=true every record in the file is analyzed in parallel and a
+    per-record result plus a file-level summary is returned instead.
+    
+    With assembly_stats=true a FASTA file is scanned once for assembly QC
+    (contig count, N50/N90, L50/L90, GC distribution, gaps) and nothing is saved.
+    
+    FASTQ files are not analyzed read by read; a FastqSummary of read count,
+    length, quality, GC and N statistics is returned and nothing is saved.
+    
     Args:
-        file: Uploaded file (FASTA or GenBank format)
+        file: Uploaded file (FASTA, GenBank or FASTQ format)
+        all_records: Analyze every record instead of only the first
+        assembly_stats: Return assembly statistics instead of analyses
         current_user: Authenticated user (from JWT token)
-        db: Database session dependency
+        db: Database session, used on the worker thread; it connects lazily,
+            only when the results are written after parsing and analysis
+        file_service: Application-scoped file parsing service
+        analysis_service: Application-scoped analysis service
         
     Returns:
-        NucleotideAnalysisResult for DNA/RNA or ProteinAnalysisResult for Protein
+        NucleotideAnalysisResult for DNA/RNA or ProteinAnalysisResult for Protein,
+        MultiRecordUploadResult when all_records is set, AssemblyStatsResult
+        when assembly_stats is set, or FastqSummary for FASTQ
         
     Raises:
         HTTPException 400: If file format is invalid or cannot be parsed
         HTTPException 401: If user is not authenticated
         HTTPException 413: If file size exceeds 10MB limit
     """
-    # Read file content
-    file_content = await file.read()
-    
-    # Parse file and extract sequence
-    file_service = FileService()
-    sequence, sequence_type = file_service.parse_file(file_content, file.filename)
-    
-    # Create analysis request
-    request = AnalysisRequest(
-        sequence=sequence,
-        sequence_type=sequence_type
+    # Parsing and analysis block, so keep them off the event loop
+    return await run_in_threadpool(
+        process_upload,
+        file.file,
+        file.filename,
+        all_records,
+        current_user.id,
+        db,
+        file_service,
+        analysis_service,
+        assembly_stats
     )
+
+
+@router.post(
+    "/upload/features",
+    response_model=GenBankFeatureTable,
+    status_code=status.HTTP_200_OK
+)
+async def upload_features(
+    file: UploadFile = File(...),
+    feature_type: List[str] = Query(default=list(DEFAULT_FEATURE_TYPES)),
+    start: Optional[int] = Query(default=None, ge=1),
+    end: Optional[int] = Query(default=None, ge=1),
+    current_user: UserPrincipal = Depends(get_current_user),
+    file_service: FileService = Depends(get_file_service)
+):
+    """
+    Extract the feature table of an uploaded GenBank file.
     
-    # Perform analysis using AnalysisService
-    analysis_service = AnalysisService()
+    Returns the features of the first record with their locations and
+    qualifiers; CDS features also include their translation and composition.
+    Only features of the requested types overlapping the optional region
+    are parsed in full. Nothing is saved to the analysis history.
     
-    if sequence_type == "DNA":
-        result = analysis_service.analyze_dna(sequence)
-    elif sequence_type == "RNA":
-        result = analysis_service.analyze_rna(sequence)
-    elif sequence_type == "Protein":
-        result = analysis_service.analyze_protein(sequence)
-    else:
+    Args:
+        file: Uploaded file (GenBank format, optionally compressed)
+        feature_type: Feature keys to return (repeatable; "*" for all)
+        start: 1-based start of the region of interest
+        end: 1-based inclusive end of the region of interest
+        current_user: Authenticated user (from JWT token)
+        file_service: Application-scoped file parsing service
+        
+    Returns:
+        GenBankFeatureTable with the selected features
+        
+    Raises:
+        HTTPException 400: If the file is not a valid GenBank file
+        HTTPException 401: If user is not authenticated
+        HTTPException 413: If file size exceeds 10MB limit
+    """
+    if start is not None and end is not None and start > end:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid sequence type detected: {sequence_type}"
+            detail="start must not be greater than end"
         )
     
-    # Save analysis results to database
-    crud_analysis.create_analysis(
-        db=db,
-        user_id=current_user.id,
-        request=request,
-        results=result.model_dump()
+    return await run_in_threadpool(
+        file_service.extract_features,
+        file.file,
+        file.filename,
+        None if "*" in feature_type else feature_type,
+        start,
+        end
     )
-    
-    return result
+
@@ -2,27 +2,30 @@
 Authentication routes for user registration and login.
 """
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_async_db
 from app.schemas.user import UserCreate, UserLogin, UserResponse
 from app.schemas.auth import Token
 from app.services.auth_service import AuthService
+from app.utils.security import security, revoke_token
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Register a new user.
     
     Creates a new user account with the provided name, email, and password.
-    The password is hashed before storage.
+    The password is hashed on the dedicated password hashing executor
+    before storage.
     
     Args:
         user_data: User registration data (name, email, password)
-        db: Database session dependency
+        db: Async database session dependency
         
     Returns:
         UserResponse: Created user data (id, name, email, created_at)
@@ -30,14 +33,15 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     Raises:
         HTTPException 400: If email already exists
         HTTPException 422: If validation fails
+        HTTPException 503: If the password hashing queue is full
     """
     auth_service = AuthService(db)
-    user = auth_service.register_user(user_data)
+    user = await auth_service.register_user_async(user_data)
     return user
 
 
 @router.post("/login", response_model=Token, status_code=status.HTTP_200_OK)
-def login(credentials: UserLogin, db: Session = Depends(get_db)):
+async def login(credentials: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """
     Authenticate user and return JWT token.
     
@@ -46,7 +50,7 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
     
     Args:
         credentials: User login credentials (email, password)
-        db: Database session dependency
+        db: Async database session dependency
         
     Returns:
         Token: JWT access token, token type, and user data
@@ -54,11 +58,12 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
     Raises:
         HTTPException 401: If credentials are invalid
         HTTPException 422: If validation fails
+        HTTPException 503: If the password hashing queue is full
     """
     auth_service = AuthService(db)
     
-    # Authenticate user
-    user = auth_service.authenticate_user(credentials.email, credentials.password)
+    # Authenticate user (bcrypt runs on the dedicated executor)
+    user = await auth_service.authenticate_user_async(credentials.email, credentials.password)
     
     # Create access token
     access_token = auth_service.create_access_token(user)
@@ -69,3 +74,24 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
         token_type="bearer",
         user=UserResponse.model_validate(user)
     )
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    """
+    Revoke the presented JWT token.
+    
+    The token is purged from the verified token cache and rejected on
+    every subsequent request until it expires.
+    
+    Args:
+        credentials: HTTP Bearer credentials containing the JWT token
+        
+    Returns:
+        None (204 No Content on success)
+        
+    Raises:
+        HTTPException 401: If the token is not a valid token of this service
+    """
+    revoke_token(credentials.credentials)
+    return None
@@ -1,56 +1,106 @@
 """
 History routes for retrieving and managing analysis history.
 """
-from fastapi import APIRouter, Depends, status, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, status, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Optional
 
-from app.database import get_db
-from app.schemas.analysis import AnalysisHistoryResponse
+from app.database import get_async_db
+from app.schemas.analysis import AnalysisHistoryResponse, AnalysisSummaryResponse
 from app.crud import analysis as crud_analysis
+from app.utils.pagination import encode_cursor, decode_cursor
 from app.utils.security import get_current_user
-from app.models.user import User
+from app.schemas.user import UserPrincipal
 
 router = APIRouter(prefix="/history", tags=["history"])
 
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 @router.get(
     "",
-    response_model=List[AnalysisHistoryResponse],
+    response_model=List[AnalysisSummaryResponse],
     status_code=status.HTTP_200_OK
 )
 async def get_history(
+    response: Response,
     limit: int = Query(default=100, le=100, ge=1),
     offset: int = Query(default=0, ge=0),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(default=None),
+    sequence_type: Optional[Literal["DNA", "RNA", "Protein"]] = Query(default=None),
+    min_gc_content: Optional[float] = Query(default=None, ge=0, le=100),
+    max_gc_content: Optional[float] = Query(default=None, ge=0, le=100),
+    min_length: Optional[int] = Query(default=None, ge=0),
+    max_length: Optional[int] = Query(default=None, ge=0),
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Retrieve analysis history for the authenticated user.
     
-    Returns a paginated list of analysis records ordered by creation date (newest first).
-    Maximum of 100 records per request.
+    Returns a paginated list of analysis summaries ordered by creation date (newest first).
+    Maximum of 100 records per request. Rows carry only the sequence type,
+    length, GC content, a short sequence preview and the date; the full
+    sequence and results are available from GET /history/{id}.
+    
+    When a full page is returned, the X-Next-Cursor response header holds an
+    opaque cursor for the following page. Passing it back as ``cursor`` seeks
+    directly to that page, so deep pages cost the same as the first one;
+    ``offset`` is kept for existing clients.
+    
+    Results can be filtered by sequence type, GC content and length; the
+    filters run against indexed metric columns, so no results are parsed.
+    A cursor must be reused with the same filters.
     
     Args:
+        response: Response used to set the next-page cursor header
         limit: Maximum number of records to return (1-100, default: 100)
         offset: Number of records to skip for pagination (default: 0)
+        cursor: Cursor from a previous page's X-Next-Cursor header
+        sequence_type: Only return analyses of this type
+        min_gc_content: Minimum GC content in percent
+        max_gc_content: Maximum GC content in percent
+        min_length: Minimum sequence length
+        max_length: Maximum sequence length
         current_user: Authenticated user (from JWT token)
-        db: Database session dependency
+        db: Async database session dependency
         
     Returns:
-        List[AnalysisHistoryResponse]: List of analysis history records
+        List[AnalysisSummaryResponse]: List of analysis summaries
         
     Raises:
+        HTTPException 400: If the cursor is invalid
         HTTPException 401: If user is not authenticated
         HTTPException 422: If validation fails
     """
-    analyses = crud_analysis.get_user_analyses(
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+    
+    analyses = await crud_analysis.get_user_analysis_summaries_async(
         db=db,
         user_id=current_user.id,
         limit=limit,
-        offset=offset
+        offset=offset,
+        after=after,
+        sequence_type=sequence_type,
+        min_gc_content=min_gc_content,
+        max_gc_content=max_gc_content,
+        min_length=min_length,
+        max_length=max_length
     )
     
+    if len(analyses) == limit:
+        last = analyses[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last["created_at"], last["id"])
+    
     return analyses
 
 
@@ -61,8 +111,8 @@ async def get_history(
 )
 async def get_single_analysis(
     id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Retrieve a single analysis record by ID.
@@ -72,7 +122,7 @@ async def get_single_analysis(
     Args:
         id: Analysis record ID
         current_user: Authenticated user (from JWT token)
-        db: Database session dependency
+        db: Async database session dependency
         
     Returns:
         AnalysisHistoryResponse: Complete analysis record
@@ -83,7 +133,7 @@ async def get_single_analysis(
         HTTPException 404: If analysis record is not found
     """
     # Retrieve analysis record
-    analysis = crud_analysis.get_analysis_by_id(db, id)
+    analysis = await crud_analysis.get_analysis_by_id_async(db, id)
     
     # Check if analysis exists
     if not analysis:
@@ -108,8 +158,8 @@ async def get_single_analysis(
 )
 async def delete_analysis(
     id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete an analysis record.
@@ -119,7 +169,7 @@ async def delete_analysis(
     Args:
         id: Analysis record ID to delete
         current_user: Authenticated user (from JWT token)
-        db: Database session dependency
+        db: Async database session dependency
         
     Returns:
         None (204 No Content on success)
@@ -130,7 +180,7 @@ async def delete_analysis(
         HTTPException 404: If analysis record is not found
     """
     # Retrieve analysis record
-    analysis = crud_analysis.get_analysis_by_id(db, id)
+    analysis = await crud_analysis.get_analysis_by_id_async(db, id)
     
     # Check if analysis exists
     if not analysis:
@@ -147,6 +197,6 @@ async def delete_analysis(
         )
     
     # Delete the analysis
-    crud_analysis.delete_analysis(db, id)
+    await crud_analysis.delete_analysis_async(db, id)
     
     return None
@@ -0,0 +1,283 @@
+"""
+Reference sequence routes for storing FASTA files and analyzing regions.
+"""
+from fastapi import APIRouter, Depends, status, UploadFile, File, Query, HTTPException
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from app.database import get_db
+from app.models.reference import ReferenceSequence
+from app.schemas.reference import (
+    ReferenceRecordInfo,
+    ReferenceSequenceResponse,
+    SequenceRegionResult
+)
+from app.services.analysis_service import AnalysisService, get_analysis_service
+from app.services.file_service import FileService, get_file_service
+from app.services.sequence_store import SequenceStore, get_sequence_store
+from app.crud import analysis as crud_analysis
+from app.crud import reference as crud_reference
+from app.utils.security import get_current_user
+from app.schemas.user import UserPrincipal
+
+router = APIRouter(prefix="/sequences", tags=["sequences"])
+
+# Longest region analyzed per request, matching AnalysisRequest.sequence
+MAX_REGION_LENGTH = 100000
+
+
+@router.post(
+    "",
+    response_model=ReferenceSequenceResponse,
+    status_code=status.HTTP_201_CREATED
+)
+def upload_reference(
+    file: UploadFile = File(...),
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    file_service: FileService = Depends(get_file_service),
+    sequence_store: SequenceStore = Depends(get_sequence_store)
+):
+    """
+    Store a FASTA file as an indexed reference for later region queries.
+    
+    The file is written once to the sequence store with a .fai offset index;
+    regions are then served from disk without re-uploading the reference.
+    Like every route here it is sync, so parsing, file writes and database
+    calls run in the threadpool rather than on the event loop.
+    
+    Args:
+        file: Uploaded FASTA file (optionally compressed)
+        current_user: Authenticated user (from JWT token)
+        db: Database session dependency
+        file_service: Application-scoped file parsing service
+        sequence_store: Application-scoped sequence store
+        
+    Returns:
+        ReferenceSequenceResponse with the stored records
+        
+    Raises:
+        HTTPException 400: If the file is not a valid FASTA file
+        HTTPException 401: If user is not authenticated
+        HTTPException 413: If the file exceeds REFERENCE_MAX_SIZE
+    """
+    if not file_service.is_fasta(file.filename):
+        raise HTTPException(
+            status_code=400,
+            detail="Reference sequences must be FASTA files"
+        )
+    
+    # References have their own size limit instead of MAX_FILE_SIZE
+    file_service = file_service.with_size_limit(sequence_store.max_size)
+    records = file_service.iter_records(file.file, file.filename)
+    try:
+        storage_key, entries = sequence_store.write(
+            (record.record_id, record.sequence.upper()) for record in records
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    
+    reference = crud_reference.create_reference(
+        db=db,
+        user_id=current_user.id,
+        filename=file.filename,
+        storage_key=storage_key,
+        record_count=len(entries),
+        total_length=sum(entry.length for entry in entries)
+    )
+    
+    response = ReferenceSequenceResponse.model_validate(reference)
+    response.records = [
+        ReferenceRecordInfo(name=entry.name, length=entry.length) for entry in entries
+    ]
+    return response
+
+
+@router.get(
+    "",
+    response_model=List[ReferenceSequenceResponse],
+    status_code=status.HTTP_200_OK
+)
+def list_references(
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    List the stored reference sequences of the authenticated user.
+    
+    Args:
+        current_user: Authenticated user (from JWT token)
+        db: Database session dependency
+        
+    Returns:
+        List[ReferenceSequenceResponse]: Stored references, newest first
+        
+    Raises:
+        HTTPException 401: If user is not authenticated
+    """
+    return crud_reference.get_user_references(db=db, user_id=current_user.id)
+
+
+@router.get(
+    "/{id}/region",
+    response_model=SequenceRegionResult,
+    status_code=status.HTTP_200_OK
+)
+def analyze_region(
+    id: int,
+    start: int = Query(..., ge=1),
+    end: int = Query(..., ge=1),
+    record: Optional[str] = Query(default=None),
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    file_service: FileService = Depends(get_file_service),
+    analysis_service: AnalysisService = Depends(get_analysis_service),
+    sequence_store: SequenceStore = Depends(get_sequence_store)
+):
+    """
+    Analyze a region of a stored reference sequence.
+    
+    Only the requested region is read from the memory-mapped reference, so
+    the cost depends on the region length rather than the reference size.
+    The analysis is saved to the history like any other. The route is sync,
+    so its file I/O, database writes and analysis run in the threadpool.
+    
+    Args:
+        id: Reference sequence ID
+        start: 1-based region start
+        end: 1-based inclusive region end
+        record: Record name (defaults to the first record)
+        current_user: Authenticated user (from JWT token)
+        db: Database session dependency
+        file_service: Application-scoped file parsing service
+        analysis_service: Application-scoped analysis service
+        sequence_store: Application-scoped sequence store
+        
+    Returns:
+        SequenceRegionResult with the region and its analysis
+        
+    Raises:
+        HTTPException 400: If the region is invalid or its sequence cannot be analyzed
+        HTTPException 401: If user is not authenticated
+        HTTPException 403: If the reference does not belong to the authenticated user
+        HTTPException 404: If the reference or record is not found
+    """
+    reference = _get_owned_reference(db, id, current_user.id)
+    
+    try:
+        index = sequence_store.read_index(reference.storage_key)
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Stored reference file not found"
+        )
+    
+    entry = index.get(record) if record is not None else next(iter(index.values()), None)
+    if entry is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Record not found"
+        )
+    
+    if start > end or end > entry.length:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Region must lie within 1-{entry.length} with start <= end"
+        )
+    if end - start + 1 > MAX_REGION_LENGTH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Region must not exceed {MAX_REGION_LENGTH} bases"
+        )
+    
+    sequence = sequence_store.fetch(reference.storage_key, entry, start, end)
+    sequence_type = file_service.detect_sequence_type(sequence)
+    result = analysis_service.analyze(sequence, sequence_type)
+    
+    crud_analysis.create_analyses(
+        db=db,
+        user_id=current_user.id,
+        entries=[(sequence_type, sequence, result.model_dump())]
+    )
+    
+    return SequenceRegionResult(
+        reference_id=reference.id,
+        record=entry.name,
+        start=start,
+        end=end,
+        sequence_type=sequence_type,
+        sequence=sequence,
+        result=result
+    )
+
+
+@router.delete(
+    "/{id}",
+    status_code=status.HTTP_204_NO_CONTENT
+)
+def delete_reference(
+    id: int,
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    sequence_store: SequenceStore = Depends(get_sequence_store)
+):
+    """
+    Delete a stored reference sequence and its files.
+    
+    Args:
+        id: Reference sequence ID to delete
+        current_user: Authenticated user (from JWT token)
+        db: Database session dependency
+        sequence_store: Application-scoped sequence store
+        
+    Returns:
+        None (204 No Content on success)
+        
+    Raises:
+        HTTPException 401: If user is not authenticated
+        HTTPException 403: If the reference does not belong to the authenticated user
+        HTTPException 404: If the reference is not found
+    """
+    reference = _get_owned_reference(db, id, current_user.id)
+    storage_key = reference.storage_key
+    
+    crud_reference.delete_reference(db, id)
+    sequence_store.delete(storage_key)
+    
+    return None
+
+
+def _get_owned_reference(db: Session, reference_id: int, user_id: int) -> ReferenceSequence:
+    """
+    Load a reference sequence, enforcing that it belongs to the user.
+    
+    Args:
+        db: Database session
+        reference_id: Reference sequence ID
+        user_id: ID of the authenticated user
+        
+    Returns:
+        The ReferenceSequence
+        
+    Raises:
+        HTTPException 403: If the reference belongs to another user
+        HTTPException 404: If the reference is not found
+    """
+    reference = crud_reference.get_reference_by_id(db, reference_id)
+    
+    if not reference:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Reference sequence not found"
+        )
+    
+    if reference.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    
+    return reference
@@ -0,0 +1,459 @@
+"""
+Resumable upload routes: chunked transfer, progress queries and finalization.
+"""
+import logging
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from typing import Union
+
+from app import database
+from app.database import get_db
+from app.schemas.upload import UploadSessionCreate, UploadSessionStatus
+from app.services.analysis_service import AnalysisService, get_analysis_service
+from app.services.file_service import FileService, get_file_service
+from app.services.upload_service import UploadResult, process_upload
+from app.services.upload_sessions import (
+    STATE_COMPLETED,
+    STATE_FAILED,
+    STATE_RECEIVING,
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_MAX_CHUNK_SIZE,
+    UploadSession,
+    UploadSessionConflict,
+    UploadSessionStore,
+    get_upload_session_store
+)
+from app.utils.security import get_current_user
+from app.schemas.user import UserPrincipal
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/uploads", tags=["uploads"])
+
+
+@router.post(
+    "",
+    response_model=UploadSessionStatus,
+    status_code=status.HTTP_201_CREATED
+)
+async def create_upload(
+    request: UploadSessionCreate,
+    current_user: UserPrincipal = Depends(get_current_user),
+    file_service: FileService = Depends(get_file_service),
+    store: UploadSessionStore = Depends(get_upload_session_store)
+):
+    """
+    Start a resumable upload.
+    
+    The client then PUTs the file in numbered chunks of chunk_size bytes
+    (the last one may be shorter) and finalizes the session.
+    
+    Args:
+        request: File name, total size and optional chunk size
+        current_user: Authenticated user (from JWT token)
+        file_service: Application-scoped file parsing service
+        store: Application-scoped upload session store
+    
+    Returns:
+        UploadSessionStatus of the new session
+    
+    Raises:
+        HTTPException 400: If the file format or chunk size is not supported
+        HTTPException 401: If user is not authenticated
+        HTTPException 413: If the file exceeds the resumable upload size limit
+    """
+    file_service.detect_format(request.filename)
+    
+    chunk_size = request.chunk_size or UPLOAD_CHUNK_SIZE
+    if chunk_size > UPLOAD_MAX_CHUNK_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Chunk size must not exceed {UPLOAD_MAX_CHUNK_SIZE} bytes"
+        )
+    
+    try:
+        session = await run_in_threadpool(
+            store.create,
+            current_user.id,
+            request.filename,
+            request.total_size,
+            chunk_size
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=413,
+            detail=str(e)
+        )
+    return _session_status(session)
+
+
+@router.put(
+    "/{upload_id}/chunks/{index}",
+    response_model=UploadSessionStatus,
+    status_code=status.HTTP_200_OK
+)
+async def upload_chunk(
+    upload_id: str,
+    index: int,
+    request: Request,
+    x_chunk_sha256: str = Header(...),
+    current_user: UserPrincipal = Depends(get_current_user),
+    store: UploadSessionStore = Depends(get_upload_session_store)
+):
+    """
+    Store one chunk of a resumable upload.
+    
+    The raw request body is the chunk content and the X-Chunk-SHA256 header
+    its hex SHA-256 digest. Chunks may arrive in any order and may be re-sent.
+    
+    Args:
+        upload_id: Upload session ID
+        index: 0-based chunk number
+        request: Incoming request carrying the chunk as its body
+        x_chunk_sha256: Hex SHA-256 digest of the chunk
+        current_user: Authenticated user (from JWT token)
+        store: Application-scoped upload session store
+    
+    Returns:
+        UploadSessionStatus after the chunk was stored
+    
+    Raises:
+        HTTPException 400: If the chunk index, length or checksum is wrong
+        HTTPException 401: If user is not authenticated
+        HTTPException 403: If the session belongs to another user
+        HTTPException 404: If the session is not found
+        HTTPException 409: If the session no longer accepts chunks
+        HTTPException 413: If the chunk is larger than the session's chunk size
+    """
+    session = _get_owned_session(store, upload_id, current_user.id)
+    if session.state != STATE_RECEIVING:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Upload is no longer accepting chunks"
+        )
+    
+    # Buffer at most one chunk; reject anything longer while it streams in
+    body = bytearray()
+    async for piece in request.stream():
+        body += piece
+        if len(body) > session.chunk_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Chunk exceeds the session chunk size of {session.chunk_size} bytes"
+            )
+    
+    try:
+        await run_in_threadpool(store.write_chunk, session, index, bytes(body), x_chunk_sha256)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    except UploadSessionConflict as e:
+        # Finalization started while the chunk was streaming in
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload not found"
+        )
+    
+    return _session_status(store.get(upload_id))
+
+
+@router.get(
+    "/{upload_id}",
+    response_model=UploadSessionStatus,
+    status_code=status.HTTP_200_OK
+)
+async def get_upload(
+    upload_id: str,
+    current_user: UserPrincipal = Depends(get_current_user),
+    store: UploadSessionStore = Depends(get_upload_session_store)
+):
+    """
+    Report the progress or outcome of a resumable upload.
+    
+    received_offset is the number of bytes received contiguously from the
+    start of the file, i.e. where a sequential client should resume.
+    
+    Args:
+        upload_id: Upload session ID
+        current_user: Authenticated user (from JWT token)
+        store: Application-scoped upload session store
+    
+    Returns:
+        UploadSessionStatus, including the result once processing completed
+    
+    Raises:
+        HTTPException 401: If user is not authenticated
+        HTTPException 403: If the session belongs to another user
+        HTTPException 404: If the session is not found
+    """
+    return _session_status(_get_owned_session(store, upload_id, current_user.id))
+
+
+@router.post(
+    "/{upload_id}/complete",
+    response_model=Union[UploadResult, UploadSessionStatus],
+    status_code=status.HTTP_200_OK
+)
+async def complete_upload(
+    upload_id: str,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    all_records: bool = Query(default=False),
+    assembly_stats: bool = Query(default=False),
+    background: bool = Query(default=False),
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    file_service: FileService = Depends(get_file_service),
+    analysis_service: AnalysisService = Depends(get_analysis_service),
+    store: UploadSessionStore = Depends(get_upload_session_store)
+):
+    """
+    Finalize a resumable upload and run the normal upload pipeline on it.
+    
+    The chunks were written in place, so the assembled file is processed
+    directly, with RESUMABLE_MAX_SIZE as its size limit. The transition to
+    processing is atomic, so concurrent calls process the file only once.
+    By default the response is the same as for POST /upload. With
+    background=true the request returns 202 immediately and the result is
+    reported by GET /uploads/{upload_id} once processing completes.
+    
+    Args:
+        upload_id: Upload session ID
+        response: Outgoing response, used to set 202 for background jobs
+        background_tasks: Tasks run after the response is sent
+        all_records: Analyze every record instead of only the first
+        assembly_stats: Return assembly statistics instead of analyses
+        background: Process the file after responding
+        current_user: Authenticated user (from JWT token)
+        db: Database session dependency
+        file_service: Application-scoped file parsing service
+        analysis_service: Application-scoped analysis service
+        store: Application-scoped upload session store
+    
+    Returns:
+        The upload result, or UploadSessionStatus for background processing
+    
+    Raises:
+        HTTPException 400: If the file cannot be parsed or analyzed
+        HTTPException 401: If user is not authenticated
+        HTTPException 403: If the session belongs to another user
+        HTTPException 404: If the session is not found
+        HTTPException 409: If chunks are missing or the session was finalized
+    """
+    _get_owned_session(store, upload_id, current_user.id)
+    try:
+        session = await run_in_threadpool(store.begin_processing, upload_id)
+    except UploadSessionConflict as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload not found"
+        )
+    
+    # Resumable uploads have their own size limit instead of MAX_FILE_SIZE
+    file_service = file_service.with_size_limit(store.max_size)
+    
+    if background:
+        background_tasks.add_task(
+            _finalize_in_background,
+            session,
+            all_records,
+            assembly_stats,
+            current_user.id,
+            file_service,
+            analysis_service,
+            store
+        )
+        response.status_code = status.HTTP_202_ACCEPTED
+        return _session_status(store.get(upload_id))
+    
+    return await run_in_threadpool(
+        _finalize,
+        session,
+        all_records,
+        assembly_stats,
+        current_user.id,
+        db,
+        file_service,
+        analysis_service,
+        store
+    )
+
+
+@router.delete(
+    "/{upload_id}",
+    status_code=status.HTTP_204_NO_CONTENT
+)
+async def delete_upload(
+    upload_id: str,
+    current_user: UserPrincipal = Depends(get_current_user),
+    store: UploadSessionStore = Depends(get_upload_session_store)
+):
+    """
+    Abort a resumable upload and discard its data.
+    
+    Args:
+        upload_id: Upload session ID
+        current_user: Authenticated user (from JWT token)
+        store: Application-scoped upload session store
+    
+    Returns:
+        None (204 No Content on success)
+    
+    Raises:
+        HTTPException 401: If user is not authenticated
+        HTTPException 403: If the session belongs to another user
+        HTTPException 404: If the session is not found
+    """
+    _get_owned_session(store, upload_id, current_user.id)
+    await run_in_threadpool(store.delete, upload_id)
+    return None
+
+
+def _finalize(
+    session: UploadSession,
+    all_records: bool,
+    assembly_stats: bool,
+    user_id: int,
+    db: Session,
+    file_service: FileService,
+    analysis_service: AnalysisService,
+    store: UploadSessionStore
+) -> UploadResult:
+    """
+    Process an assembled upload and record the outcome on its session.
+    
+    Args:
+        session: Fully received upload session
+        all_records: Analyze every record instead of only the first
+        assembly_stats: Return assembly statistics instead of analyses
+        user_id: ID of the authenticated user
+        db: Database session
+        file_service: File parsing service
+        analysis_service: Analysis service
+        store: Upload session store
+    
+    Returns:
+        The upload result
+    
+    Raises:
+        HTTPException: If the file cannot be parsed or analyzed
+    """
+    try:
+        with open(store.data_path(session.upload_id), "rb") as stream:
+            result = process_upload(
+                stream,
+                session.filename,
+                all_records,
+                user_id,
+                db,
+                file_service,
+                analysis_service,
+                assembly_stats
+            )
+    except HTTPException as e:
+        store.set_state(session.upload_id, STATE_FAILED, error=str(e.detail))
+        raise
+    except Exception:
+        store.set_state(session.upload_id, STATE_FAILED, error="Processing failed")
+        raise
+    
+    store.set_state(session.upload_id, STATE_COMPLETED, result=result.model_dump(mode="json"))
+    return result
+
+
+def _finalize_in_background(
+    session: UploadSession,
+    all_records: bool,
+    assembly_stats: bool,
+    user_id: int,
+    file_service: FileService,
+    analysis_service: AnalysisService,
+    store: UploadSessionStore
+) -> None:
+    """
+    Run _finalize() after the response, with a database session of its own.
+    
+    Failures are recorded on the upload session for GET /uploads/{id}.
+    """
+    db = database.SessionLocal()
+    try:
+        _finalize(
+            session,
+            all_records,
+            assembly_stats,
+            user_id,
+            db,
+            file_service,
+            analysis_service,
+            store
+        )
+    except HTTPException:
+        pass
+    except Exception:
+        logger.exception(f"Background processing of upload {session.upload_id} failed")
+    finally:
+        db.close()
+
+
+def _get_owned_session(store: UploadSessionStore, upload_id: str, user_id: int) -> UploadSession:
+    """
+    Load an upload session, enforcing that it belongs to the user.
+    
+    Args:
+        store: Upload session store
+        upload_id: Upload session ID
+        user_id: ID of the authenticated user
+    
+    Returns:
+        The UploadSession
+    
+    Raises:
+        HTTPException 403: If the session belongs to another user
+        HTTPException 404: If the session is not found
+    """
+    try:
+        session = store.get(upload_id)
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload not found"
+        )
+    
+    if session.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    
+    return session
+
+
+def _session_status(session: UploadSession) -> UploadSessionStatus:
+    """Build the API representation of an upload session."""
+    return UploadSessionStatus(
+        upload_id=session.upload_id,
+        filename=session.filename,
+        total_size=session.total_size,
+        chunk_size=session.chunk_size,
+        chunk_count=session.chunk_count,
+        received_offset=session.received_offset,
+        received_chunk_count=len(session.received_chunks),
+        missing_chunks=session.missing_chunks,
+        state=session.state,
+        error=session.error,
+        result=session.result
+    )
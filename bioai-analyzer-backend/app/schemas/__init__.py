@@ -1,21 +1,49 @@
-from .user import UserBase, UserCreate, UserResponse, UserLogin
+from .user import UserBase, UserCreate, UserResponse, UserLogin, UserPrincipal
 from .auth import Token, TokenData
 from .analysis import (
     AnalysisRequest,
     NucleotideAnalysisResult,
     ProteinAnalysisResult,
-    AnalysisHistoryResponse
+    RecordAnalysisResult,
+    UploadSummary,
+    MultiRecordUploadResult,
+    FastqSummary,
+    LengthHistogramBin,
+    AssemblyStatsResult,
+    CdsComposition,
+    GenBankFeatureResult,
+    GenBankFeatureTable,
+    AnalysisHistoryResponse,
+    AnalysisSummaryResponse
 )
+from .reference import ReferenceRecordInfo, ReferenceSequenceResponse, SequenceRegionResult
+from .upload import UploadSessionCreate, UploadSessionStatus
 
 __all__ = [
     "UserBase",
     "UserCreate",
     "UserResponse",
     "UserLogin",
+    "UserPrincipal",
     "Token",
     "TokenData",
     "AnalysisRequest",
     "NucleotideAnalysisResult",
     "ProteinAnalysisResult",
+    "RecordAnalysisResult",
+    "UploadSummary",
+    "MultiRecordUploadResult",
+    "FastqSummary",
+    "LengthHistogramBin",
+    "AssemblyStatsResult",
+    "CdsComposition",
+    "GenBankFeatureResult",
+    "GenBankFeatureTable",
     "AnalysisHistoryResponse",
+    "AnalysisSummaryResponse",
+    "ReferenceRecordInfo",
+    "ReferenceSequenceResponse",
+    "SequenceRegionResult",
+    "UploadSessionCreate",
+    "UploadSessionStatus",
 ]
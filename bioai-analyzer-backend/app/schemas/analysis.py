@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, field_validator
-from typing import Dict, List, Any, Optional, Literal
+from typing import Dict, List, Any, Optional, Literal, Union
 from datetime import datetime
 
 
@@ -38,6 +38,107 @@ class ProteinAnalysisResult(BaseModel):
     isoelectric_point: str
 
 
+class RecordAnalysisResult(BaseModel):
+    """Schema for the analysis of one record in a multi-record upload."""
+    record_id: str
+    description: str
+    sequence_type: str
+    sequence_length: int
+    result: Optional[Union[NucleotideAnalysisResult, ProteinAnalysisResult]] = None
+    error: Optional[str] = None
+
+
+class UploadSummary(BaseModel):
+    """Schema for file-level statistics of a multi-record upload."""
+    record_count: int
+    analyzed_count: int
+    failed_count: int
+    total_length: int
+    sequence_type_counts: Dict[str, int]
+
+
+class MultiRecordUploadResult(BaseModel):
+    """Schema for the results of analyzing every record in an uploaded file."""
+    filename: str
+    summary: UploadSummary
+    records: List[RecordAnalysisResult]
+
+
+class FastqSummary(BaseModel):
+    """Schema for read-level quality statistics of a FASTQ upload."""
+    filename: str
+    read_count: int
+    total_bases: int
+    min_length: int
+    max_length: int
+    mean_length: float
+    length_distribution: Dict[int, int]
+    mean_quality: float
+    per_position_mean_quality: List[float]
+    gc_content: float
+    gc_distribution: List[int]
+    n_content: float
+    per_position_n_content: List[float]
+
+
+class LengthHistogramBin(BaseModel):
+    """Schema for the contig count of one length bin."""
+    min_length: int
+    max_length: Optional[int] = None
+    count: int
+
+
+class AssemblyStatsResult(BaseModel):
+    """Schema for contiguity, GC and gap statistics of an assembly."""
+    filename: str
+    contig_count: int
+    total_length: int
+    min_length: int
+    max_length: int
+    mean_length: float
+    n50: int
+    l50: int
+    n90: int
+    l90: int
+    gc_content: float
+    gc_distribution: List[int]
+    length_histogram: List[LengthHistogramBin]
+    n_content: float
+    gap_count: int
+    gap_total_length: int
+    longest_gap: int
+
+
+class CdsComposition(BaseModel):
+    """Schema for the composition of a coding sequence and its translation."""
+    length: int
+    gc_content: float
+    nucleotide_counts: Dict[str, int]
+    amino_acid_counts: Dict[str, int]
+
+
+class GenBankFeatureResult(BaseModel):
+    """Schema for one entry of a GenBank feature table."""
+    type: str
+    location: str
+    start: Optional[int] = None
+    end: Optional[int] = None
+    strand: int
+    qualifiers: Dict[str, List[str]]
+    translation: Optional[str] = None
+    composition: Optional[CdsComposition] = None
+
+
+class GenBankFeatureTable(BaseModel):
+    """Schema for the selected features of an uploaded GenBank record."""
+    filename: str
+    record_id: str
+    description: str
+    sequence_length: int
+    total_feature_count: int
+    features: List[GenBankFeatureResult]
+
+
 class AnalysisHistoryResponse(BaseModel):
     """Schema for analysis history record."""
     id: int
@@ -48,3 +149,16 @@ class AnalysisHistoryResponse(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+class AnalysisSummaryResponse(BaseModel):
+    """Schema for one row of the analysis history list."""
+    id: int
+    sequence_type: str
+    sequence_length: int
+    gc_content: Optional[str] = None
+    sequence_preview: str
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
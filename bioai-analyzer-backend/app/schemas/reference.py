@@ -0,0 +1,35 @@
+from pydantic import BaseModel
+from typing import List, Optional, Union
+from datetime import datetime
+
+from .analysis import NucleotideAnalysisResult, ProteinAnalysisResult
+
+
+class ReferenceRecordInfo(BaseModel):
+    """Schema for one record of a stored reference."""
+    name: str
+    length: int
+
+
+class ReferenceSequenceResponse(BaseModel):
+    """Schema for a stored reference sequence."""
+    id: int
+    filename: str
+    record_count: int
+    total_length: int
+    created_at: datetime
+    records: Optional[List[ReferenceRecordInfo]] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class SequenceRegionResult(BaseModel):
+    """Schema for the analysis of a region of a stored reference."""
+    reference_id: int
+    record: str
+    start: int
+    end: int
+    sequence_type: str
+    sequence: str
+    result: Union[NucleotideAnalysisResult, ProteinAnalysisResult]
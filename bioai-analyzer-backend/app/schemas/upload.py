@@ -0,0 +1,24 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+
+
+class UploadSessionCreate(BaseModel):
+    """Schema for starting a resumable upload."""
+    filename: str = Field(..., min_length=1, max_length=255)
+    total_size: int = Field(..., gt=0)
+    chunk_size: Optional[int] = Field(default=None, ge=64 * 1024)
+
+
+class UploadSessionStatus(BaseModel):
+    """Schema for the progress and outcome of a resumable upload."""
+    upload_id: str
+    filename: str
+    total_size: int
+    chunk_size: int
+    chunk_count: int
+    received_offset: int
+    received_chunk_count: int
+    missing_chunks: List[int]
+    state: str
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
@@ -22,6 +22,17 @@ class UserResponse(UserBase):
         from_attributes = True
 
 
+class UserPrincipal(BaseModel):
+    """Schema for the authenticated user identity attached to requests."""
+    id: int
+    email: str
+    name: str
+    
+    class Config:
+        from_attributes = True
+        frozen = True
+
+
 class UserLogin(BaseModel):
     """Schema for user login."""
     email: EmailStr
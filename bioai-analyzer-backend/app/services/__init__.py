@@ -1,8 +1,23 @@
 """
 Services module for business logic.
 """
-from .analysis_service import AnalysisService
-from .file_service import FileService
+from .analysis_service import AnalysisService, get_analysis_service
+from .file_service import FileService, get_file_service
 from .auth_service import AuthService
+from .history_writer import HistoryWriter, get_history_writer
+from .sequence_store import SequenceStore, get_sequence_store
+from .upload_sessions import UploadSessionStore, get_upload_session_store
 
-__all__ = ['AnalysisService', 'FileService', 'AuthService']
+__all__ = [
+    'AnalysisService',
+    'FileService',
+    'AuthService',
+    'HistoryWriter',
+    'SequenceStore',
+    'UploadSessionStore',
+    'get_analysis_service',
+    'get_file_service',
+    'get_history_writer',
+    'get_sequence_store',
+    'get_upload_session_store',
+]
@@ -1,17 +1,156 @@
 """
 Analysis service for processing biological sequences.
 """
-from typing import List, Dict, Any
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
 from fastapi import HTTPException
-from Bio.Seq import Seq
-from Bio.SeqUtils import gc_fraction
-from Bio.SeqUtils.ProtParam import ProteinAnalysis
 from app.schemas.analysis import NucleotideAnalysisResult, ProteinAnalysisResult
 
+# Biopython is imported on first use (or during warm-up) to keep cold start fast
+if TYPE_CHECKING:
+    from Bio.Seq import Seq
+
+# Lookup tables shared by every analysis, built once at import time
+AMINO_ACIDS = 'ACDEFGHIKLMNPQRSTVWY'
+DNA_ALPHABET = frozenset('ATGC')
+RNA_ALPHABET = frozenset('AUGC')
+PROTEIN_ALPHABET = frozenset(AMINO_ACIDS)
+START_CODON = 'ATG'
+STOP_CODONS = frozenset(('TAA', 'TAG', 'TGA'))
+WHITESPACE_TABLE = str.maketrans('', '', ' \n\r\t')
+
+# Worker processes used to analyze multi-record uploads in parallel (0 = CPU count)
+ANALYSIS_WORKERS = int(os.getenv("ANALYSIS_WORKERS", "0")) or os.cpu_count() or 1
+
+# Representative inputs exercised by AnalysisService.warm_up()
+WARM_UP_SEQUENCES = {
+    "DNA": "ATG" + "GCA" * 40 + "TAA",
+    "RNA": "AUG" + "GCA" * 40 + "UAA",
+    "Protein": AMINO_ACIDS * 5,
+}
+
+
+AnalysisOutcome = Tuple[
+    Optional[Union[NucleotideAnalysisResult, ProteinAnalysisResult]],
+    Optional[str]
+]
+
+
+def _analyze_in_worker(sequence: str, sequence_type: str) -> AnalysisOutcome:
+    """
+    Analyze one sequence inside a worker process.
+    
+    Validation errors are returned rather than raised so that one bad
+    record does not abort the rest of a batch.
+    
+    Returns:
+        Tuple of (result, None) on success or (None, error detail) on failure
+    """
+    try:
+        return get_analysis_service().analyze(sequence, sequence_type), None
+    except HTTPException as e:
+        return None, str(e.detail)
+
 
 class AnalysisService:
     """Service for analyzing DNA, RNA, and protein sequences using Biopython."""
     
+    def __init__(self, max_workers: int = ANALYSIS_WORKERS):
+        """
+        Initialize the analysis service.
+        
+        Args:
+            max_workers: Worker processes for analyze_many(); 1 or less
+                analyzes batches inline
+        """
+        self.max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+    
+    def analyze(
+        self,
+        sequence: str,
+        sequence_type: str
+    ) -> Union[NucleotideAnalysisResult, ProteinAnalysisResult]:
+        """
+        Route a sequence to the analysis method for its type.
+        
+        Args:
+            sequence: Sequence string
+            sequence_type: "DNA", "RNA", or "Protein"
+            
+        Returns:
+            NucleotideAnalysisResult for DNA/RNA or ProteinAnalysisResult for Protein
+            
+        Raises:
+            HTTPException: If the sequence type is unknown or the sequence is invalid
+        """
+        if sequence_type == "DNA":
+            return self.analyze_dna(sequence)
+        elif sequence_type == "RNA":
+            return self.analyze_rna(sequence)
+        elif sequence_type == "Protein":
+            return self.analyze_protein(sequence)
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid sequence type: {sequence_type}"
+        )
+    
+    def analyze_many(self, items: Iterable[Tuple[str, str]]) -> Iterator[AnalysisOutcome]:
+        """
+        Analyze many sequences in parallel, yielding outcomes in input order.
+        
+        Items are consumed lazily and at most two batches' worth of work per
+        worker is in flight, so memory stays bounded for large inputs.
+        
+        Args:
+            items: Iterable of (sequence, sequence_type) pairs
+            
+        Yields:
+            Tuple of (result, None) on success or (None, error detail) on failure
+        """
+        if self.max_workers <= 1:
+            for sequence, sequence_type in items:
+                yield _analyze_in_worker(sequence, sequence_type)
+            return
+        
+        pool = self._get_pool()
+        pending = deque()
+        for sequence, sequence_type in items:
+            pending.append(pool.submit(_analyze_in_worker, sequence, sequence_type))
+            if len(pending) >= self.max_workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Return the worker pool, starting it on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._pool
+    
+    def shutdown(self) -> None:
+        """Stop the worker pool; a new one is started on next use."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+    
+    def warm_up(self) -> None:
+        """
+        Run a representative analysis for every sequence type.
+        
+        Called at application startup so the first real request does not
+        pay for lazy Biopython initialization.
+        """
+        for sequence_type, sequence in WARM_UP_SEQUENCES.items():
+            self.analyze(sequence, sequence_type)
+    
     def analyze_dna(self, sequence: str) -> NucleotideAnalysisResult:
         """
         Analyze DNA sequence using Biopython.
@@ -31,6 +170,7 @@ class AnalysisService:
         self._validate_dna_sequence(seq)
         
         # Create Biopython Seq object
+        from Bio.Seq import Seq
         bio_seq = Seq(seq)
         
         # Calculate GC content
@@ -69,7 +209,7 @@ class AnalysisService:
         Returns:
             Cleaned sequence string
         """
-        return sequence.replace(" ", "").replace("\n", "").replace("\r", "").replace("\t", "").upper()
+        return sequence.translate(WHITESPACE_TABLE).upper()
     
     def _validate_dna_sequence(self, sequence: str) -> None:
         """
@@ -81,14 +221,13 @@ class AnalysisService:
         Raises:
             HTTPException: If sequence contains invalid characters
         """
-        valid_chars = set('ATGC')
-        if not set(sequence).issubset(valid_chars):
+        if not DNA_ALPHABET.issuperset(sequence):
             raise HTTPException(
                 status_code=400,
                 detail="Invalid DNA sequence: contains invalid characters"
             )
     
-    def _calculate_gc_content(self, bio_seq: Seq) -> float:
+    def _calculate_gc_content(self, bio_seq: "Seq") -> float:
         """
         Calculate GC content percentage.
         
@@ -98,9 +237,10 @@ class AnalysisService:
         Returns:
             GC content as percentage (0-100)
         """
+        from Bio.SeqUtils import gc_fraction
         return gc_fraction(bio_seq) * 100
     
-    def _find_orfs(self, bio_seq: Seq, min_length: int = 100) -> List[Dict[str, Any]]:
+    def _find_orfs(self, bio_seq: "Seq", min_length: int = 100) -> List[Dict[str, Any]]:
         """
         Find Open Reading Frames in DNA sequence.
         
@@ -118,11 +258,11 @@ class AnalysisService:
         for frame in range(3):
             for i in range(frame, len(seq_str) - 2, 3):
                 codon = seq_str[i:i+3]
-                if codon == 'ATG':  # Start codon
+                if codon == START_CODON:
                     # Find stop codon
                     for j in range(i+3, len(seq_str) - 2, 3):
                         stop_codon = seq_str[j:j+3]
-                        if stop_codon in ['TAA', 'TAG', 'TGA']:
+                        if stop_codon in STOP_CODONS:
                             orf_length = j + 3 - i
                             if orf_length >= min_length:
                                 orfs.append({
@@ -153,6 +293,7 @@ class AnalysisService:
         self._validate_rna_sequence(seq)
         
         # Create Biopython Seq object
+        from Bio.Seq import Seq
         bio_seq = Seq(seq)
         
         # Calculate GC content
@@ -187,8 +328,7 @@ class AnalysisService:
         Raises:
             HTTPException: If sequence contains invalid characters
         """
-        valid_chars = set('AUGC')
-        if not set(sequence).issubset(valid_chars):
+        if not RNA_ALPHABET.issuperset(sequence):
             raise HTTPException(
                 status_code=400,
                 detail="Invalid RNA sequence: contains invalid characters"
@@ -213,6 +353,7 @@ class AnalysisService:
         self._validate_protein_sequence(seq)
         
         # Create Biopython ProteinAnalysis object
+        from Bio.SeqUtils.ProtParam import ProteinAnalysis
         protein_analysis = ProteinAnalysis(seq)
         
         # Calculate properties
@@ -221,7 +362,7 @@ class AnalysisService:
         
         # Get amino acid counts (returns percentages, we need counts)
         amino_acid_counts = {}
-        for aa in 'ACDEFGHIKLMNPQRSTVWY':
+        for aa in AMINO_ACIDS:
             count = seq.count(aa)
             if count > 0:
                 amino_acid_counts[aa] = count
@@ -244,9 +385,19 @@ class AnalysisService:
         Raises:
             HTTPException: If sequence contains invalid characters
         """
-        valid_chars = set('ACDEFGHIKLMNPQRSTVWY')
-        if not set(sequence).issubset(valid_chars):
+        if not PROTEIN_ALPHABET.issuperset(sequence):
             raise HTTPException(
                 status_code=400,
                 detail="Invalid protein sequence: contains invalid characters"
             )
+
+
+@lru_cache(maxsize=None)
+def get_analysis_service() -> AnalysisService:
+    """
+    Dependency returning the application-scoped AnalysisService.
+    
+    Returns:
+        Shared AnalysisService instance
+    """
+    return AnalysisService()
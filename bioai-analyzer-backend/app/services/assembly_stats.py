@@ -0,0 +1,193 @@
+"""
+Streaming assembly statistics for multi-record FASTA files.
+
+The file is scanned in large byte blocks and every contig is summarized
+while it streams past: only its running counters and, once it ends, its
+length are kept. Sequences are never assembled in memory, so multi-GB
+assemblies are summarized with memory proportional to the contig count.
+"""
+import re
+from array import array
+from itertools import accumulate
+from typing import BinaryIO, List, Optional, Tuple
+
+# Bytes requested from the stream per read
+ASSEMBLY_READ_SIZE = 1024 * 1024
+
+# One GC-content bin per whole percent, 0-100
+GC_BINS = 101
+
+# Bytes removed from sequence data before counting
+SEQUENCE_WHITESPACE = b" \t\r\n\v\f"
+
+# Runs of unknown bases (gaps), including soft-masked ones
+_N_RUN_PATTERN = re.compile(rb"[Nn]+")
+
+
+class AssemblyStatistics:
+    """
+    Running contig-length, GC and gap statistics of an assembly.
+    """
+
+    def __init__(self):
+        self.lengths = array("Q")
+        self.gc_bases = 0
+        self.n_bases = 0
+        self.gap_count = 0
+        self.gap_total_length = 0
+        self.longest_gap = 0
+        self.gc_histogram = [0] * GC_BINS
+        self._open = False
+        self._length = 0
+        self._gc = 0
+        self._n = 0
+        self._run = 0
+
+    def start_contig(self) -> None:
+        """Begin a new contig, closing the previous one."""
+        self.end_contig()
+        self._open = True
+        self._length = self._gc = self._n = self._run = 0
+
+    def add_sequence(self, data: bytes) -> None:
+        """
+        Count a block of the current contig's sequence.
+
+        Args:
+            data: Sequence bytes without whitespace
+        """
+        if not data:
+            return
+        self._length += len(data)
+        self._gc += data.count(b"G") + data.count(b"C") + data.count(b"g") + data.count(b"c")
+        n_count = data.count(b"N") + data.count(b"n")
+        self._n += n_count
+
+        if not n_count:
+            self._close_run()
+            return
+        for match in _N_RUN_PATTERN.finditer(data):
+            if match.start() > 0:
+                self._close_run()
+            self._run += match.end() - match.start()
+            if match.end() < len(data):
+                self._close_run()
+
+    def end_contig(self) -> None:
+        """Fold the current contig into the totals."""
+        if not self._open:
+            return
+        self._close_run()
+        self.lengths.append(self._length)
+        self.gc_bases += self._gc
+        self.n_bases += self._n
+        called = self._length - self._n
+        if called:
+            self.gc_histogram[round(self._gc * 100 / called)] += 1
+        self._open = False
+
+    def _close_run(self) -> None:
+        """Record the N-run in progress as a gap."""
+        if self._run:
+            self.gap_count += 1
+            self.gap_total_length += self._run
+            self.longest_gap = max(self.longest_gap, self._run)
+            self._run = 0
+
+    @property
+    def total_length(self) -> int:
+        """Combined length of all contigs."""
+        return sum(self.lengths)
+
+    def nx(self, fraction: float) -> Tuple[int, int]:
+        """
+        Compute an Nx/Lx pair, e.g. N50/L50 for ``fraction=0.5``.
+
+        Args:
+            fraction: Share of the total length to cover (0-1)
+
+        Returns:
+            Tuple of (length of the contig reaching the share, number of
+            contigs needed), or (0, 0) for an empty assembly
+        """
+        ordered = sorted(self.lengths, reverse=True)
+        target = self.total_length * fraction
+        for count, covered in enumerate(accumulate(ordered), start=1):
+            if covered >= target:
+                return ordered[count - 1], count
+        return 0, 0
+
+    def length_histogram(self) -> List[Tuple[int, Optional[int], int]]:
+        """
+        Count contigs per order-of-magnitude length bin.
+
+        Returns:
+            List of (min_length, exclusive max_length, count), with None as the
+            upper bound of the last bin
+        """
+        counts = {}
+        for length in self.lengths:
+            digits = len(str(length))
+            counts[digits] = counts.get(digits, 0) + 1
+        if not counts:
+            return []
+        bins = []
+        # Contigs shorter than 10 bases share the first bin
+        for digits in range(min(counts), max(counts) + 1):
+            low = 0 if digits == 1 else 10 ** (digits - 1)
+            high = 10 ** digits if digits < max(counts) else None
+            bins.append((low, high, counts.get(digits, 0)))
+        return bins
+
+
+def scan_assembly(stream: BinaryIO, read_size: int = ASSEMBLY_READ_SIZE) -> AssemblyStatistics:
+    """
+    Compute assembly statistics from a FASTA stream in one pass.
+
+    Text before the first '>' header is ignored, as with Bio.SeqIO.
+
+    Args:
+        stream: Readable binary stream
+        read_size: Bytes requested per read
+
+    Returns:
+        Populated AssemblyStatistics
+    """
+    statistics = AssemblyStatistics()
+    in_header = False
+    in_preamble = True
+    at_line_start = True
+
+    while True:
+        block = stream.read(read_size)
+        if not block:
+            break
+
+        position = 0
+        size = len(block)
+        while position < size:
+            if in_header:
+                newline = block.find(b"\n", position)
+                if newline == -1:
+                    break
+                in_header = False
+                position = newline + 1
+                at_line_start = True
+                continue
+
+            if at_line_start and block[position:position + 1] == b">":
+                statistics.start_contig()
+                in_header = True
+                in_preamble = False
+                continue
+
+            # Sequence runs until the next line that starts with '>'
+            header = block.find(b"\n>", position)
+            end = size if header == -1 else header + 1
+            if not in_preamble:
+                statistics.add_sequence(block[position:end].translate(None, SEQUENCE_WHITESPACE))
+            position = end
+            at_line_start = block[end - 1:end] == b"\n"
+
+    statistics.end_contig()
+    return statistics
@@ -2,6 +2,8 @@
 Authentication service for user registration, login, and token management.
 """
 from datetime import timedelta
+from typing import Optional, Union
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
@@ -11,6 +13,9 @@ from app.crud import user as user_crud
 from app.utils.security import (
     get_password_hash,
     verify_password,
+    get_password_hash_async,
+    verify_password_async,
+    password_needs_rehash,
     create_jwt_token,
     ACCESS_TOKEN_EXPIRE_HOURS
 )
@@ -23,10 +28,13 @@ class AuthService:
     This service manages user registration, authentication, and JWT token generation.
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Union[Session, AsyncSession]):
         """
         Initialize the authentication service.
         
+        The synchronous methods need a Session; the ``*_async`` methods
+        accept either and use the async CRUD functions for an AsyncSession.
+        
         Args:
             db: Database session for performing database operations
         """
@@ -49,12 +57,7 @@ class AuthService:
             HTTPException: 400 if email already exists
         """
         # Check if email already exists
-        existing_user = user_crud.get_user_by_email(self.db, user_data.email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
+        self._ensure_email_available(user_data.email)
         
         # Hash the password
         hashed_password = get_password_hash(user_data.password)
@@ -64,6 +67,63 @@ class AuthService:
         
         return user
     
+    async def register_user_async(self, user_data: UserCreate) -> User:
+        """
+        Register a new user, hashing the password on the dedicated executor.
+        
+        Args:
+            user_data: User registration data containing name, email, and password
+            
+        Returns:
+            Created User object
+            
+        Raises:
+            HTTPException: 400 if email already exists, 503 if hashing is saturated
+        """
+        if await self._get_user_by_email_async(user_data.email):
+            raise self._email_taken()
+        
+        hashed_password = await get_password_hash_async(user_data.password)
+        
+        if isinstance(self.db, AsyncSession):
+            return await user_crud.create_user_async(self.db, user_data, hashed_password)
+        return user_crud.create_user(self.db, user_data, hashed_password)
+    
+    def _ensure_email_available(self, email: str) -> None:
+        """
+        Check that no account uses the given email.
+        
+        Args:
+            email: Email address to check
+            
+        Raises:
+            HTTPException: 400 if email already exists
+        """
+        existing_user = user_crud.get_user_by_email(self.db, email)
+        if existing_user:
+            raise self._email_taken()
+    
+    async def _get_user_by_email_async(self, email: str) -> Optional[User]:
+        """
+        Look up a user by email with whichever session type the service holds.
+        
+        Args:
+            email: Email address to look up
+            
+        Returns:
+            User object if found, None otherwise
+        """
+        if isinstance(self.db, AsyncSession):
+            return await user_crud.get_user_by_email_async(self.db, email)
+        return user_crud.get_user_by_email(self.db, email)
+    
+    def _email_taken(self) -> HTTPException:
+        """Build the 400 response raised for an already registered email."""
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+    
     def authenticate_user(self, email: str, password: str) -> User:
         """
         Authenticate user credentials.
@@ -85,14 +145,54 @@ class AuthService:
         
         # Verify user exists and password is correct
         if not user or not verify_password(password, user.hashed_password):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid email or password",
-                headers={"WWW-Authenticate": "Bearer"},
+            raise self._invalid_credentials()
+        
+        # Transparently upgrade hashes made with a different cost factor
+        if password_needs_rehash(user.hashed_password):
+            user = user_crud.update_user(
+                self.db, user, hashed_password=get_password_hash(password)
             )
         
         return user
     
+    async def authenticate_user_async(self, email: str, password: str) -> User:
+        """
+        Authenticate user credentials, running bcrypt on the dedicated executor.
+        
+        Args:
+            email: User's email address
+            password: User's plain text password
+            
+        Returns:
+            User object if credentials are valid
+            
+        Raises:
+            HTTPException: 401 if credentials are invalid, 503 if hashing is saturated
+        """
+        user = await self._get_user_by_email_async(email)
+        
+        if not user or not await verify_password_async(password, user.hashed_password):
+            raise self._invalid_credentials()
+        
+        if password_needs_rehash(user.hashed_password):
+            hashed_password = await get_password_hash_async(password)
+            if isinstance(self.db, AsyncSession):
+                user = await user_crud.update_user_async(
+                    self.db, user, hashed_password=hashed_password
+                )
+            else:
+                user = user_crud.update_user(self.db, user, hashed_password=hashed_password)
+        
+        return user
+    
+    def _invalid_credentials(self) -> HTTPException:
+        """Build the 401 response raised for bad credentials."""
+        return HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
     def create_access_token(self, user: User) -> str:
         """
         Create JWT access token for authenticated user.
@@ -0,0 +1,162 @@
+"""
+Bytes-level FASTA reader.
+
+Splits records with bulk ``split``/``translate`` operations on large byte
+blocks instead of per-line string handling, and avoids the decode/StringIO
+copies of the generic Biopython path.
+"""
+import mmap
+from typing import BinaryIO, Iterator, List, Tuple, Union
+
+# Bytes requested from the underlying stream per read
+FASTA_READ_SIZE = 256 * 1024
+
+# Bytes stripped from sequence lines
+SEQUENCE_WHITESPACE = b" \t\r\n\v\f"
+
+# Individual whitespace bytes, for bounded find() calls on a buffer
+_WHITESPACE_BYTES = tuple(bytes([byte]) for byte in SEQUENCE_WHITESPACE)
+
+# (record_id, description, sequence)
+FastaRecord = Tuple[str, str, str]
+
+# (record_id, description, sequence view)
+FastaView = Tuple[str, str, memoryview]
+
+
+def iter_fasta(stream: BinaryIO, read_size: int = FASTA_READ_SIZE) -> Iterator[FastaRecord]:
+    """
+    Lazily parse FASTA records from a binary stream.
+
+    Only the record currently being assembled is held in memory. Text
+    before the first '>' header is ignored, as with Bio.SeqIO.
+
+    Args:
+        stream: Readable binary stream
+        read_size: Bytes requested per read
+
+    Yields:
+        Tuple of (record_id, description, sequence)
+
+    Raises:
+        UnicodeDecodeError: If headers or sequences are not valid UTF-8
+    """
+    pending: List[bytes] = []
+    at_line_start = True
+
+    while True:
+        chunk = stream.read(read_size)
+        if not chunk:
+            break
+
+        # A header starting exactly at the chunk boundary ends the pending record
+        if at_line_start and chunk[:1] == b">" and pending:
+            yield from iter_fasta_bytes(b"".join(pending))
+            pending = []
+
+        cut = chunk.rfind(b"\n>")
+        if cut == -1:
+            pending.append(chunk)
+        else:
+            pending.append(chunk[:cut + 1])
+            yield from iter_fasta_bytes(b"".join(pending))
+            pending = [chunk[cut + 1:]]
+
+        at_line_start = chunk.endswith(b"\n")
+
+    if pending:
+        yield from iter_fasta_bytes(b"".join(pending))
+
+
+def iter_fasta_bytes(data: bytes) -> Iterator[FastaRecord]:
+    """
+    Parse every FASTA record in an in-memory block.
+
+    Args:
+        data: Bytes-like block starting at a line boundary
+
+    Yields:
+        Tuple of (record_id, description, sequence)
+
+    Raises:
+        UnicodeDecodeError: If headers or sequences are not valid UTF-8
+    """
+    if data[:1] == b">":
+        blocks = data[1:].split(b"\n>")
+    else:
+        # Validate and discard anything before the first header
+        preamble, *blocks = data.split(b"\n>")
+        preamble.decode("utf-8")
+
+    for block in blocks:
+        header, _, body = block.partition(b"\n")
+        description = header.rstrip().decode("utf-8")
+        fields = description.split(None, 1)
+        record_id = fields[0] if fields else ""
+        sequence = body.translate(None, SEQUENCE_WHITESPACE).decode("utf-8")
+        yield record_id, description, sequence
+
+
+def iter_fasta_buffer(buffer: Union[bytes, mmap.mmap], start: int = 0) -> Iterator[FastaView]:
+    """
+    Parse FASTA records in place from a bytes-like buffer such as an mmap.
+
+    Record boundaries are located with ``find`` on the buffer itself, so
+    nothing is copied onto the Python heap for sequences that sit on a
+    single line; they are yielded as memoryview slices of the buffer.
+    Only sequences wrapped over several lines (or containing other
+    whitespace) are copied, with the whitespace stripped.
+
+    The views share the buffer's memory: callers must release each one
+    (``with view:``) and close this generator before closing an mmap.
+
+    Args:
+        buffer: Bytes-like object supporting ``find`` and the buffer protocol
+        start: Offset of the file content within the buffer
+
+    Yields:
+        Tuple of (record_id, description, sequence view)
+
+    Raises:
+        UnicodeDecodeError: If headers or the preamble are not valid UTF-8
+    """
+    end = len(buffer)
+    with memoryview(buffer) as view:
+        # Validate and discard anything before the first header
+        if buffer[start:start + 1] == b">":
+            header_start = start + 1
+        else:
+            boundary = buffer.find(b"\n>", start)
+            str(view[start:end if boundary == -1 else boundary], "utf-8")
+            if boundary == -1:
+                return
+            header_start = boundary + 2
+
+        while header_start <= end:
+            boundary = buffer.find(b"\n>", header_start)
+            record_end = end if boundary == -1 else boundary
+
+            header_end = buffer.find(b"\n", header_start, record_end)
+            if header_end == -1:
+                header_end = record_end
+            description = str(view[header_start:header_end], "utf-8").rstrip()
+            fields = description.split(None, 1)
+            record_id = fields[0] if fields else ""
+
+            # Trim trailing line endings, then check the body is one clean line
+            body_start = min(header_end + 1, record_end)
+            body_end = record_end
+            while body_end > body_start and buffer[body_end - 1] in SEQUENCE_WHITESPACE:
+                body_end -= 1
+            if any(buffer.find(byte, body_start, body_end) != -1 for byte in _WHITESPACE_BYTES):
+                sequence = memoryview(
+                    view[body_start:body_end].tobytes().translate(None, SEQUENCE_WHITESPACE)
+                )
+            else:
+                sequence = view[body_start:body_end]
+
+            yield record_id, description, sequence
+
+            if boundary == -1:
+                break
+            header_start = boundary + 2
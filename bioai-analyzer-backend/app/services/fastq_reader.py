@@ -0,0 +1,209 @@
+"""
+Streaming FASTQ reader and one-pass read statistics.
+
+Reads are collected in batches of a fixed base budget and every statistic
+is aggregated with numpy array operations across the whole batch instead of
+per read, so a multi-million-read file is summarized in a single pass with
+memory bounded by the budget and the longest read, whatever the read length.
+"""
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Bases aggregated per numpy pass; a batch ends with the read that reaches it
+FASTQ_BATCH_BASES = 8 * 1024 * 1024
+
+# Sanger / Illumina 1.8+ quality encoding
+PHRED_OFFSET = 33
+
+# One GC-content bin per whole percent, 0-100
+GC_BINS = 101
+
+# Byte-indexed lookup tables marking G/C (including IUPAC S) and N bases
+_GC_TABLE = np.zeros(256, dtype=bool)
+_GC_TABLE[list(b"GCSgcs")] = True
+_N_TABLE = np.zeros(256, dtype=bool)
+_N_TABLE[list(b"Nn")] = True
+
+# (sequences, qualities) of one batch
+FastqBatch = Tuple[List[bytes], List[bytes]]
+
+
+def iter_fastq_batches(stream: BinaryIO, batch_bases: int = FASTQ_BATCH_BASES) -> Iterator[FastqBatch]:
+    """
+    Lazily read four-line FASTQ records from a binary stream in batches.
+
+    Batches are cut by total bases rather than by read count, so long-read
+    files do not produce huge batches and short-read files tiny ones.
+
+    Args:
+        stream: Readable binary stream
+        batch_bases: Bases per batch; the read that reaches it ends the batch
+
+    Yields:
+        Tuple of (sequences, qualities) with line endings removed
+
+    Raises:
+        ValueError: If a record is malformed or truncated
+    """
+    sequences: List[bytes] = []
+    qualities: List[bytes] = []
+    lines = iter(stream)
+    record_number = 0
+    bases = 0
+
+    for header in lines:
+        # Tolerate blank lines between records and at the end of the file
+        if not header.strip():
+            continue
+        record_number += 1
+        if header[:1] != b"@":
+            raise ValueError(f"Record {record_number}: header line must start with '@'")
+
+        sequence = next(lines, None)
+        separator = next(lines, None)
+        quality = next(lines, None)
+        if quality is None:
+            raise ValueError(f"Record {record_number}: truncated record")
+        if separator[:1] != b"+":
+            raise ValueError(f"Record {record_number}: separator line must start with '+'")
+
+        sequence = sequence.rstrip(b"\r\n")
+        quality = quality.rstrip(b"\r\n")
+        if len(sequence) != len(quality):
+            raise ValueError(
+                f"Record {record_number}: sequence and quality lengths differ"
+            )
+
+        sequences.append(sequence)
+        qualities.append(quality)
+        bases += len(sequence)
+        if bases >= batch_bases:
+            yield sequences, qualities
+            sequences, qualities = [], []
+            bases = 0
+
+    if sequences:
+        yield sequences, qualities
+
+
+class FastqStatistics:
+    """
+    Running per-read and per-position statistics over FASTQ batches.
+
+    Per-position arrays grow to the longest read seen; everything else is
+    a fixed-size accumulator, so memory does not depend on the read count.
+    """
+
+    def __init__(self):
+        self.read_count = 0
+        self.total_bases = 0
+        self.min_length: Optional[int] = None
+        self.max_length = 0
+        self.length_counts: Dict[int, int] = {}
+        self.gc_bases = 0
+        self.n_bases = 0
+        self.quality_total = 0
+        self.gc_histogram = np.zeros(GC_BINS, dtype=np.int64)
+        self.quality_sums = np.zeros(0, dtype=np.int64)
+        self.position_counts = np.zeros(0, dtype=np.int64)
+        self.n_counts = np.zeros(0, dtype=np.int64)
+
+    def add_batch(self, sequences: List[bytes], qualities: List[bytes]) -> None:
+        """
+        Fold a batch of reads into the running statistics.
+
+        Per-base arrays use the narrowest dtypes that fit: uint8 for quality
+        scores and int32 for read lengths, read indexes and positions, which
+        a batch of FASTQ_BATCH_BASES bases cannot overflow.
+
+        Args:
+            sequences: Read sequences
+            qualities: Phred+33 quality strings, one per read
+
+        Raises:
+            ValueError: If a quality character is below the Phred+33 range
+        """
+        read_count = len(sequences)
+        if not read_count:
+            return
+
+        lengths = np.fromiter(map(len, sequences), dtype=np.int32, count=read_count)
+        bases = np.frombuffer(b"".join(sequences), dtype=np.uint8)
+        phred = np.frombuffer(b"".join(qualities), dtype=np.uint8)
+        if phred.size and phred.min() < PHRED_OFFSET:
+            raise ValueError("Quality scores are not Phred+33 encoded")
+        phred = phred - np.uint8(PHRED_OFFSET)
+
+        # Read index and position within the read for every base in the batch
+        read_index = np.repeat(np.arange(read_count, dtype=np.int32), lengths)
+        starts = np.cumsum(lengths, dtype=np.int32) - lengths
+        positions = np.arange(bases.size, dtype=np.int32) - np.repeat(starts, lengths)
+
+        width = int(lengths.max())
+        self._grow(width)
+        self.quality_sums[:width] += np.bincount(
+            positions, weights=phred, minlength=width
+        ).astype(np.int64)
+        self.position_counts[:width] += np.bincount(positions, minlength=width)
+
+        is_n = _N_TABLE[bases]
+        self.n_counts[:width] += np.bincount(positions[is_n], minlength=width)
+
+        is_gc = _GC_TABLE[bases]
+        gc_per_read = np.bincount(read_index[is_gc], minlength=read_count)
+        non_empty = lengths > 0
+        gc_percent = np.rint(gc_per_read[non_empty] * 100 / lengths[non_empty]).astype(np.uint8)
+        self.gc_histogram += np.bincount(gc_percent, minlength=GC_BINS)
+
+        values, counts = np.unique(lengths, return_counts=True)
+        for length, count in zip(values.tolist(), counts.tolist()):
+            self.length_counts[length] = self.length_counts.get(length, 0) + count
+
+        self.read_count += read_count
+        self.total_bases += int(bases.size)
+        self.gc_bases += int(is_gc.sum())
+        self.n_bases += int(is_n.sum())
+        self.quality_total += int(phred.sum(dtype=np.int64))
+        batch_min = int(values[0])
+        self.min_length = batch_min if self.min_length is None else min(self.min_length, batch_min)
+        self.max_length = max(self.max_length, width)
+
+    def _grow(self, width: int) -> None:
+        """Extend the per-position arrays to cover reads of ``width`` bases."""
+        extra = width - self.position_counts.size
+        if extra > 0:
+            padding = np.zeros(extra, dtype=np.int64)
+            self.quality_sums = np.concatenate([self.quality_sums, padding])
+            self.position_counts = np.concatenate([self.position_counts, padding])
+            self.n_counts = np.concatenate([self.n_counts, padding])
+
+    def per_position_mean_quality(self) -> List[float]:
+        """Mean Phred quality at each read position."""
+        covered = np.maximum(self.position_counts, 1)
+        return np.round(self.quality_sums / covered, 2).tolist()
+
+    def per_position_n_content(self) -> List[float]:
+        """Percentage of N calls at each read position."""
+        covered = np.maximum(self.position_counts, 1)
+        return np.round(self.n_counts * 100 / covered, 2).tolist()
+
+
+def summarize_fastq(stream: BinaryIO, batch_bases: int = FASTQ_BATCH_BASES) -> FastqStatistics:
+    """
+    Compute read statistics for a FASTQ stream in a single pass.
+
+    Args:
+        stream: Readable binary stream
+        batch_bases: Bases aggregated per numpy pass
+
+    Returns:
+        Populated FastqStatistics
+
+    Raises:
+        ValueError: If the file is malformed
+    """
+    statistics = FastqStatistics()
+    for sequences, qualities in iter_fastq_batches(stream, batch_bases):
+        statistics.add_batch(sequences, qualities)
+    return statistics
@@ -1,16 +1,130 @@
 """
-File parsing service for handling FASTA and GenBank format files.
+File parsing service for handling FASTA, GenBank and FASTQ format files,
+optionally gzip, bzip2 or xz compressed.
 """
-from typing import Tuple
-from io import StringIO
+import bz2
+import copy
+import gzip
+import io
+import lzma
+import mmap
+import os
+from collections import Counter
+from contextlib import closing
+from functools import lru_cache
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
 from fastapi import HTTPException
-from Bio import SeqIO
+from app.schemas.analysis import (
+    FastqSummary,
+    LengthHistogramBin,
+    AssemblyStatsResult,
+    CdsComposition,
+    GenBankFeatureResult,
+    GenBankFeatureTable
+)
+from app.services.assembly_stats import scan_assembly
+from app.services.fasta_reader import iter_fasta, iter_fasta_buffer
+from app.services.genbank_features import GenBankFeature, GenBankRecord, read_genbank_record
+
+# Lookup tables shared by every parse, built once at import time
+FASTA_EXTENSIONS = ('.fasta', '.fa')
+GENBANK_EXTENSIONS = ('.gb', '.gbk')
+FASTQ_EXTENSIONS = ('.fastq', '.fq')
+COMPRESSION_EXTENSIONS = {
+    '.gz': 'gzip',
+    '.bgz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+}
+PROTEIN_ONLY_CHARS = frozenset('EFILPQZ')
+
+# Feature keys returned by FileService.extract_features() by default
+DEFAULT_FEATURE_TYPES = ('CDS', 'gene', 'rRNA')
+
+# Bytes pulled from an upload per read; bounds per-upload parser memory
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Representative documents parsed by FileService.warm_up()
+WARM_UP_FASTA = b">warm_up\nATGCATGCATGC\n"
+WARM_UP_GENBANK = b"""LOCUS       WARM_UP                   12 bp    DNA     linear   UNK 01-JAN-1980
+DEFINITION  Warm-up sequence
+ACCESSION   WARM_UP
+VERSION     WARM_UP
+FEATURES             Location/Qualifiers
+ORIGIN
+        1 atgcatgcat gc
+//
+"""
+
+
+class SequenceRecord(NamedTuple):
+    """A single parsed record from an uploaded sequence file."""
+    record_id: str
+    description: str
+    sequence: str
+    sequence_type: str
+
+
+class _SizeLimitedReader(io.RawIOBase):
+    """
+    Raw binary reader that raises 413 once more than ``limit`` bytes are read.
+    """
+    
+    def __init__(self, stream: BinaryIO, limit: int, detail: str, owns_stream: bool = False):
+        self._stream = stream
+        self._limit = limit
+        self._detail = detail
+        self._owns_stream = owns_stream
+        self.bytes_read = 0
+    
+    def close(self) -> None:
+        if not self.closed and self._owns_stream:
+            self._stream.close()
+        super().close()
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        data = self._stream.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        self.bytes_read += size
+        if self.bytes_read > self._limit:
+            raise HTTPException(status_code=413, detail=self._detail)
+        return size
 
 
 class FileService:
     """Service for parsing biological sequence files."""
     
-    MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB in bytes
+    MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE", str(10 * 1024 * 1024)))  # 10MB in bytes
+    MAX_DECOMPRESSED_SIZE = int(os.getenv("MAX_DECOMPRESSED_SIZE", str(100 * 1024 * 1024)))  # 100MB
+    MMAP_THRESHOLD = int(os.getenv("MMAP_THRESHOLD", str(1024 * 1024)))  # 1MB, Starlette's spool size
+    
+    def with_size_limit(self, max_file_size: int) -> "FileService":
+        """
+        Copy the service with a different upload size limit.
+        
+        The decompressed limit is raised to match if it is lower.
+        
+        Args:
+            max_file_size: Largest accepted upload in bytes
+            
+        Returns:
+            FileService enforcing max_file_size instead of MAX_FILE_SIZE
+        """
+        limited = copy.copy(self)
+        limited.MAX_FILE_SIZE = max_file_size
+        limited.MAX_DECOMPRESSED_SIZE = max(self.MAX_DECOMPRESSED_SIZE, max_file_size)
+        return limited
+    
+    def warm_up(self) -> None:
+        """
+        Parse representative files so both parsers are loaded at startup.
+        """
+        self.parse_file(WARM_UP_FASTA, "warm_up.fasta")
+        self.parse_file(WARM_UP_GENBANK, "warm_up.gb")
     
     def parse_file(self, file_content: bytes, filename: str) -> Tuple[str, str]:
         """
@@ -28,33 +142,372 @@ class FileService:
         """
         # Validate file size
         if len(file_content) > self.MAX_FILE_SIZE:
+            raise self._file_too_large()
+        
+        return self.parse_stream(io.BytesIO(file_content), filename)
+    
+    def parse_stream(self, stream: BinaryIO, filename: str) -> Tuple[str, str]:
+        """
+        Parse the first record of a FASTA or GenBank file from a binary stream.
+        
+        Args:
+            stream: Readable binary file object (e.g. UploadFile.file)
+            filename: Name of the uploaded file
+            
+        Returns:
+            Tuple of (sequence, sequence_type)
+            
+        Raises:
+            HTTPException: If file is invalid, too large, or cannot be parsed
+        """
+        records = self.iter_records(stream, filename)
+        try:
+            record = next(records)
+        except StopIteration:
             raise HTTPException(
-                status_code=413,
-                detail="File size exceeds maximum limit of 10MB"
+                status_code=400,
+                detail="File contains no valid sequences"
             )
+        finally:
+            records.close()
+        
+        return record.sequence, record.sequence_type
+    
+    def iter_records(self, stream: BinaryIO, filename: str) -> Iterator[SequenceRecord]:
+        """
+        Lazily yield every record of a FASTA or GenBank file.
+        
+        The stream is decompressed (for .gz/.bz2/.xz names), decoded and
+        parsed in fixed-size chunks, so memory use does not grow with the
+        file size. Reading stops with 413 as soon as more than MAX_FILE_SIZE
+        compressed or MAX_DECOMPRESSED_SIZE decompressed bytes have been
+        consumed. Uncompressed FASTA uploads of at least MMAP_THRESHOLD
+        bytes that are backed by a real file are memory-mapped and parsed
+        in place instead, and spooled uploads still held in memory are parsed
+        straight from their buffer.
         
+        Args:
+            stream: Readable binary file object (e.g. UploadFile.file)
+            filename: Name of the uploaded file
+            
+        Yields:
+            SequenceRecord for each record, in file order
+            
+        Raises:
+            HTTPException: If file is invalid, too large, or cannot be parsed
+        """
         # Detect file format from extension
         file_format = self._detect_format(filename)
         
-        # Parse file and extract sequence
+        # Reject seekable (spooled) uploads by size before parsing anything
+        size = self._check_size(stream)
+        
+        mapped = binary = parsed = None
+        if (
+            file_format == 'fasta'
+            and size is not None
+            and size >= self.MMAP_THRESHOLD
+            and self._detect_compression(filename) is None
+        ):
+            mapped = self._map_stream(stream)
+        if mapped is None:
+            binary = self._open_binary(stream, filename)
+        
+        # Parse file and extract sequences
         try:
-            content_str = file_content.decode('utf-8')
-            handle = StringIO(content_str)
+            if mapped is not None:
+                # In-place path; records are sliced from the mapping or spool buffer
+                parsed = self._iter_mapped_fasta(mapped, stream.tell())
+            elif file_format == 'fasta':
+                # Bytes-level fast path; no decode/StringIO copy of the file
+                parsed = iter_fasta(binary)
+            else:
+                # Biopython is imported on first use (or during warm-up)
+                from Bio import SeqIO
+                
+                handle = io.TextIOWrapper(binary, encoding='utf-8')
+                parsed = (
+                    (record.id, record.description, str(record.seq))
+                    for record in SeqIO.parse(handle, file_format)
+                )
             
-            # Read first sequence from file
-            record = next(SeqIO.parse(handle, file_format))
-            sequence = str(record.seq)
+            for record_id, description, sequence in parsed:
+                yield SequenceRecord(
+                    record_id=record_id,
+                    description=description,
+                    sequence=sequence,
+                    sequence_type=self._detect_sequence_type(sequence)
+                )
+        except HTTPException:
+            raise
+        except UnicodeDecodeError:
+            raise HTTPException(
+                status_code=400,
+                detail="File encoding is not valid UTF-8"
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Failed to parse file: {str(e)}"
+            )
+        finally:
+            # Release views into the mapping before unmapping it
+            if parsed is not None:
+                parsed.close()
+            # Closes the wrappers, decompressor or mapping, not the caller's stream
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+            if binary is not None:
+                binary.close()
+    
+    def detect_format(self, filename: str) -> str:
+        """
+        Detect the format of an upload from its name.
+        
+        Args:
+            filename: Name of the uploaded file, optionally with a compression suffix
             
-            # Auto-detect sequence type
-            sequence_type = self._detect_sequence_type(sequence)
+        Returns:
+            'fasta', 'genbank' or 'fastq'
+            
+        Raises:
+            HTTPException: If file format is not supported
+        """
+        return self._detect_format(filename)
+    
+    def is_fasta(self, filename: str) -> bool:
+        """
+        Check whether an upload is a (possibly compressed) FASTA file.
+        
+        Args:
+            filename: Name of the uploaded file
             
-            return sequence, sequence_type
+        Returns:
+            True for .fasta/.fa files
             
-        except StopIteration:
+        Raises:
+            HTTPException: If file format is not supported
+        """
+        return self._detect_format(filename) == 'fasta'
+    
+    def detect_sequence_type(self, sequence: str) -> str:
+        """
+        Auto-detect if a sequence is DNA, RNA, or Protein.
+        
+        Args:
+            sequence: The biological sequence string
+            
+        Returns:
+            Sequence type: "DNA", "RNA", or "Protein"
+        """
+        return self._detect_sequence_type(sequence)
+    
+    def is_fastq(self, filename: str) -> bool:
+        """
+        Check whether an upload is a (possibly compressed) FASTQ file.
+        
+        Args:
+            filename: Name of the uploaded file
+            
+        Returns:
+            True for .fastq/.fq files
+            
+        Raises:
+            HTTPException: If file format is not supported
+        """
+        return self._detect_format(filename) == 'fastq'
+    
+    def summarize_fastq(self, stream: BinaryIO, filename: str) -> FastqSummary:
+        """
+        Compute read-level quality statistics for a FASTQ upload.
+        
+        Reads are aggregated in batches with array operations rather than
+        analyzed one by one, in a single streaming pass with the same size
+        limits as iter_records().
+        
+        Args:
+            stream: Readable binary file object (e.g. UploadFile.file)
+            filename: Name of the uploaded file
+            
+        Returns:
+            FastqSummary with length, quality, GC and N statistics
+            
+        Raises:
+            HTTPException: If file is invalid, too large, or contains no reads
+        """
+        # numpy is only loaded once a FASTQ file is actually uploaded
+        from app.services.fastq_reader import summarize_fastq
+        
+        self._check_size(stream)
+        binary = self._open_binary(stream, filename)
+        try:
+            statistics = summarize_fastq(binary)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Failed to parse file: {str(e)}"
+            )
+        finally:
+            binary.close()
+        
+        if statistics.read_count == 0:
             raise HTTPException(
                 status_code=400,
                 detail="File contains no valid sequences"
             )
+        
+        total_bases = max(statistics.total_bases, 1)
+        return FastqSummary(
+            filename=filename,
+            read_count=statistics.read_count,
+            total_bases=statistics.total_bases,
+            min_length=statistics.min_length,
+            max_length=statistics.max_length,
+            mean_length=round(statistics.total_bases / statistics.read_count, 2),
+            length_distribution=statistics.length_counts,
+            mean_quality=round(statistics.quality_total / total_bases, 2),
+            per_position_mean_quality=statistics.per_position_mean_quality(),
+            gc_content=round(statistics.gc_bases * 100 / total_bases, 2),
+            gc_distribution=statistics.gc_histogram.tolist(),
+            n_content=round(statistics.n_bases * 100 / total_bases, 2),
+            per_position_n_content=statistics.per_position_n_content()
+        )
+    
+    def assembly_statistics(self, stream: BinaryIO, filename: str) -> AssemblyStatsResult:
+        """
+        Compute assembly QC statistics for a multi-record FASTA file.
+        
+        The file is scanned once in large blocks; sequences are counted as
+        they stream past and only contig lengths are kept, with the same
+        size limits as iter_records().
+        
+        Args:
+            stream: Readable binary file object (e.g. UploadFile.file)
+            filename: Name of the uploaded file
+            
+        Returns:
+            AssemblyStatsResult with contiguity, GC and gap statistics
+            
+        Raises:
+            HTTPException: If the file is not FASTA, is too large, or has no records
+        """
+        if self._detect_format(filename) != 'fasta':
+            raise HTTPException(
+                status_code=400,
+                detail="Assembly statistics require a FASTA file"
+            )
+        
+        self._check_size(stream)
+        binary = self._open_binary(stream, filename)
+        try:
+            statistics = scan_assembly(binary)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Failed to parse file: {str(e)}"
+            )
+        finally:
+            binary.close()
+        
+        contig_count = len(statistics.lengths)
+        if contig_count == 0:
+            raise HTTPException(
+                status_code=400,
+                detail="File contains no valid sequences"
+            )
+        
+        total_length = statistics.total_length
+        called_bases = max(total_length - statistics.n_bases, 1)
+        n50, l50 = statistics.nx(0.5)
+        n90, l90 = statistics.nx(0.9)
+        return AssemblyStatsResult(
+            filename=filename,
+            contig_count=contig_count,
+            total_length=total_length,
+            min_length=min(statistics.lengths),
+            max_length=max(statistics.lengths),
+            mean_length=round(total_length / contig_count, 2),
+            n50=n50,
+            l50=l50,
+            n90=n90,
+            l90=l90,
+            gc_content=round(statistics.gc_bases * 100 / called_bases, 2),
+            gc_distribution=statistics.gc_histogram,
+            length_histogram=[
+                LengthHistogramBin(min_length=low, max_length=high, count=count)
+                for low, high, count in statistics.length_histogram()
+            ],
+            n_content=round(statistics.n_bases * 100 / max(total_length, 1), 2),
+            gap_count=statistics.gap_count,
+            gap_total_length=statistics.gap_total_length,
+            longest_gap=statistics.longest_gap
+        )
+    
+    def extract_features(
+        self,
+        stream: BinaryIO,
+        filename: str,
+        feature_types: Optional[Iterable[str]] = DEFAULT_FEATURE_TYPES,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> GenBankFeatureTable:
+        """
+        Return the feature table of the first record of a GenBank file.
+        
+        Features are selected by key and location before any qualifier is
+        parsed. Each selected CDS also gets its translation (honouring
+        /codon_start and /transl_table) and composition.
+        
+        Args:
+            stream: Readable binary file object (e.g. UploadFile.file)
+            filename: Name of the uploaded file
+            feature_types: Feature keys to include, or None for all
+            start: 1-based start of the region of interest, or None
+            end: 1-based inclusive end of the region of interest, or None
+            
+        Returns:
+            GenBankFeatureTable with the selected features
+            
+        Raises:
+            HTTPException: If the file is not GenBank, is invalid or too large
+        """
+        if self._detect_format(filename) != 'genbank':
+            raise HTTPException(
+                status_code=400,
+                detail="Feature extraction requires a GenBank file"
+            )
+        
+        self._check_size(stream)
+        binary = self._open_binary(stream, filename)
+        try:
+            record = read_genbank_record(io.TextIOWrapper(binary, encoding='utf-8'))
+            if record is None:
+                raise HTTPException(
+                    status_code=400,
+                    detail="File contains no valid sequences"
+                )
+            
+            features = []
+            for feature in record.iter_features(feature_types, start, end):
+                translation = composition = None
+                if feature.type == 'CDS':
+                    translation, composition = self._translate_cds(record, feature)
+                features.append(GenBankFeatureResult(
+                    type=feature.type,
+                    location=feature.location,
+                    start=feature.start,
+                    end=feature.end,
+                    strand=feature.strand,
+                    qualifiers=feature.qualifiers,
+                    translation=translation,
+                    composition=composition
+                ))
+        except HTTPException:
+            raise
         except UnicodeDecodeError:
             raise HTTPException(
                 status_code=400,
@@ -65,26 +518,209 @@ class FileService:
                 status_code=400,
                 detail=f"Failed to parse file: {str(e)}"
             )
+        finally:
+            binary.close()
+        
+        return GenBankFeatureTable(
+            filename=filename,
+            record_id=record.record_id,
+            description=record.description,
+            sequence_length=len(record.sequence),
+            total_feature_count=len(record.features),
+            features=features
+        )
     
-    def _detect_format(self, filename: str) -> str:
+    def _translate_cds(
+        self,
+        record: GenBankRecord,
+        feature: GenBankFeature
+    ) -> Tuple[Optional[str], Optional[CdsComposition]]:
         """
-        Detect file format from extension.
+        Translate a CDS feature and summarize its composition.
+        
+        Args:
+            record: GenBankRecord the feature belongs to
+            feature: CDS GenBankFeature
+            
+        Returns:
+            Tuple of (translation, composition), or (None, None) if the
+            location cannot be resolved against the record sequence
+        """
+        from Bio.Seq import translate
+        
+        cds = record.feature_sequence(feature)
+        if not cds:
+            return None, None
+        
+        codon_start = int(feature.qualifier('codon_start', '1'))
+        table = int(feature.qualifier('transl_table', '1'))
+        coding = cds[codon_start - 1:]
+        coding = coding[:len(coding) - len(coding) % 3]
+        protein = translate(coding, table=table)
+        if protein.endswith('*'):
+            protein = protein[:-1]
+        
+        gc_count = cds.count('G') + cds.count('C')
+        amino_acid_counts = Counter(protein)
+        amino_acid_counts.pop('*', None)
+        return protein, CdsComposition(
+            length=len(cds),
+            gc_content=round(gc_count * 100 / len(cds), 2),
+            nucleotide_counts={base: cds.count(base) for base in 'ATGC'},
+            amino_acid_counts=dict(amino_acid_counts)
+        )
+    
+    def _check_size(self, stream: BinaryIO) -> Optional[int]:
+        """
+        Reject a seekable upload whose remaining size exceeds MAX_FILE_SIZE.
+        
+        Args:
+            stream: Upload stream; its position is left unchanged
+            
+        Returns:
+            Remaining size in bytes, or None for unseekable streams
+            
+        Raises:
+            HTTPException: If the file is too large
+        """
+        if not stream.seekable():
+            return None
+        position = stream.tell()
+        size = stream.seek(0, io.SEEK_END) - position
+        stream.seek(position)
+        if size > self.MAX_FILE_SIZE:
+            raise self._file_too_large()
+        return size
+    
+    def _map_stream(self, stream: BinaryIO) -> Optional[Union[mmap.mmap, bytes]]:
+        """
+        Expose an upload's content as a buffer without reading it through.
+        
+        Args:
+            stream: Upload stream (e.g. a SpooledTemporaryFile)
+            
+        Returns:
+            A read-only mapping of a file-backed upload, the buffer of a
+            spool still held in memory, or None for other streams
+        """
+        if not getattr(stream, "_rolled", True):
+            # SpooledTemporaryFile.fileno() rolls the spool over to disk,
+            # so parse an in-memory spool from its buffer instead
+            return stream._file.getvalue()
+        try:
+            stream.flush()
+            return mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            # In-memory streams (io.UnsupportedOperation is an OSError)
+            return None
+    
+    def _iter_mapped_fasta(
+        self,
+        mapped: Union[mmap.mmap, bytes],
+        start: int
+    ) -> Iterator[Tuple[str, str, str]]:
+        """
+        Parse FASTA records straight out of a memory mapping or buffer.
+        
+        Each sequence is decoded once, directly from its slice of the
+        mapping, and the slice is released before the next record.
+        
+        Args:
+            mapped: Read-only mapping or in-memory buffer of the upload
+            start: Offset of the unread content within the mapping
+            
+        Yields:
+            Tuple of (record_id, description, sequence)
+        """
+        with closing(iter_fasta_buffer(mapped, start)) as records:
+            for record_id, description, view in records:
+                with view:
+                    sequence = str(view, 'utf-8')
+                yield record_id, description, sequence
+    
+    def _open_binary(self, stream: BinaryIO, filename: str) -> BinaryIO:
+        """
+        Wrap an upload in size-limited, buffered (and decompressing) readers.
+        
+        Args:
+            stream: Raw upload stream
+            filename: Name of the uploaded file, used to detect compression
+            
+        Returns:
+            Buffered binary stream of the (decompressed) file content
+        """
+        compressed = io.BufferedReader(
+            _SizeLimitedReader(stream, self.MAX_FILE_SIZE, self._file_too_large().detail),
+            buffer_size=UPLOAD_CHUNK_SIZE
+        )
+        
+        compression = self._detect_compression(filename)
+        if compression is None:
+            return compressed
+        
+        # Multi-member gzip (including BGZF) is handled by GzipFile
+        if compression == 'gzip':
+            decompressor = gzip.GzipFile(fileobj=compressed, mode='rb')
+        elif compression == 'bz2':
+            decompressor = bz2.BZ2File(compressed, mode='rb')
+        else:
+            decompressor = lzma.LZMAFile(compressed, mode='rb')
+        
+        limit_mb = self.MAX_DECOMPRESSED_SIZE // (1024 * 1024)
+        return io.BufferedReader(
+            _SizeLimitedReader(
+                decompressor,
+                self.MAX_DECOMPRESSED_SIZE,
+                f"Decompressed file size exceeds maximum limit of {limit_mb}MB",
+                owns_stream=True
+            ),
+            buffer_size=UPLOAD_CHUNK_SIZE
+        )
+    
+    def _file_too_large(self) -> HTTPException:
+        """Build the 413 response raised for oversized files."""
+        limit_mb = self.MAX_FILE_SIZE // (1024 * 1024)
+        return HTTPException(
+            status_code=413,
+            detail=f"File size exceeds maximum limit of {limit_mb}MB"
+        )
+    
+    def _detect_compression(self, filename: str) -> Optional[str]:
+        """
+        Detect compression from the final file extension.
         
         Args:
             filename: Name of the file
             
         Returns:
-            Format string for Biopython SeqIO ('fasta' or 'genbank')
+            'gzip', 'bz2', 'xz', or None for uncompressed files
+        """
+        _, extension = os.path.splitext(filename.lower())
+        return COMPRESSION_EXTENSIONS.get(extension)
+    
+    def _detect_format(self, filename: str) -> str:
+        """
+        Detect file format from extension, ignoring a compression suffix.
+        
+        Args:
+            filename: Name of the file (e.g. "genome.fa" or "genome.fa.gz")
+            
+        Returns:
+            Format string for Biopython SeqIO ('fasta', 'genbank' or 'fastq')
             
         Raises:
             HTTPException: If file format is not supported
         """
         filename_lower = filename.lower()
+        if self._detect_compression(filename_lower) is not None:
+            filename_lower = os.path.splitext(filename_lower)[0]
         
-        if filename_lower.endswith(('.fasta', '.fa')):
+        if filename_lower.endswith(FASTA_EXTENSIONS):
             return 'fasta'
-        elif filename_lower.endswith(('.gb', '.gbk')):
+        elif filename_lower.endswith(GENBANK_EXTENSIONS):
             return 'genbank'
+        elif filename_lower.endswith(FASTQ_EXTENSIONS):
+            return 'fastq'
         else:
             raise HTTPException(
                 status_code=400,
@@ -104,8 +740,7 @@ class FileService:
         seq_upper = sequence.upper()
         
         # Check for protein-specific amino acids (not found in DNA/RNA)
-        protein_chars = set('EFILPQZ')
-        if any(char in seq_upper for char in protein_chars):
+        if not PROTEIN_ONLY_CHARS.isdisjoint(seq_upper):
             return "Protein"
         
         # Check for RNA (contains U instead of T)
@@ -114,3 +749,14 @@ class FileService:
         
         # Default to DNA
         return "DNA"
+
+
+@lru_cache(maxsize=None)
+def get_file_service() -> FileService:
+    """
+    Dependency returning the application-scoped FileService.
+    
+    Returns:
+        Shared FileService instance
+    """
+    return FileService()
@@ -0,0 +1,338 @@
+"""
+Lazy GenBank feature-table reader.
+
+Splits a GenBank record into raw feature blocks and parses only the key
+and location of each block up front. Qualifiers and the ORIGIN sequence
+are parsed on first access, so selecting a few features by type or region
+does not materialize every qualifier of a large annotated record.
+"""
+import re
+from functools import cached_property
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Column at which feature locations and qualifiers start
+FEATURE_TEXT_COLUMN = 21
+
+# Deletes positions, spaces and line endings from ORIGIN lines
+ORIGIN_STRIP_TABLE = str.maketrans('', '', '0123456789 \t\r\n')
+
+# One span of a location, e.g. "<1..206", "3300^3301" or "45"
+_SPAN_PATTERN = re.compile(r'<?(\d+)(?:(?:\.\.|\^)>?(\d+))?>?$')
+
+
+def parse_location(location: str) -> Optional[Tuple[List[Tuple[int, int]], int]]:
+    """
+    Parse a GenBank location into 1-based inclusive spans and a strand.
+
+    Handles plain, fuzzy (``<``/``>``), ``complement``, ``join`` and
+    ``order`` locations. Spans are returned in transcription order.
+
+    Args:
+        location: Location string from the feature table
+
+    Returns:
+        Tuple of (spans, strand) with strand 1 or -1, or None for locations
+        that cannot be resolved against this record (e.g. remote references)
+    """
+    text = location.replace(' ', '')
+    if ':' in text:
+        return None
+
+    strand = 1
+    if text.startswith('complement(') and text.endswith(')'):
+        strand = -1
+        text = text[len('complement('):-1]
+
+    for operator in ('join(', 'order('):
+        if text.startswith(operator) and text.endswith(')'):
+            text = text[len(operator):-1]
+            break
+
+    spans = []
+    part_strands = set()
+    for part in text.split(','):
+        part_strand = strand
+        if part.startswith('complement(') and part.endswith(')'):
+            part_strand = -strand
+            part = part[len('complement('):-1]
+        match = _SPAN_PATTERN.match(part)
+        if match is None:
+            return None
+        start = int(match.group(1))
+        end = int(match.group(2) or start)
+        spans.append((start, end))
+        part_strands.add(part_strand)
+
+    if len(part_strands) != 1:
+        # Mixed-strand joins are not resolved
+        return None
+    if strand == -1:
+        # complement(join(a,b)) is transcribed from b back to a, whereas
+        # join(complement(b),complement(a)) already lists spans in that order
+        spans.reverse()
+    return spans, part_strands.pop()
+
+
+class GenBankFeature:
+    """A feature-table entry whose qualifiers are parsed on first access."""
+
+    def __init__(self, feature_type: str, location: str, qualifier_lines: List[str]):
+        """
+        Initialize the feature.
+
+        Args:
+            feature_type: Feature key, e.g. "CDS"
+            location: Raw location string
+            qualifier_lines: Unparsed qualifier lines with indentation removed
+        """
+        self.type = feature_type
+        self.location = location
+        self._qualifier_lines = qualifier_lines
+
+    @cached_property
+    def _resolved(self) -> Tuple[List[Tuple[int, int]], int]:
+        """Spans and strand, parsed on first access; ([], 0) if unresolvable."""
+        return parse_location(self.location) or ([], 0)
+
+    @property
+    def spans(self) -> List[Tuple[int, int]]:
+        """1-based inclusive spans in transcription order."""
+        return self._resolved[0]
+
+    @property
+    def strand(self) -> int:
+        """1 for the forward strand, -1 for the reverse, 0 if unresolved."""
+        return self._resolved[1]
+
+    @property
+    def start(self) -> Optional[int]:
+        """Leftmost position of the feature, or None if unresolved."""
+        return min((start for start, _ in self.spans), default=None)
+
+    @property
+    def end(self) -> Optional[int]:
+        """Rightmost position of the feature, or None if unresolved."""
+        return max((end for _, end in self.spans), default=None)
+
+    def overlaps(self, start: Optional[int], end: Optional[int]) -> bool:
+        """
+        Check whether the feature overlaps a 1-based inclusive region.
+
+        Args:
+            start: Region start, or None for the start of the record
+            end: Region end, or None for the end of the record
+
+        Returns:
+            True if the feature overlaps the region
+        """
+        if start is None and end is None:
+            return True
+        if self.start is None:
+            return False
+        return (start is None or self.end >= start) and (end is None or self.start <= end)
+
+    @cached_property
+    def qualifiers(self) -> Dict[str, List[str]]:
+        """Qualifier values by key, in file order."""
+        qualifiers: Dict[str, List[str]] = {}
+        key = None
+        value_lines: List[str] = []
+
+        def flush() -> None:
+            if key is None:
+                return
+            # Translations wrap without spaces; other values wrap at words
+            separator = '' if key == 'translation' else ' '
+            value = separator.join(value_lines)
+            if len(value) >= 2 and value[0] == '"' and value[-1] == '"':
+                value = value[1:-1].replace('""', '"')
+            qualifiers.setdefault(key, []).append(value)
+
+        open_quote = False
+        for line in self._qualifier_lines:
+            if line.startswith('/') and not open_quote:
+                flush()
+                name, has_value, value = line[1:].partition('=')
+                key = name
+                value_lines = [value] if has_value else []
+            else:
+                value_lines.append(line)
+            open_quote = sum(part.count('"') for part in value_lines) % 2 == 1
+        flush()
+        return qualifiers
+
+    def qualifier(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Return the first value of a qualifier.
+
+        Args:
+            key: Qualifier name without the leading slash
+            default: Value returned if the qualifier is absent
+
+        Returns:
+            The qualifier value or the default
+        """
+        values = self.qualifiers.get(key)
+        return values[0] if values else default
+
+
+class GenBankRecord:
+    """
+    Header, raw feature table and raw sequence of one GenBank record.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        record_id: str,
+        description: str,
+        features: List[GenBankFeature],
+        origin_lines: List[str]
+    ):
+        self.name = name
+        self.record_id = record_id
+        self.description = description
+        self.features = features
+        self._origin_lines = origin_lines
+
+    @cached_property
+    def sequence(self) -> str:
+        """Upper-case record sequence, assembled from ORIGIN on first access."""
+        return ''.join(self._origin_lines).translate(ORIGIN_STRIP_TABLE).upper()
+
+    def iter_features(
+        self,
+        types: Optional[Iterable[str]] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> Iterator[GenBankFeature]:
+        """
+        Yield features of the given types overlapping a region.
+
+        Filtering only uses the key and location, so qualifiers of skipped
+        features are never parsed.
+
+        Args:
+            types: Feature keys to include, or None for all
+            start: 1-based region start, or None
+            end: 1-based inclusive region end, or None
+
+        Yields:
+            Matching GenBankFeature objects in file order
+        """
+        wanted = None if types is None else frozenset(types)
+        for feature in self.features:
+            if wanted is not None and feature.type not in wanted:
+                continue
+            if feature.overlaps(start, end):
+                yield feature
+
+    def feature_sequence(self, feature: GenBankFeature) -> Optional[str]:
+        """
+        Extract a feature's nucleotide sequence in transcription order.
+
+        Args:
+            feature: Feature of this record
+
+        Returns:
+            Sequence string, or None if the location could not be resolved
+        """
+        if not feature.spans:
+            return None
+        sequence = self.sequence
+        if any(end > len(sequence) for _, end in feature.spans):
+            return None
+        if feature.strand == -1:
+            # Complement first, then read the spans from the far end
+            from Bio.Seq import reverse_complement
+            return ''.join(
+                reverse_complement(sequence[start - 1:end]) for start, end in feature.spans
+            )
+        return ''.join(sequence[start - 1:end] for start, end in feature.spans)
+
+
+def read_genbank_record(lines: Iterable[str]) -> Optional[GenBankRecord]:
+    """
+    Read one GenBank record from text lines, stopping after its ``//`` line.
+
+    Args:
+        lines: Iterable of text lines (e.g. a text file object)
+
+    Returns:
+        The record, or None if no LOCUS line was found
+
+    Raises:
+        ValueError: If the record has no LOCUS line before its content
+    """
+    name = record_id = description = ''
+    accession = ''
+    features: List[GenBankFeature] = []
+    origin_lines: List[str] = []
+    section = None
+    seen_locus = False
+
+    feature_type = None
+    location_lines: List[str] = []
+    qualifier_lines: List[str] = []
+
+    def finish_feature() -> None:
+        if feature_type is not None:
+            features.append(GenBankFeature(feature_type, ''.join(location_lines), qualifier_lines))
+
+    for raw_line in lines:
+        line = raw_line.rstrip('\r\n')
+        if not line.strip() and not seen_locus:
+            continue
+        if line.startswith('//'):
+            break
+
+        keyword = line[:12].strip() if line[:1] != ' ' else ''
+        if keyword:
+            if section == 'FEATURES':
+                finish_feature()
+                feature_type = None
+            section = keyword.split()[0]
+            if section == 'LOCUS':
+                seen_locus = True
+                fields = line[12:].split()
+                name = fields[0] if fields else ''
+            elif not seen_locus:
+                raise ValueError("Record does not start with a LOCUS line")
+            elif section == 'DEFINITION':
+                description = line[12:].strip()
+            elif section == 'ACCESSION':
+                accession = line[12:].split()[0] if line[12:].split() else ''
+            elif section == 'VERSION':
+                record_id = line[12:].split()[0] if line[12:].split() else ''
+            continue
+
+        if section == 'DEFINITION':
+            description = f"{description} {line.strip()}"
+        elif section == 'ORIGIN':
+            origin_lines.append(line)
+        elif section == 'FEATURES':
+            if line[5:6] != ' ' and line[:5] == '     ':
+                # New feature key at column 6
+                finish_feature()
+                feature_type = line[5:FEATURE_TEXT_COLUMN].strip()
+                location_lines = [line[FEATURE_TEXT_COLUMN:].strip()]
+                qualifier_lines = []
+            elif feature_type is not None:
+                text = line[FEATURE_TEXT_COLUMN:].strip()
+                if qualifier_lines or text.startswith('/'):
+                    qualifier_lines.append(text)
+                else:
+                    location_lines.append(text)
+
+    if section == 'FEATURES':
+        finish_feature()
+
+    if not seen_locus:
+        return None
+    return GenBankRecord(
+        name=name,
+        record_id=record_id or accession or name,
+        description=description,
+        features=features,
+        origin_lines=origin_lines
+    )
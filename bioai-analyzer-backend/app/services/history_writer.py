@@ -0,0 +1,198 @@
+"""
+Write-behind persistence of analysis history.
+
+With HISTORY_WRITE_BEHIND enabled, /analyze returns as soon as a result is
+computed. The history row is put on a bounded in-process queue and a
+background task inserts queued rows in batches, one transaction per batch.
+A failed batch is retried with exponential backoff and then written row by
+row, so only the rows that still fail on their own are dropped.
+"""
+import asyncio
+import logging
+import os
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.analysis import create_history_entries_async
+from app.database import AsyncSessionLocal
+
+# Write-behind configuration
+HISTORY_WRITE_BEHIND = os.getenv("HISTORY_WRITE_BEHIND", "false").lower() in ("1", "true", "yes")
+HISTORY_QUEUE_SIZE = int(os.getenv("HISTORY_QUEUE_SIZE", "10000"))
+HISTORY_BATCH_SIZE = int(os.getenv("HISTORY_BATCH_SIZE", "500"))
+HISTORY_FLUSH_RETRIES = int(os.getenv("HISTORY_FLUSH_RETRIES", "3"))
+HISTORY_RETRY_BACKOFF_SECONDS = float(os.getenv("HISTORY_RETRY_BACKOFF_SECONDS", "0.5"))
+
+logger = logging.getLogger(__name__)
+
+# (user_id, sequence_type, input_sequence, results, created_at)
+HistoryEntry = Tuple[int, str, str, dict, datetime]
+
+
+class HistoryWriter:
+    """
+    Bounded queue of analysis history rows flushed by a background task.
+    
+    The task starts with the first submitted row, on the running event loop.
+    Rows submitted while the queue is full are refused, and the caller writes
+    them inline instead, so a slow database slows requests down rather than
+    growing the queue or dropping history.
+    """
+    
+    def __init__(
+        self,
+        enabled: bool = HISTORY_WRITE_BEHIND,
+        max_queue: int = HISTORY_QUEUE_SIZE,
+        batch_size: int = HISTORY_BATCH_SIZE,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        retries: int = HISTORY_FLUSH_RETRIES,
+        retry_backoff: float = HISTORY_RETRY_BACKOFF_SECONDS
+    ):
+        """
+        Initialize the writer.
+        
+        Args:
+            enabled: Whether rows are queued at all
+            max_queue: Maximum number of rows waiting to be written
+            batch_size: Maximum number of rows inserted per transaction
+            session_factory: Factory of async sessions used for flushing
+            retries: Retries of a failed batch before it is written row by row
+            retry_backoff: Delay before the first retry in seconds, doubled
+                for every further retry
+        """
+        self.enabled = enabled
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.session_factory = session_factory
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._written = 0
+        self._retried = 0
+        self._dropped = 0
+    
+    def submit(
+        self,
+        user_id: int,
+        sequence_type: str,
+        input_sequence: str,
+        results: dict
+    ) -> bool:
+        """
+        Queue an analysis history row; must be called on the event loop.
+        
+        Args:
+            user_id: ID of the user who performed the analysis
+            sequence_type: DNA, RNA or Protein
+            input_sequence: Analyzed sequence
+            results: Analysis results as dictionary
+        
+        Returns:
+            True if the row was queued, False if write-behind is disabled,
+            stopped or full and the caller must write the row itself
+        """
+        if not self.enabled:
+            return False
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        try:
+            self._queue.put_nowait(
+                (user_id, sequence_type, input_sequence, results, datetime.utcnow())
+            )
+        except asyncio.QueueFull:
+            return False
+        return True
+    
+    async def stop(self) -> None:
+        """Write every queued row, then stop the background task."""
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        self.enabled = False
+        await self._queue.join()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    
+    def metrics(self) -> dict:
+        """
+        Report queue depth and flush counters.
+        
+        Returns:
+            Dictionary of queued, written and dropped row counts, and the
+            number of batch retries
+        """
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "written": self._written,
+            "retried": self._retried,
+            "dropped": self._dropped,
+        }
+    
+    async def _run(self) -> None:
+        """Take up to batch_size queued rows at a time and insert them."""
+        queue = self._queue
+        while True:
+            batch: List[HistoryEntry] = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    async def _flush(self, batch: List[HistoryEntry]) -> None:
+        """
+        Insert a batch of rows in one transaction, retrying on failure.
+        
+        Transient errors are retried with exponential backoff. If the batch
+        still fails, its rows are inserted one per transaction to isolate
+        the bad ones, and only rows that fail on their own are dropped, so
+        neither a bad row nor an outage stalls the queue indefinitely.
+        
+        Args:
+            batch: Queued history rows
+        """
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self._retried += 1
+                await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+            try:
+                await self._insert(batch)
+                return
+            except Exception:
+                logger.warning(
+                    "Failed to write %d analysis history rows (attempt %d of %d)",
+                    len(batch), attempt + 1, self.retries + 1, exc_info=True
+                )
+        
+        for entry in batch:
+            try:
+                await self._insert([entry])
+            except Exception:
+                self._dropped += 1
+                logger.exception("Dropped analysis history row of user %d", entry[0])
+    
+    async def _insert(self, entries: List[HistoryEntry]) -> None:
+        """Insert rows in one transaction and count them as written."""
+        async with self.session_factory() as db:
+            self._written += await create_history_entries_async(db, entries)
+
+
+@lru_cache(maxsize=None)
+def get_history_writer() -> HistoryWriter:
+    """
+    Dependency returning the application-scoped HistoryWriter.
+    
+    Returns:
+        Shared HistoryWriter instance
+    """
+    return HistoryWriter()
@@ -0,0 +1,222 @@
+"""
+On-disk reference sequence store with faidx-style region access.
+
+Each stored reference is written once as a normalized FASTA file with a
+fixed line width, next to a samtools-compatible ``.fai`` index of record
+offsets. Regions are read through a memory mapping by computing their byte
+offsets from the index, so a lookup costs time proportional to the region
+rather than to the reference.
+"""
+import mmap
+import os
+import uuid
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+# Bases per line of stored FASTA files
+STORE_LINE_BASES = 60
+
+# Directory holding stored references and their indexes
+SEQUENCE_STORE_DIR = os.getenv("SEQUENCE_STORE_DIR", "data/sequences")
+
+# Largest reference file accepted for storage; independent of MAX_FILE_SIZE
+REFERENCE_MAX_SIZE = int(os.getenv("REFERENCE_MAX_SIZE", str(1024 * 1024 * 1024)))  # 1GB
+
+# Parsed .fai indexes kept in memory across region queries
+SEQUENCE_INDEX_CACHE_SIZE = int(os.getenv("SEQUENCE_INDEX_CACHE_SIZE", "256"))
+
+
+class FaiEntry(NamedTuple):
+    """One line of a .fai index."""
+    name: str
+    length: int
+    offset: int
+    line_bases: int
+    line_width: int
+
+
+class SequenceStore:
+    """
+    Directory of normalized FASTA files with .fai offset indexes.
+    """
+
+    def __init__(
+        self,
+        root: str = SEQUENCE_STORE_DIR,
+        line_bases: int = STORE_LINE_BASES,
+        max_size: int = REFERENCE_MAX_SIZE
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory for stored files, created on first write
+            line_bases: Bases per line in written FASTA files
+            max_size: Largest uploaded reference file in bytes
+        """
+        self.root = root
+        self.line_bases = line_bases
+        self.max_size = max_size
+
+    def write(self, records: Iterable[Tuple[str, str]]) -> Tuple[str, List[FaiEntry]]:
+        """
+        Write records as a new indexed FASTA file.
+
+        The files are written under temporary names and renamed into place,
+        so readers never observe a partially written reference.
+
+        Args:
+            records: Iterable of (name, sequence) pairs
+
+        Returns:
+            Tuple of (storage key, index entries)
+
+        Raises:
+            ValueError: If there are no records or a record name repeats
+        """
+        os.makedirs(self.root, exist_ok=True)
+        key = uuid.uuid4().hex
+        fasta_path, index_path = self._paths(key)
+        line_width = self.line_bases + 1
+        entries: List[FaiEntry] = []
+        names = set()
+
+        try:
+            with open(fasta_path + ".tmp", "wb") as fasta:
+                offset = 0
+                for name, sequence in records:
+                    if name in names:
+                        raise ValueError(f"Duplicate record name: {name}")
+                    names.add(name)
+                    header = f">{name}\n".encode("utf-8")
+                    fasta.write(header)
+                    offset += len(header)
+                    data = sequence.encode("ascii")
+                    for line_start in range(0, len(data), self.line_bases):
+                        fasta.write(data[line_start:line_start + self.line_bases])
+                        fasta.write(b"\n")
+                    entries.append(FaiEntry(name, len(data), offset, self.line_bases, line_width))
+                    offset += len(data) + -(-len(data) // self.line_bases)
+            if not entries:
+                raise ValueError("File contains no valid sequences")
+
+            with open(index_path + ".tmp", "w", encoding="utf-8") as index:
+                for entry in entries:
+                    index.write("\t".join(str(field) for field in entry) + "\n")
+
+            os.replace(fasta_path + ".tmp", fasta_path)
+            os.replace(index_path + ".tmp", index_path)
+        except BaseException:
+            for path in (fasta_path, index_path):
+                for candidate in (path, path + ".tmp"):
+                    if os.path.exists(candidate):
+                        os.remove(candidate)
+            raise
+
+        return key, entries
+
+    def read_index(self, key: str) -> Dict[str, FaiEntry]:
+        """
+        Load the .fai index of a stored reference.
+
+        Parsed indexes are cached by path and modification time, so repeated
+        queries of a reference cost one stat() instead of a parse.
+
+        Args:
+            key: Storage key returned by write()
+
+        Returns:
+            Index entries by record name, in file order; shared between
+            callers and must not be modified
+
+        Raises:
+            FileNotFoundError: If the reference does not exist
+        """
+        _, index_path = self._paths(key)
+        return _parse_index(index_path, os.stat(index_path).st_mtime_ns)
+
+    def fetch(self, key: str, entry: FaiEntry, start: int, end: int) -> str:
+        """
+        Read a 1-based inclusive region of a stored record.
+
+        Args:
+            key: Storage key returned by write()
+            entry: Index entry of the record
+            start: 1-based region start
+            end: 1-based inclusive region end (at most entry.length)
+
+        Returns:
+            Region sequence
+
+        Raises:
+            ValueError: If the region is outside the record
+            FileNotFoundError: If the reference does not exist
+        """
+        if start < 1 or end > entry.length or start > end:
+            raise ValueError(f"Region {start}-{end} is outside 1-{entry.length}")
+
+        fasta_path, _ = self._paths(key)
+        with open(fasta_path, "rb") as fasta:
+            with mmap.mmap(fasta.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                first = self._byte_offset(entry, start - 1)
+                last = self._byte_offset(entry, end - 1) + 1
+                return mapped[first:last].replace(b"\n", b"").decode("ascii")
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a stored reference and its index.
+
+        Args:
+            key: Storage key returned by write()
+        """
+        for path in self._paths(key):
+            if os.path.exists(path):
+                os.remove(path)
+        # lru_cache cannot drop single entries; deletes are rare
+        _parse_index.cache_clear()
+
+    def _byte_offset(self, entry: FaiEntry, position: int) -> int:
+        """Byte offset of a 0-based position within the stored file."""
+        return (
+            entry.offset
+            + (position // entry.line_bases) * entry.line_width
+            + position % entry.line_bases
+        )
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        """Paths of the FASTA file and .fai index for a storage key."""
+        fasta_path = os.path.join(self.root, f"{key}.fa")
+        return fasta_path, fasta_path + ".fai"
+
+
+@lru_cache(maxsize=SEQUENCE_INDEX_CACHE_SIZE)
+def _parse_index(index_path: str, mtime_ns: int) -> Dict[str, FaiEntry]:
+    """
+    Parse a .fai index file.
+
+    Args:
+        index_path: Path of the index
+        mtime_ns: Modification time of the index, part of the cache key
+
+    Returns:
+        Index entries by record name, in file order
+    """
+    entries: Dict[str, FaiEntry] = {}
+    with open(index_path, encoding="utf-8") as index:
+        for line in index:
+            name, length, offset, line_bases, line_width = line.rstrip("\n").split("\t")
+            entries[name] = FaiEntry(
+                name, int(length), int(offset), int(line_bases), int(line_width)
+            )
+    return entries
+
+
+@lru_cache(maxsize=None)
+def get_sequence_store() -> SequenceStore:
+    """
+    Dependency returning the application-scoped SequenceStore.
+
+    Returns:
+        Shared SequenceStore instance
+    """
+    return SequenceStore()
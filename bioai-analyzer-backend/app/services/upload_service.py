@@ -0,0 +1,181 @@
+"""
+Upload processing pipeline shared by direct and resumable uploads.
+"""
+import os
+from collections import Counter, deque
+from typing import BinaryIO, Union
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.schemas.analysis import (
+    NucleotideAnalysisResult,
+    ProteinAnalysisResult,
+    RecordAnalysisResult,
+    UploadSummary,
+    MultiRecordUploadResult,
+    FastqSummary,
+    AssemblyStatsResult
+)
+from app.services.analysis_service import AnalysisService
+from app.services.file_service import FileService
+from app.crud import analysis as crud_analysis
+
+# Analyses of a multi-record upload saved per transaction, by count and by
+# sequence bytes, so memory does not grow with the file
+UPLOAD_PERSIST_BATCH_ROWS = int(os.getenv("UPLOAD_PERSIST_BATCH_ROWS", "500"))
+UPLOAD_PERSIST_BATCH_BYTES = int(os.getenv("UPLOAD_PERSIST_BATCH_BYTES", str(16 * 1024 * 1024)))  # 16MB
+
+UploadResult = Union[
+    NucleotideAnalysisResult,
+    ProteinAnalysisResult,
+    MultiRecordUploadResult,
+    FastqSummary,
+    AssemblyStatsResult
+]
+
+
+def process_upload(
+    stream: BinaryIO,
+    filename: str,
+    all_records: bool,
+    user_id: int,
+    db: Session,
+    file_service: FileService,
+    analysis_service: AnalysisService,
+    assembly_stats: bool = False
+) -> UploadResult:
+    """
+    Parse, analyze and persist an uploaded sequence file.
+    
+    FASTQ files are summarized; with assembly_stats, FASTA files get
+    assembly QC statistics; otherwise the first record (or, with
+    all_records, every record) is analyzed and saved to the history.
+    This blocks, so async callers should run it in a thread pool.
+    
+    Args:
+        stream: Readable binary file object positioned at the file start
+        filename: Name of the uploaded file
+        all_records: Analyze every record instead of only the first
+        user_id: ID of the authenticated user
+        db: Database session
+        file_service: File parsing service
+        analysis_service: Analysis service
+        assembly_stats: Return assembly statistics instead of analyses
+        
+    Returns:
+        NucleotideAnalysisResult or ProteinAnalysisResult for the first record,
+        MultiRecordUploadResult when all_records is set, AssemblyStatsResult
+        when assembly_stats is set, or FastqSummary for FASTQ
+        
+    Raises:
+        HTTPException: If the file is invalid, too large, or cannot be analyzed
+    """
+    if file_service.is_fastq(filename):
+        return file_service.summarize_fastq(stream, filename)
+    
+    if assembly_stats:
+        return file_service.assembly_statistics(stream, filename)
+    
+    if all_records:
+        return analyze_all_records(stream, filename, user_id, db, file_service, analysis_service)
+    
+    # Parse the upload incrementally instead of reading it into memory
+    sequence, sequence_type = file_service.parse_stream(stream, filename)
+    
+    # Perform analysis using AnalysisService
+    result = analysis_service.analyze(sequence, sequence_type)
+    
+    # Save analysis results to database; AnalysisRequest is not used here,
+    # since its length limits apply to /analyze bodies, not uploaded files
+    crud_analysis.create_analyses(
+        db=db,
+        user_id=user_id,
+        entries=[(sequence_type, sequence, result.model_dump())]
+    )
+    
+    return result
+
+
+def analyze_all_records(
+    stream: BinaryIO,
+    filename: str,
+    user_id: int,
+    db: Session,
+    file_service: FileService,
+    analysis_service: AnalysisService
+) -> MultiRecordUploadResult:
+    """
+    Analyze every record of an uploaded file and persist the successes.
+    
+    Records are parsed lazily and fed to the analysis worker pool as they
+    are read. Successful analyses are saved in batches of at most
+    UPLOAD_PERSIST_BATCH_ROWS rows or UPLOAD_PERSIST_BATCH_BYTES sequence
+    bytes, one transaction each, so only the per-record results, not the
+    sequences, are held until the end of the file.
+    
+    Args:
+        stream: Readable binary file object positioned at the file start
+        filename: Name of the uploaded file
+        user_id: ID of the authenticated user
+        db: Database session
+        file_service: File parsing service
+        analysis_service: Analysis service
+        
+    Returns:
+        MultiRecordUploadResult with per-record results and a summary
+    """
+    parsed = deque()
+    
+    def analysis_items():
+        for record in file_service.iter_records(stream, filename):
+            parsed.append(record)
+            yield record.sequence, record.sequence_type
+    
+    records = []
+    to_persist = []
+    persist_bytes = 0
+    analyzed_count = 0
+    type_counts = Counter()
+    total_length = 0
+    
+    for result, error in analysis_service.analyze_many(analysis_items()):
+        record = parsed.popleft()
+        type_counts[record.sequence_type] += 1
+        total_length += len(record.sequence)
+        records.append(RecordAnalysisResult(
+            record_id=record.record_id,
+            description=record.description,
+            sequence_type=record.sequence_type,
+            sequence_length=len(record.sequence),
+            result=result,
+            error=error
+        ))
+        if result is not None:
+            to_persist.append((record.sequence_type, record.sequence, result.model_dump()))
+            persist_bytes += len(record.sequence)
+            analyzed_count += 1
+            if len(to_persist) >= UPLOAD_PERSIST_BATCH_ROWS or persist_bytes >= UPLOAD_PERSIST_BATCH_BYTES:
+                crud_analysis.create_analyses(db=db, user_id=user_id, entries=to_persist)
+                to_persist = []
+                persist_bytes = 0
+    
+    if not records:
+        raise HTTPException(
+            status_code=400,
+            detail="File contains no valid sequences"
+        )
+    
+    if to_persist:
+        crud_analysis.create_analyses(db=db, user_id=user_id, entries=to_persist)
+    
+    return MultiRecordUploadResult(
+        filename=filename,
+        summary=UploadSummary(
+            record_count=len(records),
+            analyzed_count=analyzed_count,
+            failed_count=len(records) - analyzed_count,
+            total_length=total_length,
+            sequence_type_counts=dict(type_counts)
+        ),
+        records=records
+    )
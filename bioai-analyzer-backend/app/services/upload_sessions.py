@@ -0,0 +1,393 @@
+"""
+Disk-backed sessions for resumable, chunked uploads.
+
+Each session owns a directory holding the preallocated upload file, one
+marker file per verified chunk and a small JSON state document. Chunks are
+written straight to their final offset, so finalizing needs no assembly
+pass, and the marker files let concurrent PUTs record progress without
+sharing mutable state. A per-session lock file orders chunk writes against
+finalization, across worker processes too.
+"""
+import fcntl
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+import uuid
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+# Directory holding upload sessions
+UPLOAD_SESSION_DIR = os.getenv("UPLOAD_SESSION_DIR", "data/uploads")
+
+# Chunk size used when the client does not choose one, and the largest allowed
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(8 * 1024 * 1024)))  # 8MB
+UPLOAD_MAX_CHUNK_SIZE = int(os.getenv("UPLOAD_MAX_CHUNK_SIZE", str(32 * 1024 * 1024)))  # 32MB
+
+# Largest file a resumable upload may carry; independent of MAX_FILE_SIZE,
+# which limits single-request uploads
+RESUMABLE_MAX_SIZE = int(os.getenv("RESUMABLE_MAX_SIZE", str(1024 * 1024 * 1024)))  # 1GB
+
+# Sessions untouched for longer than this are removed
+UPLOAD_SESSION_TTL_SECONDS = int(os.getenv("UPLOAD_SESSION_TTL_SECONDS", str(24 * 60 * 60)))
+
+# Session IDs are uuid4 hex strings; anything else never touches the disk
+_UPLOAD_ID_PATTERN = re.compile(r'[0-9a-f]{32}')
+
+# Session lifecycle states
+STATE_RECEIVING = "receiving"
+STATE_PROCESSING = "processing"
+STATE_COMPLETED = "completed"
+STATE_FAILED = "failed"
+
+
+class UploadSessionConflict(Exception):
+    """Raised when a session is not in the state an operation requires."""
+
+
+class UploadSession(NamedTuple):
+    """Snapshot of an upload session."""
+    upload_id: str
+    user_id: int
+    filename: str
+    total_size: int
+    chunk_size: int
+    chunk_count: int
+    received_chunks: List[int]
+    state: str
+    error: Optional[str]
+    result: Optional[Dict[str, Any]]
+
+    @property
+    def received_offset(self) -> int:
+        """Bytes received contiguously from the start of the file."""
+        received = set(self.received_chunks)
+        contiguous = 0
+        while contiguous in received:
+            contiguous += 1
+        return min(contiguous * self.chunk_size, self.total_size)
+
+    @property
+    def missing_chunks(self) -> List[int]:
+        """Indexes of chunks not received yet."""
+        received = set(self.received_chunks)
+        return [index for index in range(self.chunk_count) if index not in received]
+
+    def chunk_length(self, index: int) -> int:
+        """Expected size of a chunk in bytes."""
+        return min(self.chunk_size, self.total_size - index * self.chunk_size)
+
+
+class UploadSessionStore:
+    """
+    Directory of upload sessions.
+    """
+
+    def __init__(
+        self,
+        root: str = UPLOAD_SESSION_DIR,
+        ttl: float = UPLOAD_SESSION_TTL_SECONDS,
+        max_size: int = RESUMABLE_MAX_SIZE
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory for session data, created on first use
+            ttl: Seconds after the last change before a session expires
+            max_size: Largest total size of an upload in bytes
+        """
+        self.root = root
+        self.ttl = ttl
+        self.max_size = max_size
+
+    def create(self, user_id: int, filename: str, total_size: int, chunk_size: int) -> UploadSession:
+        """
+        Start a session and preallocate its upload file.
+
+        Args:
+            user_id: ID of the uploading user
+            filename: Name of the file being uploaded
+            total_size: Size of the complete file in bytes
+            chunk_size: Size of every chunk but the last
+
+        Returns:
+            The new session
+
+        Raises:
+            ValueError: If total_size exceeds max_size
+        """
+        if total_size > self.max_size:
+            raise ValueError(f"File size exceeds maximum limit of {self.max_size // (1024 * 1024)}MB")
+        self.purge_expired()
+
+        upload_id = uuid.uuid4().hex
+        session_dir = self._dir(upload_id)
+        os.makedirs(os.path.join(session_dir, "chunks"))
+        open(os.path.join(session_dir, "lock"), "wb").close()
+        with open(self.data_path(upload_id), "wb") as data:
+            data.truncate(total_size)
+
+        meta = {
+            "user_id": user_id,
+            "filename": filename,
+            "total_size": total_size,
+            "chunk_size": chunk_size,
+        }
+        with open(os.path.join(session_dir, "meta.json"), "w", encoding="utf-8") as handle:
+            json.dump(meta, handle)
+        self._write_state(upload_id, {"state": STATE_RECEIVING})
+        return self.get(upload_id)
+
+    def get(self, upload_id: str) -> UploadSession:
+        """
+        Load a session.
+
+        Args:
+            upload_id: Session ID
+
+        Returns:
+            The session
+
+        Raises:
+            KeyError: If the session does not exist
+        """
+        session_dir = self._dir(upload_id)
+        try:
+            with open(os.path.join(session_dir, "meta.json"), encoding="utf-8") as handle:
+                meta = json.load(handle)
+            with open(os.path.join(session_dir, "state.json"), encoding="utf-8") as handle:
+                state = json.load(handle)
+            chunk_dir = os.path.join(session_dir, "chunks")
+            received = sorted(int(name) for name in os.listdir(chunk_dir)) if os.path.isdir(chunk_dir) else []
+        except (FileNotFoundError, ValueError):
+            raise KeyError(upload_id)
+
+        total_size = meta["total_size"]
+        chunk_size = meta["chunk_size"]
+        return UploadSession(
+            upload_id=upload_id,
+            user_id=meta["user_id"],
+            filename=meta["filename"],
+            total_size=total_size,
+            chunk_size=chunk_size,
+            chunk_count=-(-total_size // chunk_size),
+            received_chunks=received,
+            state=state["state"],
+            error=state.get("error"),
+            result=state.get("result")
+        )
+
+    def write_chunk(self, session: UploadSession, index: int, data: bytes, sha256: str) -> None:
+        """
+        Verify a chunk and write it at its final offset in the upload file.
+
+        Re-sending a chunk overwrites it, so interrupted PUTs can be retried.
+        The write holds the session lock shared, so it either completes
+        before finalization starts or is refused.
+
+        Args:
+            session: Session the chunk belongs to
+            index: 0-based chunk number
+            data: Chunk content
+            sha256: Expected hex SHA-256 digest of the content
+
+        Raises:
+            ValueError: If the index, length or checksum is wrong, or the
+                chunk ends beyond max_size
+            UploadSessionConflict: If the session is no longer receiving
+            KeyError: If the session was deleted
+        """
+        if not 0 <= index < session.chunk_count:
+            raise ValueError(f"Chunk index must be between 0 and {session.chunk_count - 1}")
+        offset = index * session.chunk_size
+        # Also bounds sessions created before max_size was lowered
+        if offset + len(data) > self.max_size:
+            raise ValueError(f"File size exceeds maximum limit of {self.max_size // (1024 * 1024)}MB")
+        expected = session.chunk_length(index)
+        if len(data) != expected:
+            raise ValueError(f"Chunk {index} must be {expected} bytes, got {len(data)}")
+        if hashlib.sha256(data).hexdigest() != sha256.strip().lower():
+            raise ValueError(f"Checksum mismatch for chunk {index}")
+
+        with self._locked(session.upload_id, exclusive=False):
+            state = self._read_state(session.upload_id)["state"]
+            if state != STATE_RECEIVING:
+                raise UploadSessionConflict("Upload is no longer accepting chunks")
+
+            try:
+                fd = os.open(self.data_path(session.upload_id), os.O_WRONLY)
+            except FileNotFoundError:
+                # Deleted while the lock was being taken
+                raise KeyError(session.upload_id)
+            try:
+                os.pwrite(fd, data, offset)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+            # Record the chunk only once its bytes are durable
+            marker = os.path.join(self._dir(session.upload_id), "chunks", str(index))
+            open(marker, "wb").close()
+
+    def begin_processing(self, upload_id: str) -> UploadSession:
+        """
+        Atomically move a fully received session from receiving to processing.
+
+        The check and the transition happen under the exclusive session
+        lock, after every in-flight chunk write has finished, so exactly one
+        of several concurrent callers wins and no chunk is written afterwards.
+
+        Args:
+            upload_id: Session ID
+
+        Returns:
+            The session, now processing
+
+        Raises:
+            UploadSessionConflict: If the session is not receiving or chunks
+                are missing
+            KeyError: If the session does not exist
+        """
+        with self._locked(upload_id, exclusive=True):
+            session = self.get(upload_id)
+            if session.state != STATE_RECEIVING:
+                raise UploadSessionConflict(f"Upload is already {session.state}")
+            if session.missing_chunks:
+                raise UploadSessionConflict(
+                    f"Upload is missing {len(session.missing_chunks)} chunk(s)"
+                )
+            self._write_state(upload_id, {"state": STATE_PROCESSING})
+        return session._replace(state=STATE_PROCESSING)
+
+    def set_state(
+        self,
+        upload_id: str,
+        state: str,
+        error: Optional[str] = None,
+        result: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Record a lifecycle transition.
+
+        Once processing ends the upload file and chunk markers are removed;
+        only the state (with its result or error) is kept until expiry.
+
+        Args:
+            upload_id: Session ID
+            state: New state
+            error: Error message for failed sessions
+            result: JSON-serializable result for completed sessions
+        """
+        self._write_state(upload_id, {"state": state, "error": error, "result": result})
+        if state in (STATE_COMPLETED, STATE_FAILED):
+            session_dir = self._dir(upload_id)
+            shutil.rmtree(os.path.join(session_dir, "chunks"), ignore_errors=True)
+            data_path = self.data_path(upload_id)
+            if os.path.exists(data_path):
+                os.remove(data_path)
+
+    def delete(self, upload_id: str) -> None:
+        """
+        Remove a session and all of its data.
+
+        Args:
+            upload_id: Session ID
+        """
+        shutil.rmtree(self._dir(upload_id), ignore_errors=True)
+
+    def purge_expired(self) -> int:
+        """
+        Remove sessions whose state has not changed within the TTL.
+
+        Returns:
+            Number of sessions removed
+        """
+        if not os.path.isdir(self.root):
+            return 0
+        cutoff = time.time() - self.ttl
+        removed = 0
+        for upload_id in os.listdir(self.root):
+            if not _UPLOAD_ID_PATTERN.fullmatch(upload_id):
+                continue
+            session_dir = self._dir(upload_id)
+            try:
+                # Chunk markers touch the chunks directory, state changes the state file
+                touched = max(
+                    os.path.getmtime(os.path.join(session_dir, name))
+                    for name in ("state.json", "chunks")
+                    if os.path.exists(os.path.join(session_dir, name))
+                )
+            except (OSError, ValueError):
+                touched = 0
+            if touched < cutoff:
+                shutil.rmtree(session_dir, ignore_errors=True)
+                removed += 1
+        return removed
+
+    def data_path(self, upload_id: str) -> str:
+        """Path of a session's upload file."""
+        return os.path.join(self._dir(upload_id), "data")
+
+    def _dir(self, upload_id: str) -> str:
+        """
+        Directory of a session.
+
+        Raises:
+            KeyError: If the ID is not a valid session ID
+        """
+        if not _UPLOAD_ID_PATTERN.fullmatch(upload_id):
+            raise KeyError(upload_id)
+        return os.path.join(self.root, upload_id)
+
+    @contextmanager
+    def _locked(self, upload_id: str, exclusive: bool) -> Iterator[None]:
+        """
+        Hold a session's lock file, shared or exclusive.
+
+        Raises:
+            KeyError: If the session does not exist
+        """
+        try:
+            fd = os.open(os.path.join(self._dir(upload_id), "lock"), os.O_RDWR | os.O_CREAT)
+        except FileNotFoundError:
+            raise KeyError(upload_id)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            os.close(fd)
+
+    def _read_state(self, upload_id: str) -> Dict[str, Any]:
+        """
+        Load a session's state document.
+
+        Raises:
+            KeyError: If the session does not exist
+        """
+        try:
+            with open(os.path.join(self._dir(upload_id), "state.json"), encoding="utf-8") as handle:
+                return json.load(handle)
+        except (FileNotFoundError, ValueError):
+            raise KeyError(upload_id)
+
+    def _write_state(self, upload_id: str, state: Dict[str, Any]) -> None:
+        """Atomically replace a session's state document."""
+        path = os.path.join(self._dir(upload_id), "state.json")
+        with open(path + ".tmp", "w", encoding="utf-8") as handle:
+            json.dump(state, handle)
+        os.replace(path + ".tmp", path)
+
+
+@lru_cache(maxsize=None)
+def get_upload_session_store() -> UploadSessionStore:
+    """
+    Dependency returning the application-scoped UploadSessionStore.
+
+    Returns:
+        Shared UploadSessionStore instance
+    """
+    return UploadSessionStore()
@@ -4,15 +4,28 @@ Utility modules for the BioAI Analyzer Backend.
 from app.utils.security import (
     get_password_hash,
     verify_password,
+    get_password_hash_async,
+    verify_password_async,
+    password_needs_rehash,
     create_jwt_token,
     decode_jwt_token,
+    revoke_token,
     get_current_user,
+    invalidate_cached_user,
 )
+from app.utils.pagination import encode_cursor, decode_cursor
 
 __all__ = [
     "get_password_hash",
     "verify_password",
+    "get_password_hash_async",
+    "verify_password_async",
+    "password_needs_rehash",
     "create_jwt_token",
     "decode_jwt_token",
+    "revoke_token",
     "get_current_user",
+    "invalidate_cached_user",
+    "encode_cursor",
+    "decode_cursor",
 ]
@@ -0,0 +1,162 @@
+"""
+In-process caching utilities.
+"""
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded cache with per-entry expiry.
+
+    Entries expire after ``ttl`` seconds unless a different lifetime is
+    given when they are stored. When the cache is full the least recently
+    used entry is evicted.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept in memory
+            ttl: Default entry lifetime in seconds
+            timer: Monotonic clock used to compute expiry times
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the cached value for a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if the key is missing or expired
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._timer():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Optional lifetime in seconds overriding the default
+        """
+        if self.maxsize <= 0:
+            return
+        lifetime = self.ttl if ttl is None else ttl
+        if lifetime <= 0:
+            return
+        with self._lock:
+            self._data[key] = (self._timer() + lifetime, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Remove a single entry if present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class ExpiringSet:
+    """
+    Thread-safe set whose members expire, with no size bound.
+
+    Members are never evicted before their expiry, which makes this the
+    right store for denylists: a size-bounded cache would forget entries
+    that must still be enforced. Expired members are purged as new ones
+    are added, so memory tracks the number of live members.
+    """
+
+    def __init__(self, timer: Callable[[], float] = time.monotonic):
+        """
+        Initialize the set.
+
+        Args:
+            timer: Monotonic clock used to compute expiry times
+        """
+        self._timer = timer
+        self._expiry: Dict[Hashable, float] = {}
+        self._heap: List[Tuple[float, Hashable]] = []
+        self._lock = threading.Lock()
+
+    def add(self, key: Hashable, ttl: float) -> None:
+        """
+        Add a member for ``ttl`` seconds, extending an existing expiry.
+
+        Args:
+            key: Member to add
+            ttl: Lifetime in seconds; members with ttl <= 0 are not added
+        """
+        if ttl <= 0:
+            return
+        now = self._timer()
+        expires_at = now + ttl
+        with self._lock:
+            self._purge(now)
+            if self._expiry.get(key, 0.0) < expires_at:
+                self._expiry[key] = expires_at
+                heapq.heappush(self._heap, (expires_at, key))
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            expires_at = self._expiry.get(key)
+            return expires_at is not None and expires_at > self._timer()
+
+    def clear(self) -> None:
+        """Remove all members."""
+        with self._lock:
+            self._expiry.clear()
+            self._heap.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._purge(self._timer())
+            return len(self._expiry)
+
+    def _purge(self, now: float) -> None:
+        """Drop expired members; the caller holds the lock."""
+        while self._heap and self._heap[0][0] <= now:
+            expires_at, key = heapq.heappop(self._heap)
+            if self._expiry.get(key) == expires_at:
+                del self._expiry[key]
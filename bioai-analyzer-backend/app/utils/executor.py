@@ -0,0 +1,124 @@
+"""
+Bounded thread pool executor for isolating CPU-heavy work.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when a BoundedExecutor's queue is full."""
+
+
+class BoundedExecutor:
+    """
+    Size-limited thread pool with a queue-depth limit and usage metrics.
+
+    At most ``max_workers`` tasks run concurrently and at most ``max_queue``
+    more may wait; further submissions are rejected immediately instead of
+    piling up behind the running ones.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        """
+        Initialize the executor.
+
+        Args:
+            name: Name used for worker threads and metrics
+            max_workers: Number of worker threads
+            max_queue: Maximum number of tasks waiting for a worker
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._running = 0
+        self._submitted = 0
+        self._completed = 0
+        self._rejected = 0
+        self._busy_seconds = 0.0
+        self._wait_seconds = 0.0
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a callable on the pool and await its result.
+
+        Args:
+            fn: Callable to execute
+            *args: Positional arguments for the callable
+
+        Returns:
+            The callable's return value
+
+        Raises:
+            ExecutorSaturatedError: If the queue-depth limit is reached
+        """
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise ExecutorSaturatedError(f"{self.name} executor is saturated")
+            self._in_flight += 1
+            self._submitted += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.name
+                )
+            executor = self._executor
+
+        queued_at = time.perf_counter()
+
+        def task() -> Any:
+            started_at = time.perf_counter()
+            with self._lock:
+                self._running += 1
+                self._wait_seconds += started_at - queued_at
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._busy_seconds += time.perf_counter() - started_at
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, task)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._completed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return a snapshot of executor metrics.
+
+        Returns:
+            Dictionary of counters and gauges
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queue_depth": self._in_flight - self._running,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "busy_seconds": round(self._busy_seconds, 3),
+                "wait_seconds": round(self._wait_seconds, 3),
+            }
+
+    def shutdown(self) -> None:
+        """
+        Wait for running tasks to finish and release the worker threads.
+
+        A new pool is started on the next submission.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -0,0 +1,123 @@
+"""
+On-demand import-time report for application startup.
+
+Runs a fresh interpreter with ``-X importtime`` and summarizes the cost of
+every imported module, so cold-start regressions can be tracked.
+
+Usage:
+    python -m app.utils.import_report [--module app.main] [--top 25] [--sort self]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import List, NamedTuple, Optional
+
+# Backend project root, used as the working directory for the measurement
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class ImportTiming(NamedTuple):
+    """Import cost of a single module in microseconds."""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """
+    Parse the stderr output of ``python -X importtime``.
+
+    Args:
+        output: Raw importtime output
+
+    Returns:
+        List of ImportTiming entries in import order
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        self_field, cumulative_field, name_field = fields
+        try:
+            self_us = int(self_field.strip())
+            cumulative_us = int(cumulative_field.strip())
+        except ValueError:
+            # Header line ("self [us] | cumulative | imported package")
+            continue
+        name = name_field.rstrip()
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        timings.append(ImportTiming(name.strip(), self_us, cumulative_us, depth))
+    return timings
+
+
+def measure_imports(module: str = "app.main") -> List[ImportTiming]:
+    """
+    Import a module in a fresh interpreter and collect per-module timings.
+
+    Args:
+        module: Dotted module path to import
+
+    Returns:
+        List of ImportTiming entries in import order
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr}")
+    return parse_importtime(completed.stderr)
+
+
+def format_report(timings: List[ImportTiming], top: int = 25, sort: str = "self") -> str:
+    """
+    Render timings as a plain-text table.
+
+    Args:
+        timings: Timings returned by measure_imports()
+        top: Number of modules to list
+        sort: Sort key, "self" or "cumulative"
+
+    Returns:
+        Report text
+    """
+    total_us = sum(t.cumulative_us for t in timings if t.depth == 0)
+    key = (lambda t: t.self_us) if sort == "self" else (lambda t: t.cumulative_us)
+    ranked = sorted(timings, key=key, reverse=True)[:top]
+
+    lines = [
+        f"Total import time: {total_us / 1000:.1f} ms across {len(timings)} modules",
+        f"{'self [ms]':>10} {'cumulative [ms]':>16}  module",
+    ]
+    for timing in ranked:
+        lines.append(
+            f"{timing.self_us / 1000:>10.1f} {timing.cumulative_us / 1000:>16.1f}  {timing.module}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Report per-module import cost.")
+    parser.add_argument("--module", default="app.main", help="Module to import")
+    parser.add_argument("--top", type=int, default=25, help="Number of modules to list")
+    parser.add_argument("--sort", choices=("self", "cumulative"), default="self")
+    args = parser.parse_args(argv)
+
+    print(format_report(measure_imports(args.module), top=args.top, sort=args.sort))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+Throughput benchmark of the single-row and bulk analysis insert paths.
+
+Inserts synthetic analyses through create_analysis (one transaction per
+row) and through create_analyses (one bulk write), and reports rows per
+second for each. Each path gets its own sequences, so neither finds its
+sequences already stored by the other.
+
+Usage:
+    python -m app.utils.insert_benchmark [--rows 2000] [--database-url sqlite:///bench.db]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Length of the random DNA sequences analyzed for the benchmark rows
+SEQUENCE_LENGTH = 300
+
+
+def make_entries(rows: int, seed: int = 0) -> List[Tuple[str, str, dict]]:
+    """
+    Analyze random DNA sequences into create_analyses entries.
+
+    Args:
+        rows: Number of entries
+        seed: Random seed, so runs are comparable
+
+    Returns:
+        List of (sequence_type, input_sequence, results) tuples
+    """
+    from app.services.analysis_service import get_analysis_service
+
+    rng = random.Random(seed)
+    service = get_analysis_service()
+    entries = []
+    for _ in range(rows):
+        sequence = "".join(rng.choice("ACGT") for _ in range(SEQUENCE_LENGTH))
+        entries.append(("DNA", sequence, service.analyze_dna(sequence).model_dump()))
+    return entries
+
+
+def run_benchmark(database_url: str, rows: int) -> Dict[str, float]:
+    """
+    Time both insert paths against a database.
+
+    Tables are created if missing. The benchmark user, its analyses and
+    their stored sequences are deleted afterwards.
+
+    Args:
+        database_url: SQLAlchemy URL of the target database
+        rows: Number of analyses inserted by each path
+
+    Returns:
+        Rows per second of the "single" and "bulk" paths
+    """
+    from sqlalchemy import create_engine, delete, select
+    from sqlalchemy.orm import Session
+    from app.crud.analysis import create_analyses, create_analysis
+    from app.crud.sequence import delete_unreferenced_sequences
+    from app.database import Base
+    from app.models import Analysis, User
+    from app.schemas.analysis import AnalysisRequest
+
+    single_entries = make_entries(rows, seed=0)
+    bulk_entries = make_entries(rows, seed=1)
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    rates = {}
+    try:
+        with Session(engine) as db:
+            user = User(
+                name="Insert Benchmark",
+                email=f"insert-benchmark-{os.getpid()}@example.com",
+                hashed_password="!"
+            )
+            db.add(user)
+            db.commit()
+            try:
+                started = time.perf_counter()
+                for sequence_type, sequence, results in single_entries:
+                    request = AnalysisRequest(sequence=sequence, sequence_type=sequence_type)
+                    create_analysis(db, user.id, request, results)
+                rates["single"] = rows / (time.perf_counter() - started)
+
+                started = time.perf_counter()
+                create_analyses(db, user.id, bulk_entries)
+                rates["bulk"] = rows / (time.perf_counter() - started)
+            finally:
+                db.rollback()
+                digests = db.scalars(
+                    select(Analysis.sequence_digest).where(Analysis.user_id == user.id).distinct()
+                ).all()
+                db.execute(delete(Analysis).where(Analysis.user_id == user.id))
+                db.execute(delete(User).where(User.id == user.id))
+                delete_unreferenced_sequences(db, digests)
+                db.commit()
+    finally:
+        engine.dispose()
+    return rates
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Compare single-row and bulk analysis inserts.")
+    parser.add_argument("--rows", type=int, default=2000, help="Analyses inserted per path")
+    parser.add_argument(
+        "--database-url",
+        help="Target database (default: a temporary SQLite file)"
+    )
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = args.database_url or f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        rates = run_benchmark(database_url, args.rows)
+
+    print(f"{'path':<8}{'rows/s':>12}")
+    for path, rate in rates.items():
+        print(f"{path:<8}{rate:>12.0f}")
+    print(f"speedup {rates['bulk'] / rates['single']:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""
+Compact binary encoding of stored analysis results.
+
+Results are packed with MessagePack and zlib-compressed when that makes
+them smaller. Every blob starts with a format version byte and a
+compression byte, so the layout can change without rewriting stored rows.
+"""
+import zlib
+from typing import Any, Dict
+
+# Layout written for new results
+RESULTS_FORMAT_VERSION = 1
+
+# Compression byte values
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+
+# zlib level; results are small, so higher levels gain little
+RESULTS_COMPRESSION_LEVEL = 6
+
+
+def encode_results(results: Dict[str, Any]) -> bytes:
+    """
+    Encode analysis results for storage.
+
+    Args:
+        results: JSON-compatible results dictionary
+
+    Returns:
+        Versioned binary blob
+    """
+    import msgpack
+
+    packed = msgpack.packb(results, use_bin_type=True)
+    compressed = zlib.compress(packed, RESULTS_COMPRESSION_LEVEL)
+    if len(compressed) < len(packed):
+        return bytes((RESULTS_FORMAT_VERSION, COMPRESSION_ZLIB)) + compressed
+    return bytes((RESULTS_FORMAT_VERSION, COMPRESSION_NONE)) + packed
+
+
+def decode_results(blob: bytes) -> Dict[str, Any]:
+    """
+    Decode a blob created by encode_results().
+
+    Args:
+        blob: Versioned binary blob
+
+    Returns:
+        Results dictionary
+
+    Raises:
+        ValueError: If the format version or compression is unknown
+    """
+    import msgpack
+
+    if len(blob) < 2 or blob[0] != RESULTS_FORMAT_VERSION:
+        raise ValueError("Unknown results format")
+    payload = memoryview(blob)[2:]
+    if blob[1] == COMPRESSION_ZLIB:
+        payload = zlib.decompress(payload)
+    elif blob[1] != COMPRESSION_NONE:
+        raise ValueError(f"Unknown results compression: {blob[1]}")
+    return msgpack.unpackb(payload, raw=False, strict_map_key=False)
@@ -1,32 +1,70 @@
 """
 Security utilities for password hashing and JWT token management.
 """
+import hashlib
 import os
+import time
 import bcrypt
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.models.user import User
+from app.database import get_async_db
+from app.schemas.user import UserPrincipal
+from app.utils.cache import ExpiringSet, TTLCache
+from app.utils.executor import BoundedExecutor, ExecutorSaturatedError
 
 # JWT configuration
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_HOURS = 24
 
+# Authenticated user cache configuration
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", "10000"))
+
+# Password hashing configuration
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "32"))
+
+# Verified token cache configuration
+TOKEN_CACHE_MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000"))
+
 # HTTP Bearer security scheme
 security = HTTPBearer()
 
+# Dedicated pool for bcrypt so login bursts cannot starve the shared threadpool
+password_executor = BoundedExecutor(
+    name="password-hash",
+    max_workers=PASSWORD_HASH_WORKERS,
+    max_queue=PASSWORD_HASH_MAX_QUEUE
+)
+
+# Principals of recently authenticated users, keyed by user ID
+user_cache = TTLCache(maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
+
+# Claims of already-verified tokens, keyed by token digest.
+# Entries live until the token's own expiry.
+token_cache = TTLCache(
+    maxsize=TOKEN_CACHE_MAX_SIZE,
+    ttl=ACCESS_TOKEN_EXPIRE_HOURS * 3600
+)
+
+# Digests of revoked tokens that have not yet expired. Unbounded so that a
+# revocation is never evicted while its token could still be presented;
+# only tokens that decode are added, and each is dropped once it expires.
+revoked_tokens = ExpiringSet()
+
 
 # Password hashing utilities
 
 def get_password_hash(password: str) -> str:
     """
-    Hash a password using bcrypt with cost factor 12.
+    Hash a password using bcrypt with the configured cost factor.
     
     Args:
         password: Plain text password to hash
@@ -41,7 +79,7 @@ def get_password_hash(password: str) -> str:
     # Truncate password to 72 bytes (bcrypt limit)
     password_bytes = password.encode('utf-8')[:72]
     # Generate salt and hash password
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode('utf-8')
 
@@ -67,6 +105,70 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(password_bytes, hashed_bytes)
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a hash was produced with a different cost factor.
+    
+    Args:
+        hashed_password: Stored bcrypt hash ("$2b$<cost>$<salt+hash>")
+        
+    Returns:
+        True if the hash should be regenerated with BCRYPT_ROUNDS
+    """
+    try:
+        return int(hashed_password.split('$')[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+def _password_executor_unavailable() -> HTTPException:
+    """Build the 503 response raised when the hashing pool is saturated."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication service busy, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash a password on the dedicated password hashing executor.
+    
+    Args:
+        password: Plain text password to hash
+        
+    Returns:
+        Hashed password string
+        
+    Raises:
+        HTTPException: 503 if the hashing queue is full
+    """
+    try:
+        return await password_executor.run(get_password_hash, password)
+    except ExecutorSaturatedError:
+        raise _password_executor_unavailable()
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password on the dedicated password hashing executor.
+    
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to compare against
+        
+    Returns:
+        True if password matches, False otherwise
+        
+    Raises:
+        HTTPException: 503 if the hashing queue is full
+    """
+    try:
+        return await password_executor.run(verify_password, plain_password, hashed_password)
+    except ExecutorSaturatedError:
+        raise _password_executor_unavailable()
+
+
 # JWT token utilities
 
 def create_jwt_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -93,10 +195,36 @@ def create_jwt_token(data: Dict[str, Any], expires_delta: Optional[timedelta] =
     return encoded_jwt
 
 
+def _token_digest(token: str) -> str:
+    """
+    Compute the cache key for a token.
+    
+    Args:
+        token: JWT token string
+        
+    Returns:
+        Hex SHA-256 digest of the token
+    """
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
+def _invalid_token_exception() -> HTTPException:
+    """Build the 401 response raised for invalid or revoked tokens."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
 def decode_jwt_token(token: str) -> Dict[str, Any]:
     """
     Decode and validate a JWT token.
     
+    Tokens that were already verified are served from an LRU cache keyed
+    by the token digest, skipping signature verification until the token
+    expires or is revoked.
+    
     Args:
         token: JWT token string to decode
         
@@ -104,37 +232,96 @@ def decode_jwt_token(token: str) -> Dict[str, Any]:
         Dictionary containing the token payload
         
     Raises:
-        HTTPException: If token is invalid or expired
+        HTTPException: If token is invalid, expired, or revoked
     """
+    digest = _token_digest(token)
+    
+    if digest in revoked_tokens:
+        raise _invalid_token_exception()
+    
+    claims = token_cache.get(digest)
+    if claims is not None:
+        return dict(claims)
+    
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
     except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token",
-            headers={"WWW-Authenticate": "Bearer"},
+        raise _invalid_token_exception()
+    
+    # Cache verified claims until the token itself expires
+    exp = payload.get("exp")
+    if exp is not None:
+        token_cache.set(digest, dict(payload), ttl=float(exp) - time.time())
+    
+    return payload
+
+
+def revoke_token(token: str) -> None:
+    """
+    Revoke a token and purge it from the verified token cache.
+    
+    The revocation is remembered until the token would have expired.
+    
+    Args:
+        token: JWT token string to revoke
+        
+    Raises:
+        HTTPException: 401 if the token is not a valid token of this service
+    """
+    try:
+        payload = jwt.decode(
+            token,
+            SECRET_KEY,
+            algorithms=[ALGORITHM],
+            options={"verify_exp": False}
         )
+    except JWTError:
+        raise _invalid_token_exception()
+    
+    digest = _token_digest(token)
+    token_cache.invalidate(digest)
+    
+    exp = payload.get("exp")
+    if exp is None:
+        revoked_tokens.add(digest, ttl=ACCESS_TOKEN_EXPIRE_HOURS * 3600)
+    else:
+        revoked_tokens.add(digest, ttl=float(exp) - time.time())
+
+
+# Authenticated user cache
+
+def invalidate_cached_user(user_id: int) -> None:
+    """
+    Drop a user's cached principal so the next request reloads it.
+    
+    Must be called whenever a user record is updated or deleted.
+    
+    Args:
+        user_id: ID of the user whose cache entry should be removed
+    """
+    user_cache.invalidate(user_id)
 
 
 # Authentication dependency
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
+    db: AsyncSession = Depends(get_async_db)
+) -> UserPrincipal:
     """
     Dependency to get the current authenticated user from JWT token.
     
     This function validates the JWT token from the Authorization header,
-    extracts the user ID, and retrieves the user from the database.
+    extracts the user ID, and resolves the user's principal. Principals are
+    served from an in-process TTL cache, so the database is only queried on
+    a cache miss.
     
     Args:
         credentials: HTTP Bearer credentials containing the JWT token
-        db: Database session
+        db: Async database session
         
     Returns:
-        User object for the authenticated user
+        UserPrincipal for the authenticated user
         
     Raises:
         HTTPException: 401 if token is invalid, missing, or user not found
@@ -153,16 +340,33 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    user_id = int(user_id)
+    
+    # Serve the principal from cache when possible
+    principal = user_cache.get(user_id)
+    if principal is not None:
+        return principal
+    
     # Import here to avoid circular dependency
-    from app.crud.user import get_user_by_id
+    from app.crud.user import get_user_by_id, get_user_by_id_async
     
-    # Retrieve user from database
-    user = get_user_by_id(db, int(user_id))
-    if user is None:
+    # Retrieve user from database; sync sessions are accepted for scripts and tests
+    if isinstance(db, AsyncSession):
+        user = await get_user_by_id_async(db, user_id)
+        principal = UserPrincipal.model_validate(user) if user is not None else None
+        # End the read transaction so the connection goes back to the pool
+        # while the route works; the session reconnects lazily for its writes
+        await db.rollback()
+    else:
+        user = get_user_by_id(db, user_id)
+        principal = UserPrincipal.model_validate(user) if user is not None else None
+    if principal is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    return user
+    user_cache.set(user_id, principal)
+    
+    return principal
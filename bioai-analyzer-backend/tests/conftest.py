@@ -7,16 +7,46 @@ import os
 # Set environment variable to use SQLite for tests
 os.environ["DATABASE_URL"] = "sqlite:///:memory:"
 
+# Use the minimum bcrypt cost factor to keep tests fast
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+# Analyze multi-record uploads inline unless a test opts into worker processes
+os.environ.setdefault("ANALYSIS_WORKERS", "1")
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Reset in-process caches so tests never see each other's entries."""
+    from app.utils.security import user_cache, token_cache, revoked_tokens
+    
+    caches = (user_cache, token_cache, revoked_tokens)
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
+@pytest.fixture
+def database_path(tmp_path_factory):
+    """Path of the per-test SQLite database file."""
+    return tmp_path_factory.mktemp("database") / "test.db"
+
 
 @pytest.fixture
-def db():
-    """Create test database session with in-memory SQLite."""
+def db(database_path):
+    """Create test database session on a temporary SQLite file."""
     from sqlalchemy import create_engine
     from sqlalchemy.orm import sessionmaker
     from app.database import Base
+    import app.models  # noqa: F401 - register models on Base.metadata
     
-    # Create a separate engine for testing
-    test_engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    # A file rather than :memory:, so the async engine used by the request
+    # path sees the same database as this synchronous session
+    test_engine = create_engine(
+        f"sqlite:///{database_path}",
+        connect_args={"check_same_thread": False}
+    )
     Base.metadata.create_all(test_engine)
     
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
@@ -25,15 +55,30 @@ def db():
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(test_engine)
+        test_engine.dispose()
+
+
+@pytest.fixture
+def async_engine(database_path):
+    """Async engine on the per-test SQLite database file."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+    
+    # NullPool: connections never outlive the test client's event loop
+    return create_async_engine(f"sqlite+aiosqlite:///{database_path}", poolclass=NullPool)
 
 
 @pytest.fixture
-def client(db):
-    """Create test client with database override."""
+def client(db, async_engine):
+    """Create test client with database overrides."""
     from fastapi.testclient import TestClient
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
     from app.main import app
-    from app.database import get_db
+    from app.database import get_async_db, get_db
+    
+    TestingAsyncSessionLocal = async_sessionmaker(
+        async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
     
     def override_get_db():
         try:
@@ -41,7 +86,12 @@ def client(db):
         finally:
             pass
     
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as async_db:
+            yield async_db
+    
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     
     with TestClient(app) as test_client:
         yield test_client
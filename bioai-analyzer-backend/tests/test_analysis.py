@@ -171,6 +171,129 @@ ORIGIN
     assert "sequence_length" in data
 
 
+def test_upload_fastq_file(client, auth_headers):
+    """Test FASTQ uploads return read statistics instead of an analysis."""
+    fastq_content = b"@read1\nACGT\n+\nIIII\n@read2\nGGCC\n+\nIIII\n"
+    
+    response = client.post("/upload",
+        headers=auth_headers,
+        files={"file": ("reads.fastq", BytesIO(fastq_content), "text/plain")}
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["read_count"] == 2
+    assert data["per_position_mean_quality"] == [40.0, 40.0, 40.0, 40.0]
+
+
+def test_upload_assembly_stats(client, auth_headers):
+    """Test assembly statistics are returned and nothing is saved."""
+    fasta_content = b">c1\nACGTACGTAC\n>c2\nGGCC\n"
+    
+    response = client.post("/upload?assembly_stats=true",
+        headers=auth_headers,
+        files={"file": ("contigs.fasta", BytesIO(fasta_content), "text/plain")}
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["contig_count"] == 2
+    assert data["n50"] == 10
+    
+    history = client.get("/history", headers=auth_headers)
+    assert history.json() == []
+
+
+def test_upload_genbank_features(client, auth_headers):
+    """Test GenBank feature-table extraction filtered by feature type."""
+    genbank_content = b"""LOCUS       test_seq                  20 bp    DNA     linear   UNK 
+DEFINITION  Test sequence
+ACCESSION   test_seq
+VERSION     test_seq
+FEATURES             Location/Qualifiers
+     gene            1..9
+                     /gene="abcA"
+     CDS             1..9
+                     /gene="abcA"
+ORIGIN      
+        1 atgaaataga tgcatgcatg
+//
+"""
+    
+    response = client.post("/upload/features?feature_type=CDS",
+        headers=auth_headers,
+        files={"file": ("test.gb", BytesIO(genbank_content), "text/plain")}
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_feature_count"] == 2
+    assert len(data["features"]) == 1
+    assert data["features"][0]["translation"] == "MK"
+    assert data["features"][0]["qualifiers"] == {"gene": ["abcA"]}
+
+
+def test_upload_all_records(client, auth_headers, db):
+    """Test multi-record upload analyzes and persists every record."""
+    from app.models.analysis import Analysis
+    
+    fasta_content = b""">contig1 first
+ATGCATGCATGC
+>contig2 second
+GGGCCCATATAT
+>bad1
+ATGCXXXX
+"""
+    
+    response = client.post("/upload?all_records=true",
+        headers=auth_headers,
+        files={"file": ("contigs.fasta", BytesIO(fasta_content), "text/plain")}
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["summary"]["record_count"] == 3
+    assert data["summary"]["analyzed_count"] == 2
+    assert data["summary"]["failed_count"] == 1
+    assert data["summary"]["total_length"] == 32
+    assert [r["record_id"] for r in data["records"]] == ["contig1", "contig2", "bad1"]
+    assert data["records"][0]["result"]["sequence_length"] == 12
+    assert data["records"][2]["error"] is not None
+    assert db.query(Analysis).count() == 2
+
+
+def test_upload_all_records_persists_in_batches(client, auth_headers, db, monkeypatch):
+    """Test multi-record analyses are saved in bounded batches."""
+    from app.crud import analysis as crud_analysis
+    from app.models.analysis import Analysis
+    from app.services import upload_service
+    
+    monkeypatch.setattr(upload_service, "UPLOAD_PERSIST_BATCH_ROWS", 2)
+    monkeypatch.setattr(upload_service, "UPLOAD_PERSIST_BATCH_BYTES", 30)
+    batch_sizes = []
+    create_analyses = crud_analysis.create_analyses
+    
+    def recording_create_analyses(db, user_id, entries):
+        batch_sizes.append(len(entries))
+        return create_analyses(db, user_id, entries)
+    
+    monkeypatch.setattr(crud_analysis, "create_analyses", recording_create_analyses)
+    # One record of 40 bases, which alone exceeds the byte budget, then five of 12
+    fasta_content = b">long\n" + b"ATGC" * 10 + b"\n" + b"".join(
+        b">contig%d\nATGCATGCATGC\n" % index for index in range(5)
+    )
+    
+    response = client.post("/upload?all_records=true",
+        headers=auth_headers,
+        files={"file": ("contigs.fasta", BytesIO(fasta_content), "text/plain")}
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["summary"]["analyzed_count"] == 6
+    assert batch_sizes == [1, 2, 2, 1]
+    assert db.query(Analysis).count() == 6
+
+
 def test_upload_unauthorized(client):
     """Test file upload without authentication returns 401."""
     fasta_content = b">test\nATGC\n"
@@ -191,3 +314,153 @@ def test_upload_unsupported_format(client, auth_headers):
     
     assert response.status_code == 400
     assert "unsupported" in response.json()["detail"].lower()
+
+
+def test_upload_rejects_oversized_body_before_parsing(client, auth_headers):
+    """Test uploads above the size limit are rejected with 413 up front."""
+    from app.config import settings
+    
+    oversized = b">big\n" + b"A" * (settings.MAX_FILE_SIZE + 128 * 1024)
+    
+    response = client.post("/upload",
+        headers=auth_headers,
+        files={"file": ("big.fasta", BytesIO(oversized), "text/plain")}
+    )
+    
+    assert response.status_code == 413
+
+
+def test_analyze_holds_no_connection_during_analysis(client, auth_headers, async_engine, monkeypatch):
+    """Test that /analyze checks out a connection only to save results."""
+    from sqlalchemy import event
+    from app.services.analysis_service import AnalysisService
+    from app.utils.security import user_cache
+    
+    checked_out = []
+    event.listen(async_engine.sync_engine, "checkout", lambda *args: checked_out.append(1))
+    event.listen(async_engine.sync_engine, "checkin", lambda *args: checked_out.pop())
+    
+    held_during_analysis = []
+    analyze = AnalysisService.analyze
+    
+    def recording_analyze(self, sequence, sequence_type):
+        held_during_analysis.append(len(checked_out))
+        return analyze(self, sequence, sequence_type)
+    
+    monkeypatch.setattr(AnalysisService, "analyze", recording_analyze)
+    # Force the user lookup, which must not keep its connection either
+    user_cache.clear()
+    
+    response = client.post("/analyze",
+        headers=auth_headers,
+        json={"sequence": "ATGCATGCATGC", "sequence_type": "DNA"}
+    )
+    
+    assert response.status_code == 200
+    assert held_during_analysis == [0]
+    assert checked_out == []
+
+
+def test_analyze_write_behind_history(client, db, auth_headers, async_engine):
+    """Test that queued history rows are inserted in batches and drained on stop."""
+    import time
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+    from app.main import app
+    from app.models.analysis import Analysis
+    from app.services.history_writer import HistoryWriter, get_history_writer
+    
+    writer = HistoryWriter(
+        enabled=True,
+        max_queue=100,
+        batch_size=10,
+        session_factory=async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    )
+    app.dependency_overrides[get_history_writer] = lambda: writer
+    
+    for sequence in ("ATGCATGCATGC", "GGGCCCAAATTT", "ATGCATGCATGC"):
+        response = client.post("/analyze",
+            headers=auth_headers,
+            json={"sequence": sequence, "sequence_type": "DNA"}
+        )
+        assert response.status_code == 200
+    
+    # The writer's task runs on the test client's event loop thread
+    deadline = time.monotonic() + 5
+    while writer.metrics()["written"] < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    
+    assert writer.metrics() == {"queued": 0, "written": 3, "retried": 0, "dropped": 0}
+    assert db.query(Analysis).count() == 3
+    
+    history = client.get("/history", headers=auth_headers).json()
+    assert [record["sequence_preview"] for record in history] == [
+        "ATGCATGCATGC", "GGGCCCAAATTT", "ATGCATGCATGC"
+    ]
+
+
+def test_history_writer_refuses_when_full():
+    """Test that a full or stopped writer leaves the write to the caller."""
+    import asyncio
+    from app.services.history_writer import HistoryWriter
+    
+    flushed = []
+    
+    class RecordingWriter(HistoryWriter):
+        async def _flush(self, batch):
+            flushed.extend(batch)
+    
+    async def scenario():
+        writer = RecordingWriter(enabled=True, max_queue=2, batch_size=10)
+        queued = [writer.submit(1, "DNA", "ATGC", {}) for _ in range(3)]
+        await writer.stop()
+        return queued, writer.submit(1, "DNA", "ATGC", {})
+    
+    queued, after_stop = asyncio.run(scenario())
+    
+    assert queued == [True, True, False]
+    assert after_stop is False
+    assert len(flushed) == 2
+
+
+def test_history_writer_retries_then_isolates_bad_rows(monkeypatch):
+    """Test that a failing batch is retried, then written row by row."""
+    import asyncio
+    from app.services import history_writer
+    
+    calls = []
+    
+    async def create_entries(db, entries):
+        calls.append(len(entries))
+        # The first attempt fails transiently, later ones on the bad row only
+        if len(calls) == 1 or any(entry[2] == "BAD" for entry in entries):
+            raise RuntimeError("insert failed")
+        return len(entries)
+    
+    class Session:
+        async def __aenter__(self):
+            return self
+        
+        async def __aexit__(self, *exc_info):
+            return False
+    
+    monkeypatch.setattr(history_writer, "create_history_entries_async", create_entries)
+    writer = history_writer.HistoryWriter(
+        enabled=True,
+        session_factory=Session,
+        retries=2,
+        retry_backoff=0
+    )
+    batch = [(1, "DNA", sequence, {}, None) for sequence in ("ATGC", "BAD", "GGCC")]
+    
+    asyncio.run(writer._flush(batch))
+    
+    assert calls == [3, 3, 3, 1, 1, 1]
+    assert writer.metrics() == {"queued": 0, "written": 2, "retried": 2, "dropped": 1}
+
+
+def test_health_reports_dropped_history_rows(client):
+    """Test that /health exposes the write-behind history counters."""
+    response = client.get("/health")
+    
+    assert response.status_code == 200
+    assert response.json()["history_writer"]["dropped"] == 0
@@ -161,3 +161,61 @@ class TestSequenceValidation:
         
         # Should not raise exception
         service._validate_protein_sequence("ACDEFGHIKLMNPQRSTVWY")
+
+
+class TestServiceLifecycle:
+    """Tests for the application-scoped service and its warm-up."""
+    
+    def test_get_analysis_service_is_singleton(self):
+        """Test the dependency returns the same instance every time."""
+        from app.services.analysis_service import get_analysis_service
+        
+        assert get_analysis_service() is get_analysis_service()
+    
+    def test_analyze_dispatches_by_type(self):
+        """Test analyze routes to the method for the sequence type."""
+        service = AnalysisService()
+        
+        assert service.analyze("ATGCATGC", "DNA").sequence_type == "DNA"
+        assert service.analyze("AUGCAUGC", "RNA").sequence_type == "RNA"
+        assert service.analyze("ACDEFGHIK", "Protein").sequence_type == "Protein"
+    
+    def test_analyze_rejects_unknown_type(self):
+        """Test analyze rejects an unknown sequence type."""
+        service = AnalysisService()
+        
+        with pytest.raises(HTTPException) as exc_info:
+            service.analyze("ATGC", "XNA")
+        
+        assert exc_info.value.status_code == 400
+    
+    def test_analyze_many_inline(self):
+        """Test batch analysis reports per-item errors without aborting."""
+        service = AnalysisService(max_workers=1)
+        
+        outcomes = list(service.analyze_many([
+            ("ATGCATGC", "DNA"),
+            ("ATGCX", "DNA"),
+            ("ACDEFGHIK", "Protein"),
+        ]))
+        
+        assert outcomes[0][0].sequence_type == "DNA"
+        assert outcomes[1][0] is None
+        assert "invalid characters" in outcomes[1][1].lower()
+        assert outcomes[2][0].sequence_type == "Protein"
+    
+    def test_analyze_many_with_worker_pool(self):
+        """Test batch analysis across worker processes preserves input order."""
+        service = AnalysisService(max_workers=2)
+        items = [("ATGC" * (i + 2), "DNA") for i in range(6)]
+        
+        try:
+            outcomes = list(service.analyze_many(items))
+        finally:
+            service.shutdown()
+        
+        assert [result.sequence_length for result, _ in outcomes] == [8, 12, 16, 20, 24, 28]
+    
+    def test_warm_up(self):
+        """Test warm-up runs without raising."""
+        AnalysisService().warm_up()
@@ -102,3 +102,10 @@ def test_login_missing_fields(client):
     })
     
     assert response.status_code == 422
+
+
+def test_logout_invalid_token(client):
+    """Test that logging out with a token that does not decode returns 401."""
+    response = client.post("/auth/logout", headers={"Authorization": "Bearer not-a-jwt"})
+    
+    assert response.status_code == 401
@@ -1,8 +1,10 @@
 """
 Unit tests for the authentication service.
 """
+import asyncio
 import pytest
 from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
 from app.services.auth_service import AuthService
 from app.schemas.user import UserCreate
 from app.utils.security import verify_password, decode_jwt_token
@@ -91,6 +93,80 @@ class TestUserAuthentication:
         
         assert exc_info.value.status_code == 401
         assert "invalid" in exc_info.value.detail.lower()
+    
+    def test_authenticate_rehashes_on_cost_change(self, db, test_user, monkeypatch):
+        """Test login transparently upgrades a hash made with another cost factor."""
+        from app.utils import security as security_utils
+        
+        old_hash = test_user.hashed_password
+        monkeypatch.setattr(security_utils, "BCRYPT_ROUNDS", security_utils.BCRYPT_ROUNDS + 1)
+        
+        user = AuthService(db).authenticate_user("test@example.com", "password123")
+        
+        assert user.hashed_password != old_hash
+        assert not security_utils.password_needs_rehash(user.hashed_password)
+        assert verify_password("password123", user.hashed_password)
+
+
+class TestAsyncAuthentication:
+    """Tests for the async registration and login paths used by the routes."""
+    
+    def test_authenticate_user_async(self, db, test_user):
+        """Test async authentication runs bcrypt on the dedicated executor."""
+        from app.utils.security import password_executor
+        
+        submitted = password_executor.stats()["submitted"]
+        service = AuthService(db)
+        
+        user = asyncio.run(service.authenticate_user_async("test@example.com", "password123"))
+        
+        assert user.id == test_user.id
+        assert password_executor.stats()["submitted"] == submitted + 1
+    
+    def test_register_and_authenticate_with_async_session(self, db, async_engine):
+        """Test the async paths query through an AsyncSession end to end."""
+        from sqlalchemy.ext.asyncio import AsyncSession
+        
+        user_data = UserCreate(name="Async User", email="async@example.com", password="password123")
+        
+        async def scenario():
+            async with AsyncSession(async_engine, expire_on_commit=False) as session:
+                service = AuthService(session)
+                created = await service.register_user_async(user_data)
+                authenticated = await service.authenticate_user_async("async@example.com", "password123")
+                return created, authenticated
+        
+        created, authenticated = asyncio.run(scenario())
+        
+        assert authenticated.id == created.id
+        assert authenticated.name == "Async User"
+
+
+class TestPasswordExecutor:
+    """Tests for the bounded password hashing executor."""
+    
+    def test_rejects_when_saturated(self):
+        """Test submissions beyond the queue-depth limit are rejected."""
+        import threading
+        from app.utils.executor import BoundedExecutor, ExecutorSaturatedError
+        
+        executor = BoundedExecutor(name="test", max_workers=1, max_queue=0)
+        release = threading.Event()
+        
+        async def scenario():
+            running = asyncio.ensure_future(executor.run(release.wait))
+            await asyncio.sleep(0)
+            with pytest.raises(ExecutorSaturatedError):
+                await executor.run(lambda: None)
+            release.set()
+            await running
+        
+        asyncio.run(scenario())
+        executor.shutdown()
+        
+        stats = executor.stats()
+        assert stats["rejected"] == 1
+        assert stats["completed"] == 1
 
 
 class TestJWTTokenCreation:
@@ -125,6 +201,72 @@ class TestJWTTokenCreation:
         
         assert "exp" in payload
         assert payload["exp"] is not None
+    
+    def test_decode_uses_verified_token_cache(self, db, test_user, monkeypatch):
+        """Test that a repeat decode skips signature verification."""
+        from app.utils import security as security_utils
+        
+        token = AuthService(db).create_access_token(test_user)
+        first = decode_jwt_token(token)
+        
+        def fail_decode(*args, **kwargs):
+            raise AssertionError("token re-verified on cache hit")
+        
+        monkeypatch.setattr(security_utils.jwt, "decode", fail_decode)
+        second = decode_jwt_token(token)
+        
+        assert second == first
+    
+    def test_revoked_token_rejected(self, db, test_user):
+        """Test that a revoked token is purged and rejected."""
+        from app.utils.security import revoke_token
+        
+        token = AuthService(db).create_access_token(test_user)
+        decode_jwt_token(token)
+        
+        revoke_token(token)
+        
+        with pytest.raises(HTTPException) as exc_info:
+            decode_jwt_token(token)
+        
+        assert exc_info.value.status_code == 401
+    
+    def test_revocation_survives_many_later_revocations(self, db, test_user):
+        """Test that revocations are never evicted while the token is valid."""
+        from app.utils.security import revoke_token, revoked_tokens, _token_digest
+        
+        token = AuthService(db).create_access_token(test_user)
+        revoke_token(token)
+        for index in range(1000):
+            revoked_tokens.add(f"flood-{index}", ttl=3600)
+        
+        with pytest.raises(HTTPException):
+            decode_jwt_token(token)
+        assert _token_digest(token) in revoked_tokens
+    
+    def test_revoke_invalid_token_rejected(self):
+        """Test that revoking a token that does not decode raises 401."""
+        from app.utils.security import revoke_token, revoked_tokens
+        
+        with pytest.raises(HTTPException) as exc_info:
+            revoke_token("not-a-jwt")
+        
+        assert exc_info.value.status_code == 401
+        assert len(revoked_tokens) == 0
+    
+    def test_expiring_set_drops_expired_members(self):
+        """Test that denylist members expire and are purged."""
+        from app.utils.cache import ExpiringSet
+        
+        now = [0.0]
+        members = ExpiringSet(timer=lambda: now[0])
+        members.add("a", ttl=10)
+        members.add("b", ttl=20)
+        
+        now[0] = 15
+        assert "a" not in members
+        assert "b" in members
+        assert len(members) == 1
 
 
 class TestPasswordSecurity:
@@ -155,3 +297,54 @@ class TestPasswordSecurity:
         assert verify_password(password, hashed)
         # Wrong password should not verify
         assert not verify_password("wrongpassword", hashed)
+
+
+class TestCurrentUserCache:
+    """Tests for the authenticated user principal cache."""
+    
+    def _resolve(self, db, token):
+        from app.utils.security import get_current_user
+        
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        return asyncio.run(get_current_user(credentials=credentials, db=db))
+    
+    def test_cache_hit_skips_database(self, db, test_user):
+        """Test that a cached principal is returned without querying the database."""
+        token = AuthService(db).create_access_token(test_user)
+        
+        first = self._resolve(db, token)
+        db.close()
+        
+        class FailingSession:
+            def query(self, *args, **kwargs):
+                raise AssertionError("database queried on cache hit")
+        
+        second = self._resolve(FailingSession(), token)
+        
+        assert first.id == test_user.id
+        assert second == first
+    
+    def test_update_user_invalidates_cache(self, db, test_user):
+        """Test that updating a user refreshes their cached principal."""
+        from app.crud.user import update_user
+        
+        token = AuthService(db).create_access_token(test_user)
+        assert self._resolve(db, token).name == "Test User"
+        
+        update_user(db, test_user, name="Renamed User")
+        
+        assert self._resolve(db, token).name == "Renamed User"
+    
+    def test_delete_user_invalidates_cache(self, db, test_user):
+        """Test that deleting a user revokes their cached principal."""
+        from app.crud.user import delete_user
+        
+        token = AuthService(db).create_access_token(test_user)
+        self._resolve(db, token)
+        
+        delete_user(db, test_user.id)
+        
+        with pytest.raises(HTTPException) as exc_info:
+            self._resolve(db, token)
+        
+        assert exc_info.value.status_code == 401
@@ -1,8 +1,14 @@
 """
 Unit tests for the file service.
 """
+import bz2
+import gzip
+import io
+import lzma
+import tempfile
 import pytest
 from fastapi import HTTPException
+from app.services.fasta_reader import iter_fasta, iter_fasta_buffer
 from app.services.file_service import FileService
 
 
@@ -66,6 +72,25 @@ GCATGCAT
         assert sequence_type == "DNA"
 
 
+    def test_iter_records_yields_every_record(self):
+        """Test iterating all records of a multi-FASTA file."""
+        service = FileService()
+        
+        fasta_content = b""">contig1 first contig
+ATGCATGC
+>contig2 second contig
+AUGCAUGC
+>prot1
+MEQPFIL
+"""
+        
+        records = list(service.iter_records(io.BytesIO(fasta_content), "test.fasta"))
+        
+        assert [r.record_id for r in records] == ["contig1", "contig2", "prot1"]
+        assert records[0].description == "contig1 first contig"
+        assert [r.sequence_type for r in records] == ["DNA", "RNA", "Protein"]
+
+
 class TestGenBankParsing:
     """Tests for GenBank file parsing."""
     
@@ -115,6 +140,15 @@ ORIGIN
         
         assert sequence == "ATGCAT"
         assert sequence_type == "DNA"
+    
+    def test_warm_up_genbank_parses_without_warnings(self):
+        """Test the warm-up GenBank document has a complete LOCUS line."""
+        import warnings
+        from Bio import BiopythonParserWarning
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", BiopythonParserWarning)
+            FileService().warm_up()
 
 
 class TestFileFormatDetection:
@@ -258,3 +292,436 @@ class TestFileValidation:
         assert exc_info.value.status_code == 400
         assert "no valid sequences" in exc_info.value.detail.lower()
 
+
+
+class TestStreamingParsing:
+    """Tests for incremental parsing from a binary stream."""
+    
+    def test_parse_stream_fasta(self):
+        """Test parsing a FASTA file from a file object."""
+        service = FileService()
+        stream = io.BytesIO(b">seq1\nATGCATGC\nGCATGCAT\n")
+        
+        sequence, sequence_type = service.parse_stream(stream, "test.fasta")
+        
+        assert sequence == "ATGCATGCGCATGCAT"
+        assert sequence_type == "DNA"
+        # The caller's stream must stay usable
+        assert not stream.closed
+    
+    def test_parse_stream_rejects_oversized_seekable_file(self, monkeypatch):
+        """Test seekable uploads are rejected by size before parsing."""
+        service = FileService()
+        monkeypatch.setattr(FileService, "MAX_FILE_SIZE", 16)
+        
+        with pytest.raises(HTTPException) as exc_info:
+            service.parse_stream(io.BytesIO(b">seq1\n" + b"A" * 32), "test.fasta")
+        
+        assert exc_info.value.status_code == 413
+    
+    def test_parse_stream_aborts_unseekable_file_at_limit(self, monkeypatch):
+        """Test non-seekable streams are aborted once the limit is crossed."""
+        class UnseekableStream(io.BytesIO):
+            def seekable(self):
+                return False
+        
+        service = FileService()
+        monkeypatch.setattr(FileService, "MAX_FILE_SIZE", 1024)
+        stream = UnseekableStream(b">seq1\n" + b"A" * 4096 + b"\n")
+        
+        with pytest.raises(HTTPException) as exc_info:
+            service.parse_stream(stream, "test.fasta")
+        
+        assert exc_info.value.status_code == 413
+
+
+class TestCompressedParsing:
+    """Tests for transparently decompressed uploads."""
+    
+    FASTA = b">seq1\nATGCATGC\n>seq2\nGGCCAATT\n"
+    
+    @pytest.mark.parametrize("filename,compress", [
+        ("test.fa.gz", gzip.compress),
+        ("test.fasta.bz2", bz2.compress),
+        ("test.fa.xz", lzma.compress),
+    ])
+    def test_parse_compressed_fasta(self, filename, compress):
+        """Test gzip, bzip2 and xz FASTA files are decompressed while parsing."""
+        service = FileService()
+        
+        records = list(service.iter_records(io.BytesIO(compress(self.FASTA)), filename))
+        
+        assert [r.sequence for r in records] == ["ATGCATGC", "GGCCAATT"]
+    
+    def test_parse_multi_member_gzip(self):
+        """Test block-gzipped (multi-member) files are read to the end."""
+        service = FileService()
+        content = gzip.compress(b">seq1\nATGC\n") + gzip.compress(b">seq2\nGGCC\n")
+        
+        records = list(service.iter_records(io.BytesIO(content), "test.fa.bgz"))
+        
+        assert [r.record_id for r in records] == ["seq1", "seq2"]
+    
+    def test_decompressed_size_limit(self, monkeypatch):
+        """Test the limit applies to decompressed bytes as well."""
+        service = FileService()
+        monkeypatch.setattr(FileService, "MAX_DECOMPRESSED_SIZE", 1024)
+        content = gzip.compress(b">seq1\n" + b"A" * 100000 + b"\n")
+        
+        with pytest.raises(HTTPException) as exc_info:
+            service.parse_stream(io.BytesIO(content), "test.fa.gz")
+        
+        assert exc_info.value.status_code == 413
+        assert "decompressed" in exc_info.value.detail.lower()
+    
+    def test_detect_format_ignores_compression_suffix(self):
+        """Test format detection looks past the compression extension."""
+        service = FileService()
+        
+        assert service._detect_format("genome.fa.gz") == "fasta"
+        assert service._detect_format("genome.GBK.XZ") == "genbank"
+        with pytest.raises(HTTPException):
+            service._detect_format("notes.txt.gz")
+
+
+class TestFastaReader:
+    """Test cases for the bytes-level FASTA reader."""
+    
+    def test_records_split_across_reads(self):
+        """Test records spanning read boundaries are reassembled."""
+        content = b">seq1 first\nATGC\nGGCC\n>seq2\nTTAA\n>seq3 third\nCCGG\n"
+        
+        for read_size in (1, 3, 4, 7, 1024):
+            records = list(iter_fasta(io.BytesIO(content), read_size=read_size))
+            assert records == [
+                ("seq1", "seq1 first", "ATGCGGCC"),
+                ("seq2", "seq2", "TTAA"),
+                ("seq3", "seq3 third", "CCGG"),
+            ]
+    
+    def test_buffer_reader_yields_views(self):
+        """Test single-line sequences are returned as views of the buffer."""
+        content = b">seq1\nATGC\n>seq2\nAT\nGC\n"
+        
+        records = [
+            (record_id, bytes(view), isinstance(view, memoryview))
+            for record_id, _, view in iter_fasta_buffer(content)
+        ]
+        
+        assert records == [("seq1", b"ATGC", True), ("seq2", b"ATGC", True)]
+    
+    def test_crlf_and_preamble(self):
+        """Test CRLF line endings and text before the first header."""
+        content = b"; comment\r\n>seq1 desc\r\nATG C\r\nGGCC\r\n"
+        
+        records = list(iter_fasta(io.BytesIO(content)))
+        
+        assert records == [("seq1", "seq1 desc", "ATGCGGCC")]
+
+
+class TestMappedParsing:
+    """Test cases for memory-mapped parsing of file-backed uploads."""
+    
+    def test_parse_file_backed_upload_from_mapping(self, monkeypatch):
+        """Test large file-backed FASTA uploads are parsed from an mmap."""
+        service = FileService()
+        monkeypatch.setattr(FileService, "MMAP_THRESHOLD", 0)
+        mapped = []
+        original = FileService._map_stream
+        monkeypatch.setattr(
+            FileService, "_map_stream",
+            lambda self, stream: mapped.append(original(self, stream)) or mapped[-1]
+        )
+        
+        with tempfile.TemporaryFile() as upload:
+            upload.write(b">seq1 first\nATGCATGC\n>seq2\nAUGC\nAUGC\n")
+            upload.seek(0)
+            records = list(service.iter_records(upload, "test.fasta"))
+        
+        assert mapped and mapped[0] is not None and mapped[0].closed
+        assert [(r.record_id, r.sequence, r.sequence_type) for r in records] == [
+            ("seq1", "ATGCATGC", "DNA"),
+            ("seq2", "AUGCAUGC", "RNA"),
+        ]
+    
+    def test_parse_stream_releases_mapping_after_first_record(self, monkeypatch):
+        """Test stopping after the first record unmaps the file cleanly."""
+        service = FileService()
+        monkeypatch.setattr(FileService, "MMAP_THRESHOLD", 0)
+        
+        with tempfile.TemporaryFile() as upload:
+            upload.write(b">seq1\nATGC\n>seq2\nGGCC\n")
+            upload.seek(0)
+            sequence, sequence_type = service.parse_stream(upload, "test.fa")
+        
+        assert sequence == "ATGC"
+        assert sequence_type == "DNA"
+    
+    def test_in_memory_spool_is_parsed_without_rollover(self, monkeypatch):
+        """Test spooled uploads still in memory are parsed from their buffer."""
+        service = FileService()
+        monkeypatch.setattr(FileService, "MMAP_THRESHOLD", 0)
+        
+        with tempfile.SpooledTemporaryFile(max_size=1024 * 1024) as upload:
+            upload.write(b">seq1 first\nATGCATGC\n>seq2\nAUGC\nAUGC\n")
+            upload.seek(0)
+            records = list(service.iter_records(upload, "test.fasta"))
+            
+            assert not upload._rolled
+        
+        assert [(r.record_id, r.sequence) for r in records] == [
+            ("seq1", "ATGCATGC"),
+            ("seq2", "AUGCAUGC"),
+        ]
+    
+    def test_in_memory_upload_falls_back_to_streaming(self, monkeypatch):
+        """Test streams without a file descriptor are parsed normally."""
+        service = FileService()
+        monkeypatch.setattr(FileService, "MMAP_THRESHOLD", 0)
+        
+        sequence, _ = service.parse_stream(io.BytesIO(b">seq1\nATGC\n"), "test.fa")
+        
+        assert sequence == "ATGC"
+
+
+class TestFastqSummary:
+    """Test cases for FASTQ read statistics."""
+    
+    FASTQ = (
+        b"@read1\nACGT\n+\nIIII\n"
+        b"@read2 second\nGGNN\n+read2\n!!II\n"
+        b"@read3\nAT\n+\n5?\n"
+    )
+    
+    def test_detect_format_fastq(self):
+        """Test .fastq/.fq files, compressed or not, are recognised."""
+        service = FileService()
+        
+        assert service.is_fastq("reads.fastq")
+        assert service.is_fastq("reads.FQ.gz")
+        assert not service.is_fastq("reads.fasta")
+    
+    def test_summarize_fastq(self):
+        """Test read, length, quality, GC and N statistics."""
+        service = FileService()
+        
+        summary = service.summarize_fastq(io.BytesIO(self.FASTQ), "reads.fastq")
+        
+        assert summary.read_count == 3
+        assert summary.total_bases == 10
+        assert (summary.min_length, summary.max_length) == (2, 4)
+        assert summary.length_distribution == {2: 1, 4: 2}
+        assert summary.per_position_mean_quality == [20.0, 23.33, 40.0, 40.0]
+        assert summary.per_position_n_content == [0.0, 0.0, 50.0, 50.0]
+        assert summary.gc_content == 40.0
+        assert summary.n_content == 20.0
+        assert summary.gc_distribution[50] == 2
+        assert summary.gc_distribution[0] == 1
+    
+    def test_summarize_fastq_in_batches(self):
+        """Test batched aggregation matches a single batch."""
+        from app.services.fastq_reader import summarize_fastq
+        
+        whole = summarize_fastq(io.BytesIO(self.FASTQ))
+        batched = summarize_fastq(io.BytesIO(self.FASTQ), batch_bases=1)
+        
+        assert batched.per_position_mean_quality() == whole.per_position_mean_quality()
+        assert batched.length_counts == whole.length_counts
+        assert batched.gc_histogram.tolist() == whole.gc_histogram.tolist()
+    
+    def test_fastq_batches_are_cut_by_bases(self):
+        """Test a batch ends with the read that reaches the base budget."""
+        from app.services.fastq_reader import iter_fastq_batches
+        
+        batches = list(iter_fastq_batches(io.BytesIO(self.FASTQ), batch_bases=5))
+        
+        assert [[len(sequence) for sequence in sequences] for sequences, _ in batches] == [[4, 4], [2]]
+    
+    def test_summarize_gzipped_fastq(self):
+        """Test gzipped FASTQ files are summarized."""
+        service = FileService()
+        
+        summary = service.summarize_fastq(io.BytesIO(gzip.compress(self.FASTQ)), "reads.fq.gz")
+        
+        assert summary.read_count == 3
+    
+    @pytest.mark.parametrize("content", [
+        b"read1\nACGT\n+\nIIII\n",
+        b"@read1\nACGT\n+\nIII\n",
+        b"@read1\nACGT\n",
+        b"@read1\nACGT\n-\nIIII\n",
+    ])
+    def test_malformed_fastq(self, content):
+        """Test malformed records are rejected with 400."""
+        service = FileService()
+        
+        with pytest.raises(HTTPException) as exc_info:
+            service.summarize_fastq(io.BytesIO(content), "reads.fastq")
+        
+        assert exc_info.value.status_code == 400
+    
+    def test_empty_fastq(self):
+        """Test files without reads are rejected."""
+        service = FileService()
+        
+        with pytest.raises(HTTPException) as exc_info:
+            service.summarize_fastq(io.BytesIO(b"\n"), "reads.fastq")
+        
+        assert exc_info.value.status_code == 400
+
+
+GENBANK_WITH_FEATURES = b"""LOCUS       TEST_FT                   30 bp    DNA     linear   UNK 
+DEFINITION  Feature table test record.
+ACCESSION   TEST_FT
+VERSION     TEST_FT.1
+FEATURES             Location/Qualifiers
+     source          1..30
+                     /organism="Synthetic construct"
+     gene            1..9
+                     /gene="abcA"
+     CDS             1..9
+                     /gene="abcA"
+                     /product="short
+                     peptide"
+                     /transl_table=11
+     CDS             complement(join(13..15,19..24))
+                     /gene="abcB"
+     rRNA            25..30
+                     /product="fragment"
+ORIGIN
+        1 atgaaataga aatatatgtt tcatgggcca
+//
+"""
+
+
+class TestAssemblyStatistics:
+    """Test cases for streaming assembly statistics."""
+    
+    ASSEMBLY = (
+        b">c1 first contig\nACGTNNNNAC\nGT\n"
+        b">c2\nGGGG\n"
+        b">c3\nATATATATAT\nnnATATATAT\n"
+    )
+    
+    def test_assembly_statistics(self):
+        """Test contiguity, GC, length histogram and gap statistics."""
+        service = FileService()
+        
+        result = service.assembly_statistics(io.BytesIO(self.ASSEMBLY), "contigs.fasta")
+        
+        assert result.contig_count == 3
+        assert result.total_length == 36
+        assert (result.min_length, result.max_length) == (4, 20)
+        assert (result.n50, result.l50) == (20, 1)
+        assert (result.n90, result.l90) == (4, 3)
+        assert result.gc_content == 26.67
+        assert result.n_content == 16.67
+        assert result.gc_distribution[0] == 1
+        assert result.gc_distribution[50] == 1
+        assert result.gc_distribution[100] == 1
+        assert [(b.min_length, b.max_length, b.count) for b in result.length_histogram] == [
+            (0, 10, 1), (10, None, 2)
+        ]
+        assert (result.gap_count, result.gap_total_length, result.longest_gap) == (2, 6, 4)
+    
+    def test_scan_is_independent_of_block_size(self):
+        """Test headers and gaps split across read blocks are handled."""
+        from app.services.assembly_stats import scan_assembly
+        
+        whole = scan_assembly(io.BytesIO(self.ASSEMBLY))
+        for read_size in (1, 2, 3, 7):
+            split = scan_assembly(io.BytesIO(self.ASSEMBLY), read_size=read_size)
+            assert list(split.lengths) == list(whole.lengths)
+            assert split.gc_histogram == whole.gc_histogram
+            assert (split.gap_count, split.longest_gap) == (whole.gap_count, whole.longest_gap)
+    
+    def test_assembly_statistics_compressed(self):
+        """Test compressed assemblies are decompressed while streaming."""
+        service = FileService()
+        
+        result = service.assembly_statistics(
+            io.BytesIO(gzip.compress(self.ASSEMBLY)), "contigs.fa.gz"
+        )
+        
+        assert result.contig_count == 3
+    
+    def test_assembly_statistics_requires_fasta(self):
+        """Test non-FASTA files are rejected."""
+        service = FileService()
+        
+        with pytest.raises(HTTPException) as exc_info:
+            service.assembly_statistics(io.BytesIO(b"@r\nACGT\n+\nIIII\n"), "reads.fastq")
+        
+        assert exc_info.value.status_code == 400
+    
+    def test_assembly_statistics_empty(self):
+        """Test files without records are rejected."""
+        service = FileService()
+        
+        with pytest.raises(HTTPException) as exc_info:
+            service.assembly_statistics(io.BytesIO(b""), "empty.fasta")
+        
+        assert exc_info.value.status_code == 400
+
+
+class TestGenBankFeatures:
+    """Test cases for GenBank feature-table extraction."""
+    
+    def test_extract_default_feature_types(self):
+        """Test CDS, gene and rRNA features are returned with qualifiers."""
+        service = FileService()
+        
+        table = service.extract_features(io.BytesIO(GENBANK_WITH_FEATURES), "test.gb")
+        
+        assert table.record_id == "TEST_FT.1"
+        assert table.sequence_length == 30
+        assert table.total_feature_count == 5
+        assert [f.type for f in table.features] == ["gene", "CDS", "CDS", "rRNA"]
+        cds = table.features[1]
+        assert (cds.start, cds.end, cds.strand) == (1, 9, 1)
+        assert cds.qualifiers["product"] == ["short peptide"]
+        assert cds.translation == "MK"
+        assert cds.composition.length == 9
+        assert cds.composition.amino_acid_counts == {"M": 1, "K": 1}
+    
+    def test_reverse_strand_cds_translation(self):
+        """Test complement(join(...)) CDS are spliced and reverse-complemented."""
+        service = FileService()
+        
+        table = service.extract_features(
+            io.BytesIO(GENBANK_WITH_FEATURES), "test.gb", feature_types=["CDS"], start=12
+        )
+        
+        assert len(table.features) == 1
+        cds = table.features[0]
+        assert cds.strand == -1
+        assert cds.translation == "MKI"
+    
+    def test_unselected_qualifiers_are_not_parsed(self):
+        """Test filtering by type leaves other features' qualifiers unparsed."""
+        from app.services.genbank_features import read_genbank_record
+        
+        record = read_genbank_record(io.StringIO(GENBANK_WITH_FEATURES.decode()))
+        selected = list(record.iter_features(["rRNA"]))
+        
+        assert [f.qualifier("product") for f in selected] == ["fragment"]
+        assert all("qualifiers" not in vars(f) for f in record.features if f.type != "rRNA")
+    
+    def test_extract_features_requires_genbank(self):
+        """Test non-GenBank files are rejected."""
+        service = FileService()
+        
+        with pytest.raises(HTTPException) as exc_info:
+            service.extract_features(io.BytesIO(b">seq1\nATGC\n"), "test.fasta")
+        
+        assert exc_info.value.status_code == 400
+    
+    def test_parse_location(self):
+        """Test span and strand resolution of common location forms."""
+        from app.services.genbank_features import parse_location
+        
+        assert parse_location("<1..>20") == ([(1, 20)], 1)
+        assert parse_location("join(1..3,7..9)") == ([(1, 3), (7, 9)], 1)
+        assert parse_location("complement(join(1..3,7..9))") == ([(7, 9), (1, 3)], -1)
+        assert parse_location("join(complement(7..9),complement(1..3))") == ([(7, 9), (1, 3)], -1)
+        assert parse_location("AB000001.1:1..3") is None
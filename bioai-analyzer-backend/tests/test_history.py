@@ -32,11 +32,34 @@ def test_get_history_authenticated(client, auth_headers, sample_analysis):
     record = data[0]
     assert "id" in record
     assert "sequence_type" in record
-    assert "input_sequence" in record
-    assert "results" in record
+    assert "sequence_length" in record
+    assert "gc_content" in record
+    assert "sequence_preview" in record
     assert "created_at" in record
 
 
+def test_get_history_returns_summaries(client, auth_headers):
+    """Test list rows are projected summaries and detail keeps full data."""
+    sequence = "ATGC" * 10
+    client.post("/analyze",
+        headers=auth_headers,
+        json={"sequence": sequence, "sequence_type": "DNA"}
+    )
+    
+    record = client.get("/history", headers=auth_headers).json()[0]
+    
+    assert record["sequence_type"] == "DNA"
+    assert record["sequence_length"] == 40
+    assert record["gc_content"] == "50.00"
+    assert record["sequence_preview"] == sequence[:20]
+    assert "input_sequence" not in record
+    assert "results" not in record
+    
+    detail = client.get(f"/history/{record['id']}", headers=auth_headers).json()
+    assert detail["input_sequence"] == sequence
+    assert detail["results"]["gc_content"] == "50.00"
+
+
 def test_get_history_unauthorized(client):
     """Test retrieving history without authentication returns 401."""
     response = client.get("/history")
@@ -67,6 +90,39 @@ def test_get_history_with_pagination(client, auth_headers, sample_analysis):
     assert response.status_code == 200
 
 
+def test_get_history_cursor_pagination(client, auth_headers):
+    """Test cursor pages cover every record once, newest first."""
+    for i in range(5):
+        client.post("/analyze",
+            headers=auth_headers,
+            json={
+                "sequence": "ATGC" * (i + 2),
+                "sequence_type": "DNA"
+            }
+        )
+    
+    seen = []
+    response = client.get("/history?limit=2", headers=auth_headers)
+    while True:
+        assert response.status_code == 200
+        seen.extend(record["id"] for record in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        response = client.get(f"/history?limit=2&cursor={cursor}", headers=auth_headers)
+    
+    all_ids = [record["id"] for record in client.get("/history", headers=auth_headers).json()]
+    assert seen == all_ids
+    assert len(seen) == 5
+
+
+def test_get_history_invalid_cursor(client, auth_headers):
+    """Test a malformed cursor returns 400."""
+    response = client.get("/history?cursor=not-a-cursor", headers=auth_headers)
+    
+    assert response.status_code == 400
+
+
 def test_get_history_max_limit(client, auth_headers):
     """Test history respects maximum limit of 100."""
     response = client.get("/history?limit=200", headers=auth_headers)
@@ -219,3 +275,191 @@ def test_delete_analysis_access_denied(client, db, sample_analysis):
         
         assert response.status_code == 403
         assert "access denied" in response.json()["detail"].lower()
+
+
+def test_repeated_sequences_are_stored_once(client, db, auth_headers):
+    """Test identical inputs share one compressed sequences row."""
+    from app.models.sequence import StoredSequence
+    
+    sequence = "ATGCGT" * 50
+    for _ in range(3):
+        client.post("/analyze",
+            headers=auth_headers,
+            json={"sequence": sequence, "sequence_type": "DNA"}
+        )
+    
+    stored = db.query(StoredSequence).all()
+    assert len(stored) == 1
+    assert stored[0].length == len(sequence)
+    assert len(stored[0].data) < len(sequence)
+    
+    records = client.get("/history", headers=auth_headers).json()
+    assert [r["sequence_length"] for r in records] == [len(sequence)] * 3
+    detail = client.get(f"/history/{records[0]['id']}", headers=auth_headers).json()
+    assert detail["input_sequence"] == sequence
+
+
+def test_delete_analysis_removes_unshared_sequence(client, db, auth_headers, test_user):
+    """Test deleting analyses keeps shared stored sequences and removes the rest."""
+    from app.crud.user import delete_user
+    from app.models.sequence import StoredSequence
+    from app.utils.sequence_codec import sequence_digest
+    
+    shared, unshared = "ATGC" * 20, "GGCCTA" * 10
+    for sequence in (shared, shared, unshared):
+        client.post("/analyze",
+            headers=auth_headers,
+            json={"sequence": sequence, "sequence_type": "DNA"}
+        )
+    records = client.get("/history", headers=auth_headers).json()
+    ids_by_length = {}
+    for record in records:
+        ids_by_length.setdefault(record["sequence_length"], []).append(record["id"])
+    
+    assert client.delete(f"/history/{ids_by_length[len(unshared)][0]}", headers=auth_headers).status_code == 204
+    assert client.delete(f"/history/{ids_by_length[len(shared)][0]}", headers=auth_headers).status_code == 204
+    
+    db.expire_all()
+    assert [s.digest for s in db.query(StoredSequence).all()] == [sequence_digest(shared)]
+    
+    delete_user(db, test_user.id)
+    assert db.query(StoredSequence).count() == 0
+
+
+def test_results_codec_round_trip():
+    """Test results survive the binary encoding unchanged."""
+    from app.utils.results_codec import decode_results, encode_results
+    
+    results = {
+        "sequence_type": "DNA",
+        "gc_content": "45.00",
+        "nucleotide_counts": {"A": 10, "T": 12, "G": 9, "C": 9},
+        "orfs": [{"start": 0, "end": 30, "frame": 1, "protein": "MK" * 200}],
+    }
+    
+    blob = encode_results(results)
+    
+    assert blob[0] == 1
+    assert decode_results(blob) == results
+    with pytest.raises(ValueError):
+        decode_results(b"\x09" + blob[1:])
+
+
+def test_legacy_json_results_are_readable(client, db, auth_headers):
+    """Test rows written before the binary encoding are still served."""
+    from app.models.analysis import Analysis
+    from app.models.user import User
+    
+    user = db.query(User).filter(User.email == "test@example.com").first()
+    legacy = Analysis(
+        user_id=user.id,
+        sequence_type="DNA",
+        legacy_input_sequence="ATGCATGCAT",
+        legacy_results={"sequence_type": "DNA", "gc_content": "40.00"}
+    )
+    db.add(legacy)
+    db.commit()
+    
+    record = client.get("/history", headers=auth_headers).json()[0]
+    assert record["gc_content"] == "40.00"
+    assert record["sequence_length"] == 10
+    
+    detail = client.get(f"/history/{legacy.id}", headers=auth_headers).json()
+    assert detail["results"]["gc_content"] == "40.00"
+    assert detail["input_sequence"] == "ATGCATGCAT"
+
+
+def test_get_history_filters_by_metrics(client, auth_headers):
+    """Test type, GC and length filters use the typed metric columns."""
+    for sequence, sequence_type in (
+        ("GGGGCCCCAT", "DNA"),
+        ("ATATATATGC" * 3, "DNA"),
+        ("MKTAYIAKQR", "Protein"),
+    ):
+        client.post("/analyze",
+            headers=auth_headers,
+            json={"sequence": sequence, "sequence_type": sequence_type}
+        )
+    
+    high_gc = client.get("/history?min_gc_content=60", headers=auth_headers).json()
+    assert [r["gc_content"] for r in high_gc] == ["80.00"]
+    
+    long_dna = client.get("/history?sequence_type=DNA&min_length=20", headers=auth_headers).json()
+    assert [r["sequence_length"] for r in long_dna] == [30]
+    
+    proteins = client.get("/history?sequence_type=Protein", headers=auth_headers).json()
+    assert len(proteins) == 1
+    assert proteins[0]["gc_content"] is None
+
+
+def test_result_metrics():
+    """Test metrics are parsed from string-formatted results."""
+    from app.crud.analysis import result_metrics
+    
+    assert result_metrics({
+        "sequence_length": 12,
+        "gc_content": "45.50",
+        "orfs": [{"start": 0}, {"start": 3}]
+    }) == {
+        "sequence_length": 12,
+        "gc_content": 45.5,
+        "orf_count": 2,
+        "molecular_weight": None,
+        "isoelectric_point": None
+    }
+    assert result_metrics({
+        "sequence_length": 5,
+        "molecular_weight": "600.10",
+        "isoelectric_point": "6.20"
+    })["isoelectric_point"] == 6.2
+
+
+def test_async_database_url_mapping():
+    """Test that request-path URLs map to asyncio drivers."""
+    from app.database import to_async_url
+
+    assert to_async_url("postgresql://u:p@db:5432/bioai") == "postgresql+asyncpg://u:p@db:5432/bioai"
+    assert to_async_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+    assert to_async_url("postgresql+asyncpg://db/bioai") == "postgresql+asyncpg://db/bioai"
+
+
+def test_create_analyses_returns_ids_in_order(db, test_user):
+    """Test that the bulk insert path returns the ids of its rows in order."""
+    from app.crud.analysis import create_analyses, get_analysis_by_id
+    
+    entries = [
+        ("DNA", "ATGCATGCATGC", {"sequence_length": 12, "gc_content": 50.0}),
+        ("Protein", "MKTAYIAKQR", {"sequence_length": 10, "molecular_weight": 1234.5}),
+        ("DNA", "ATGCATGCATGC", {"sequence_length": 12, "gc_content": 50.0}),
+    ]
+    
+    ids = create_analyses(db, test_user.id, entries)
+    
+    assert len(ids) == len(set(ids)) == 3
+    for analysis_id, (sequence_type, sequence, results) in zip(ids, entries):
+        analysis = get_analysis_by_id(db, analysis_id)
+        assert analysis.sequence_type == sequence_type
+        assert analysis.input_sequence == sequence
+        assert analysis.results == results
+    assert get_analysis_by_id(db, ids[1]).molecular_weight == 1234.5
+    assert create_analyses(db, test_user.id, []) == []
+
+
+def test_insert_benchmark_cleans_up(tmp_path):
+    """Test that the insert benchmark times both paths and removes its rows."""
+    from sqlalchemy import create_engine, func, select
+    from app.models import Analysis, User
+    from app.models.sequence import StoredSequence
+    from app.utils.insert_benchmark import run_benchmark
+    
+    database_url = f"sqlite:///{tmp_path / 'bench.db'}"
+    rates = run_benchmark(database_url, rows=5)
+    
+    assert set(rates) == {"single", "bulk"}
+    assert all(rate > 0 for rate in rates.values())
+    engine = create_engine(database_url)
+    with engine.connect() as connection:
+        assert connection.scalar(select(func.count()).select_from(Analysis)) == 0
+        assert connection.scalar(select(func.count()).select_from(User)) == 0
+        assert connection.scalar(select(func.count()).select_from(StoredSequence)) == 0
+    engine.dispose()
@@ -0,0 +1,164 @@
+"""
+Integration tests for reference sequence endpoints.
+Tests storing FASTA references and faidx-style region queries.
+"""
+import os
+from io import BytesIO
+import pytest
+
+from app.services.sequence_store import SequenceStore, get_sequence_store
+
+
+REFERENCE = (
+    b">chr1 first chromosome\n"
+    + b"ATGC" * 40 + b"\n"
+    + b">chr2\n"
+    + b"GGGCCCAAATTT\n"
+)
+
+
+@pytest.fixture
+def sequence_store(client, tmp_path):
+    """Point the sequence store at a temporary directory."""
+    from app.main import app
+    
+    store = SequenceStore(root=str(tmp_path), line_bases=10)
+    app.dependency_overrides[get_sequence_store] = lambda: store
+    return store
+
+
+@pytest.fixture
+def reference(client, auth_headers, sequence_store):
+    """Store a sample reference."""
+    response = client.post("/sequences",
+        headers=auth_headers,
+        files={"file": ("ref.fa", BytesIO(REFERENCE), "text/plain")}
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_sequence_store_region_offsets(tmp_path):
+    """Test regions spanning line breaks are read back exactly."""
+    store = SequenceStore(root=str(tmp_path), line_bases=7)
+    sequence = "".join("ACGT"[i % 4] for i in range(53))
+    
+    key, entries = store.write([("a", "GATTACA"), ("b", sequence)])
+    entry = store.read_index(key)["b"]
+    
+    assert entries[1] == entry
+    for start, end in [(1, 53), (7, 8), (14, 15), (50, 53), (22, 22)]:
+        assert store.fetch(key, entry, start, end) == sequence[start - 1:end]
+    with open(os.path.join(str(tmp_path), f"{key}.fa.fai")) as index:
+        assert index.readline() == "a\t7\t3\t7\t8\n"
+
+
+def test_sequence_store_caches_index(tmp_path):
+    """Test parsed indexes are reused until the reference is deleted."""
+    store = SequenceStore(root=str(tmp_path))
+    key, _ = store.write([("a", "GATTACA")])
+    
+    assert store.read_index(key) is store.read_index(key)
+    
+    store.delete(key)
+    with pytest.raises(FileNotFoundError):
+        store.read_index(key)
+
+
+def test_upload_reference(reference):
+    """Test storing a reference returns its records."""
+    assert reference["record_count"] == 2
+    assert reference["total_length"] == 172
+    assert reference["records"] == [
+        {"name": "chr1", "length": 160},
+        {"name": "chr2", "length": 12},
+    ]
+
+
+def test_reference_size_limit_is_independent_of_max_file_size(client, auth_headers, sequence_store, monkeypatch):
+    """Test references are bounded by the store's limit, not MAX_FILE_SIZE."""
+    from app.services.file_service import FileService
+    monkeypatch.setattr(FileService, "MAX_FILE_SIZE", 64)
+    
+    response = client.post("/sequences",
+        headers=auth_headers,
+        files={"file": ("ref.fa", BytesIO(REFERENCE), "text/plain")}
+    )
+    assert response.status_code == 201
+    
+    sequence_store.max_size = 64
+    response = client.post("/sequences",
+        headers=auth_headers,
+        files={"file": ("ref.fa", BytesIO(REFERENCE), "text/plain")}
+    )
+    assert response.status_code == 413
+
+
+def test_upload_reference_requires_fasta(client, auth_headers, sequence_store):
+    """Test non-FASTA references are rejected."""
+    response = client.post("/sequences",
+        headers=auth_headers,
+        files={"file": ("ref.fastq", BytesIO(b"@r\nA\n+\nI\n"), "text/plain")}
+    )
+    
+    assert response.status_code == 400
+
+
+def test_list_references(client, auth_headers, reference):
+    """Test stored references are listed."""
+    response = client.get("/sequences", headers=auth_headers)
+    
+    assert response.status_code == 200
+    assert [r["id"] for r in response.json()] == [reference["id"]]
+
+
+def test_analyze_region(client, auth_headers, reference):
+    """Test a region is extracted, analyzed and saved to history."""
+    response = client.get(
+        f"/sequences/{reference['id']}/region?start=5&end=16",
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["record"] == "chr1"
+    assert data["sequence"] == "ATGCATGCATGC"
+    assert data["result"]["sequence_length"] == 12
+    
+    history = client.get("/history", headers=auth_headers).json()
+    assert history[0]["sequence_preview"] == "ATGCATGCATGC"
+
+
+def test_analyze_region_named_record(client, auth_headers, reference):
+    """Test regions can be taken from a named record."""
+    response = client.get(
+        f"/sequences/{reference['id']}/region?start=4&end=9&record=chr2",
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["sequence"] == "CCCAAA"
+
+
+@pytest.mark.parametrize("query", ["start=10&end=5", "start=1&end=161", "start=1&end=5&record=chrX"])
+def test_analyze_region_invalid(client, auth_headers, reference, query):
+    """Test out-of-range regions and unknown records are rejected."""
+    response = client.get(
+        f"/sequences/{reference['id']}/region?{query}",
+        headers=auth_headers
+    )
+    
+    assert response.status_code in (400, 404)
+
+
+def test_delete_reference(client, auth_headers, reference, sequence_store):
+    """Test deleting a reference removes its files."""
+    response = client.delete(f"/sequences/{reference['id']}", headers=auth_headers)
+    
+    assert response.status_code == 204
+    assert os.listdir(sequence_store.root) == []
+    response = client.get(
+        f"/sequences/{reference['id']}/region?start=1&end=5",
+        headers=auth_headers
+    )
+    assert response.status_code == 404
@@ -0,0 +1,47 @@
+"""
+Tests for application cold-start behaviour.
+"""
+import os
+import subprocess
+import sys
+
+from app.utils.import_report import parse_importtime, format_report
+
+
+def test_main_does_not_import_biopython():
+    """Test that importing app.main defers Biopython until first use."""
+    env = dict(os.environ, DATABASE_URL="sqlite://", SECRET_KEY="test")
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, app.main; print(any(m.startswith('Bio') for m in sys.modules))"
+        ],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.strip() == "False"
+
+
+def test_parse_importtime_output():
+    """Test parsing of python -X importtime output."""
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     app.config\n"
+        "import time:       300 |        420 | app.main\n"
+    )
+    
+    timings = parse_importtime(output)
+    
+    assert [t.module for t in timings] == ["app.config", "app.main"]
+    assert timings[0].depth == 2
+    assert timings[1].depth == 0
+    assert timings[1].cumulative_us == 420
+    
+    report = format_report(timings, top=1)
+    assert "Total import time: 0.4 ms" in report
+    assert "app.main" in report
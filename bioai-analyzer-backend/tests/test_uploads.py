@@ -0,0 +1,216 @@
+"""
+Integration tests for resumable upload endpoints.
+Tests chunked transfer, progress reporting and finalization.
+"""
+import hashlib
+import pytest
+
+from app.services.upload_sessions import UploadSessionStore, get_upload_session_store
+
+
+FASTA = b">contig1 first\n" + b"ATGC" * 30 + b"\n>contig2\nGGGCCCATATAT\n"
+CHUNK_SIZE = 64 * 1024
+
+
+@pytest.fixture
+def upload_store(client, tmp_path):
+    """Point the upload session store at a temporary directory."""
+    from app.main import app
+    
+    store = UploadSessionStore(root=str(tmp_path))
+    app.dependency_overrides[get_upload_session_store] = lambda: store
+    return store
+
+
+def _chunks(content, chunk_size):
+    return [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)]
+
+
+def _put_chunk(client, headers, upload_id, index, data, checksum=None):
+    return client.put(
+        f"/uploads/{upload_id}/chunks/{index}",
+        headers={**headers, "X-Chunk-SHA256": checksum or hashlib.sha256(data).hexdigest()},
+        content=data
+    )
+
+
+def _create(client, headers, content, filename="contigs.fasta"):
+    response = client.post("/uploads", headers=headers, json={
+        "filename": filename,
+        "total_size": len(content),
+        "chunk_size": CHUNK_SIZE
+    })
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_resumable_upload_out_of_order(client, auth_headers, upload_store):
+    """Test chunks sent out of order are assembled and analyzed."""
+    content = FASTA + b">filler\n" + b"A" * (2 * CHUNK_SIZE) + b"\n"
+    session = _create(client, auth_headers, content)
+    chunks = _chunks(content, CHUNK_SIZE)
+    assert session["chunk_count"] == len(chunks) == 3
+    
+    assert _put_chunk(client, auth_headers, session["upload_id"], 2, chunks[2]).status_code == 200
+    status = _put_chunk(client, auth_headers, session["upload_id"], 0, chunks[0]).json()
+    assert status["received_offset"] == CHUNK_SIZE
+    assert status["missing_chunks"] == [1]
+    
+    response = client.post(f"/uploads/{session['upload_id']}/complete", headers=auth_headers)
+    assert response.status_code == 409
+    
+    _put_chunk(client, auth_headers, session["upload_id"], 1, chunks[1])
+    response = client.post(
+        f"/uploads/{session['upload_id']}/complete?all_records=true",
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["summary"]["record_count"] == 3
+    status = client.get(f"/uploads/{session['upload_id']}", headers=auth_headers).json()
+    assert status["state"] == "completed"
+    assert status["result"]["summary"]["analyzed_count"] == data["summary"]["analyzed_count"]
+
+
+def test_chunk_checksum_mismatch(client, auth_headers, upload_store):
+    """Test chunks with a wrong checksum are rejected and not recorded."""
+    session = _create(client, auth_headers, FASTA)
+    
+    response = _put_chunk(client, auth_headers, session["upload_id"], 0, FASTA, checksum="0" * 64)
+    
+    assert response.status_code == 400
+    status = client.get(f"/uploads/{session['upload_id']}", headers=auth_headers).json()
+    assert status["received_offset"] == 0
+
+
+def test_chunk_wrong_length(client, auth_headers, upload_store):
+    """Test chunks of the wrong size are rejected."""
+    session = _create(client, auth_headers, FASTA)
+    
+    response = _put_chunk(client, auth_headers, session["upload_id"], 0, FASTA[:-1])
+    
+    assert response.status_code == 400
+
+
+def test_create_upload_rejects_unsupported_format(client, auth_headers, upload_store):
+    """Test sessions are only created for supported file formats."""
+    response = client.post("/uploads", headers=auth_headers, json={
+        "filename": "notes.txt",
+        "total_size": 10
+    })
+    
+    assert response.status_code == 400
+
+
+def test_upload_size_limit_is_independent_of_max_file_size(client, auth_headers, upload_store, monkeypatch):
+    """Test resumable uploads are bounded by their own limit, not MAX_FILE_SIZE."""
+    from app.services.file_service import FileService
+    monkeypatch.setattr(FileService, "MAX_FILE_SIZE", 1024)
+    content = FASTA + b">filler\n" + b"A" * (2 * CHUNK_SIZE) + b"\n"
+    session = _create(client, auth_headers, content)
+    for index, chunk in enumerate(_chunks(content, CHUNK_SIZE)):
+        assert _put_chunk(client, auth_headers, session["upload_id"], index, chunk).status_code == 200
+    
+    response = client.post(f"/uploads/{session['upload_id']}/complete", headers=auth_headers)
+    
+    assert response.status_code == 200
+    
+    upload_store.max_size = CHUNK_SIZE
+    response = client.post("/uploads", headers=auth_headers, json={
+        "filename": "contigs.fasta",
+        "total_size": CHUNK_SIZE + 1,
+        "chunk_size": CHUNK_SIZE
+    })
+    assert response.status_code == 413
+
+
+def test_single_record_longer_than_analysis_request_limit(client, auth_headers, upload_store, db):
+    """Test a resumable upload's record may exceed the /analyze length limit."""
+    from app.models.analysis import Analysis
+    content = b">long\n" + b"GATC" * 30000 + b"\n"
+    session = _create(client, auth_headers, content)
+    for index, chunk in enumerate(_chunks(content, CHUNK_SIZE)):
+        _put_chunk(client, auth_headers, session["upload_id"], index, chunk)
+    
+    response = client.post(f"/uploads/{session['upload_id']}/complete", headers=auth_headers)
+    
+    assert response.status_code == 200
+    assert response.json()["sequence_length"] == 120000
+    assert db.query(Analysis).count() == 1
+
+
+def test_finalization_is_taken_once(client, auth_headers, upload_store):
+    """Test only one complete call wins and later chunks are rejected."""
+    session = _create(client, auth_headers, FASTA)
+    _put_chunk(client, auth_headers, session["upload_id"], 0, FASTA)
+    
+    # A concurrent complete took the session first
+    upload_store.begin_processing(session["upload_id"])
+    
+    response = client.post(f"/uploads/{session['upload_id']}/complete", headers=auth_headers)
+    assert response.status_code == 409
+    response = _put_chunk(client, auth_headers, session["upload_id"], 0, FASTA)
+    assert response.status_code == 409
+
+
+def test_chunk_write_refused_after_processing_started(upload_store):
+    """Test a chunk PUT that raced finalization is refused by the store."""
+    from app.services.upload_sessions import UploadSessionConflict
+    session = upload_store.create(1, "contigs.fasta", len(FASTA), CHUNK_SIZE)
+    upload_store.write_chunk(session, 0, FASTA, hashlib.sha256(FASTA).hexdigest())
+    
+    upload_store.begin_processing(session.upload_id)
+    
+    with pytest.raises(UploadSessionConflict):
+        upload_store.write_chunk(session, 0, FASTA, hashlib.sha256(FASTA).hexdigest())
+    with pytest.raises(UploadSessionConflict):
+        upload_store.begin_processing(session.upload_id)
+
+
+def test_background_finalization(client, auth_headers, upload_store, db, monkeypatch):
+    """Test background processing reports its result through the status endpoint."""
+    from app import database
+    monkeypatch.setattr(database, "SessionLocal", lambda: db)
+    session = _create(client, auth_headers, FASTA)
+    _put_chunk(client, auth_headers, session["upload_id"], 0, FASTA)
+    
+    response = client.post(
+        f"/uploads/{session['upload_id']}/complete?background=true",
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 202
+    assert response.json()["state"] == "processing"
+    status = client.get(f"/uploads/{session['upload_id']}", headers=auth_headers).json()
+    assert status["state"] == "completed"
+    assert status["result"]["sequence_type"] == "DNA"
+
+
+def test_failed_finalization_is_reported(client, auth_headers, upload_store):
+    """Test parse failures mark the session as failed."""
+    content = b"not a fasta file\n"
+    session = _create(client, auth_headers, content)
+    _put_chunk(client, auth_headers, session["upload_id"], 0, content)
+    
+    response = client.post(f"/uploads/{session['upload_id']}/complete", headers=auth_headers)
+    
+    assert response.status_code == 400
+    status = client.get(f"/uploads/{session['upload_id']}", headers=auth_headers).json()
+    assert status["state"] == "failed"
+    assert status["error"]
+
+
+def test_delete_upload(client, auth_headers, upload_store):
+    """Test aborting an upload removes the session."""
+    session = _create(client, auth_headers, FASTA)
+    
+    assert client.delete(f"/uploads/{session['upload_id']}", headers=auth_headers).status_code == 204
+    assert client.get(f"/uploads/{session['upload_id']}", headers=auth_headers).status_code == 404
+
+
+def test_invalid_upload_id(client, auth_headers, upload_store):
+    """Test malformed upload IDs are treated as unknown."""
+    response = client.get("/uploads/..%2F..%2Fetc", headers=auth_headers)
+    
+    assert response.status_code == 404
@@ -25,13 +25,15 @@ const formatTimestamp = (timestamp) => {
  * @param {function} props.onViewDetails - Callback when "View Details" is clicked
  */
 const HistoryItem = ({ analysis, onViewDetails }) => {
-    // Get sequence preview (first 20 characters)
-    const sequencePreview = analysis.input_sequence
-        ? analysis.input_sequence.substring(0, 20) + (analysis.input_sequence.length > 20 ? '...' : '')
+    // Get sequence preview (first 20 characters); list rows carry it precomputed
+    const sequence = analysis.sequence_preview ?? analysis.input_sequence;
+    const sequenceLength = analysis.sequence_length ?? sequence?.length ?? 0;
+    const sequencePreview = sequence
+        ? sequence.substring(0, 20) + (sequenceLength > 20 ? '...' : '')
         : 'N/A';
 
-    // Get sequence type from results
-    const sequenceType = analysis.results?.sequence_type || 'Unknown';
+    // Get sequence type from the summary row, or from full results
+    const sequenceType = analysis.sequence_type || analysis.results?.sequence_type || 'Unknown';
 
     // Format timestamp
     const formattedTimestamp = formatTimestamp(analysis.created_at);
@@ -83,7 +85,10 @@ HistoryItem.propTypes = {
     analysis: PropTypes.shape({
         id: PropTypes.number.isRequired,
         user_id: PropTypes.number,
-        input_sequence: PropTypes.string.isRequired,
+        sequence_type: PropTypes.string,
+        sequence_length: PropTypes.number,
+        sequence_preview: PropTypes.string,
+        input_sequence: PropTypes.string,
         results: PropTypes.object,
         created_at: PropTypes.string.isRequired
     }).isRequired,
@@ -1,6 +1,7 @@
 import { useState } from 'react';
 import PropTypes from 'prop-types';
 import useHistory from '../../hooks/useHistory';
+import { getAnalysis } from '../../services/api';
 import HistoryItem from './HistoryItem';
 import LoadingSpinner from '../common/LoadingSpinner';
 import ResultsDisplay from '../dashboard/ResultsDisplay';
@@ -24,14 +25,22 @@ const HistoryList = () => {
   } = useHistory(20); // 20 items per page
 
   const [selectedAnalysis, setSelectedAnalysis] = useState(null);
+  const [detailsError, setDetailsError] = useState(null);
 
   /**
    * Handle viewing details of an analysis
+   * List rows are summaries, so the full results are fetched on demand
    */
-  const handleViewDetails = (analysis) => {
-    setSelectedAnalysis(analysis);
-    // Scroll to top to show results
-    window.scrollTo({ top: 0, behavior: 'smooth' });
+  const handleViewDetails = async (analysis) => {
+    setDetailsError(null);
+    try {
+      const fullAnalysis = analysis.results ? analysis : await getAnalysis(analysis.id);
+      setSelectedAnalysis(fullAnalysis);
+      // Scroll to top to show results
+      window.scrollTo({ top: 0, behavior: 'smooth' });
+    } catch (err) {
+      setDetailsError(err.message || 'Unable to load analysis');
+    }
   };
 
   /**
@@ -101,6 +110,13 @@ const HistoryList = () => {
 
   return (
     <div className="space-y-4 sm:space-y-6">
+      {/* Details Error */}
+      {detailsError && (
+        <div className="bg-red-50 border border-red-200 rounded-lg p-4 text-center">
+          <p className="text-red-600">{detailsError}</p>
+        </div>
+      )}
+
       {/* Selected Analysis Details */}
       {selectedAnalysis && (
         <div className="bg-blue-50 border-2 border-blue-200 rounded-lg p-4 sm:p-6">
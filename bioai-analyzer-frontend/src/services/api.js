@@ -122,8 +122,27 @@ export const getHistory = async () => {
   }
 };
 
+/**
+ * Get a single analysis with its full sequence and results
+ * @param {number} id - Analysis ID
+ * @returns {Promise<Object>} Analysis record
+ */
+export const getAnalysis = async (id) => {
+  try {
+    const response = await apiClient.get(`/history/${id}`);
+    return response.data;
+  } catch (error) {
+    const message = error.response?.data?.message || 
+                   error.response?.data?.detail || 
+                   error.message || 
+                   'Unable to load analysis';
+    throw new Error(message);
+  }
+};
+
 export default {
   analyzeSequence,
   uploadFile,
-  getHistory
+  getHistory,
+  getAnalysis
 };